@@ -0,0 +1 @@
+"""Page engines shared by the per-cohort dashboard pages."""
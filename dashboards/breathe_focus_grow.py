@@ -0,0 +1,156 @@
+import pandas as pd
+import streamlit as st
+
+from dashboards.layout import cohort_name, coming_soon, header, setup_page
+from dashboards.widgets import comments, comparison_bars
+from utils.comparison import chart_rows, compare_cohorts, scores_long
+from utils.program import PHASES, PROGRAMS, load_program_views
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+#Etiquetas de los campos generales (general_fields de cada fase, en este orden)
+GENERAL_LABELS = [
+    "Overall experience",
+    "Wellbeing dynamics",
+    "Information and coordination"
+]
+
+#Campos de comentarios de cada fase: (campo, título, título de cada respuesta)
+COMMENT_FIELDS = {
+    "Breathe": [
+        ("Breathe | Comments", "Comentarios", "Comment from"),
+        ("Breathe | Improvement ideas", "Improvement ideas", "Improvement idea from"),
+    ],
+    "Focus": [
+        ("Focus | Comments", "Comentarios", "Comment from"),
+        ("Focus | Improvement ideas", "Improvement ideas", "Improvement idea from"),
+        ("Focus | Top 3 1:1's", "Top 3 1:1's", "Top 3 1:1's from"),
+    ],
+    "Grow": [
+        ("Grow | Comments", "Comentarios", "Comment from"),
+        ("Grow | Improvement Ideas", "Improvement ideas", "Improvement idea from"),
+    ],
+}
+
+
+# =============================================================================
+# MÉTRICAS
+# =============================================================================
+
+def agenda_fields(agenda: dict) -> list[str]:
+    """Todos los campos de la agenda de una cohorte: eventos de cada fase y campos generales"""
+    events = [field for categories in agenda["fields"].values() for fields in categories.values() for field in fields]
+    general = [field for fields in agenda.get("general_fields", {}).values() for field in fields]
+    return list(dict.fromkeys(events + general))
+
+
+def general_means(stats: pd.DataFrame, general_fields: dict[str, list[str]],
+                  program: str) -> tuple[dict[str, list[float]], list[float]]:
+    """
+    Satisfaction, wellbeing y organization de cada fase y su media entre fases.
+
+    Args:
+        stats: Comparación de las cohortes (utils.comparison.compare_cohorts)
+        general_fields: Campos generales de cada fase
+        program: Cohorte actual
+
+    Returns:
+        Tupla (medias por fase, medias del programa), redondeadas a 2 decimales
+    """
+    means = stats["mean"]
+    per_phase = {
+        phase: [round(float(means.get((field, program), float("nan"))), 2) for field in fields]
+        for phase, fields in general_fields.items()
+    }
+    overall = [
+        round(sum(means[i] for means in per_phase.values()) / len(per_phase), 2)
+        for i in range(len(GENERAL_LABELS))
+    ]
+    return per_phase, overall
+
+
+def category_bars(stats: pd.DataFrame, fields: list[str], labels: list[str], title: str, cohorts: list[str]) -> None:
+    """Barras de los eventos de una categoría frente a la cohorte de comparación"""
+    comparison_bars(chart_rows(stats, fields, labels, cohorts), title=title, range_min=1, legend_title="Programa")
+
+
+# =============================================================================
+# SECCIONES
+# =============================================================================
+
+def phase_section(df: pd.DataFrame, stats: pd.DataFrame, phase: str, cohorts: list[str],
+                  means: tuple[dict[str, list[float]], list[float]] | None) -> None:
+    """Métricas generales, barras por categoría, resumen y comentarios de una fase ("General" junta las tres)"""
+    agenda = PROGRAMS[cohorts[0]]["agenda"]
+    st.markdown(body=f"<h1 style='text-align: center;'>{phase}</h1>", unsafe_allow_html=True)
+
+    #satisfaction, wellbeing y organization
+    if means is not None:
+        per_phase, overall = means
+        cols = st.columns(len(GENERAL_LABELS))
+        for i, label in enumerate(GENERAL_LABELS):
+            with cols[i]:
+                if phase == "General":
+                    st.metric(value=overall[i], label=label)
+                elif phase in per_phase:
+                    st.metric(value=per_phase[phase][i], label=label, delta=round(per_phase[phase][i] - overall[i], 2))
+
+    title = "All" if phase == "General" else phase
+    for category, fields in agenda["fields"].get(phase, {}).items():
+        if fields:
+            category_bars(stats, fields, agenda["labels"][phase][category], f"{title}: {category}", cohorts)
+
+    summary = agenda.get("summaries", {}).get(phase)
+    if summary:
+        with st.expander(label="**Resumen de las ideas principales**"):
+            st.markdown(summary, unsafe_allow_html=True)
+
+    for field, comment_title, item_title in COMMENT_FIELDS.get(phase, []):
+        comments(df, field, f"{comment_title} de {phase}", item_title)
+
+
+# =============================================================================
+# PÁGINA
+# =============================================================================
+
+def render(location: str, year: str) -> None:
+    """
+    Página Breathe-Focus-Grow de una cohorte: valoración de cada evento del
+    programa por fase y categoría.
+
+    Args:
+        location: Localización del programa (p.ej. "Mexico")
+        year: Año del programa (p.ej. "2025")
+    """
+    program = cohort_name(location, year)
+    setup_page(f"{location} - Program - Agenda", year)
+
+    if program not in PROGRAMS:
+        coming_soon(program)
+        return
+
+    header(program, "Breathe - Focus - Grow")
+
+    past_program = PROGRAMS[program]["compare_to"]
+    frames, errors = load_program_views([program] + ([past_program] if past_program else []))
+    if program in errors:
+        st.warning(f"No se pudieron cargar los datos del programa actual (Error: {errors[program]})")
+    if past_program in errors:
+        st.warning(f"No se pudieron cargar los datos del programa pasado (Error: {errors[past_program]})")
+
+    # Medias y respuestas de todos los campos de la agenda y de las dos cohortes en un solo groupby
+    agenda = PROGRAMS[program]["agenda"]
+    cohorts = [program] + ([past_program] if past_program else [])
+    stats = compare_cohorts(scores_long(frames, agenda_fields(agenda)), cohorts)
+
+    general_fields = agenda.get("general_fields")
+    means = general_means(stats, general_fields, program) if general_fields else None
+
+    st.markdown(body="Here you will find the average score for each event in the program, divided by Talks, Well-being and Networking:\n1. General: all events per category\n2. Breathe - Focus - Grow: all events too, but also divided by the phases")
+
+    for i, phase in enumerate(["General"] + PHASES):
+        if i > 0:
+            st.markdown(body="---")
+        phase_section(frames[program], stats, phase, cohorts, means)
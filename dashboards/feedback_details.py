@@ -0,0 +1,614 @@
+import logging
+import math
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from dashboards.layout import cohort_name, coming_soon, header, setup_page
+from utils.airtable import CACHE_TTL, load_views
+from utils.cohorts import (AIRTABLE_SECTION, COHORTS, TABLE_KEY_DD, TABLE_KEY_EM, TABLE_KEY_OLBI,
+                           SCHEMAS, canonical_founders)
+from utils.founders import founder_index, founder_key, founder_rows
+from utils.metrics import cohort_frames, cohort_metrics
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+RISK_REWARD_KEYS = ["risk_scores", "risk_flags", "risk_exp", "reward_scores", "reward_flags", "reward_exp"]
+
+# Campos del Human DD de cada founder: (campo, etiqueta)
+OLBI_FIELDS = [
+    ("BRS_Calculation", "BRS"),
+    ("GRIT_Calculation", "GRIT"),
+    ("OLBI_Exhaustion_Descriptor", "OLBI Exhaustion"),
+    ("OLBI_Disengagement_Descriptor", "OLBI Disengagement"),
+]
+
+WARM_UP_THREADS = 4   # hilos para precalcular los bloques de todas las startups
+
+logger = logging.getLogger(__name__)
+
+COLOR_ALL = 'rgb(255, 185, 80)'
+COLOR_STARTUP = 'rgb(47, 208, 239)'
+FILL_STARTUP = 'rgba(47, 208, 239, 0.4)'
+
+
+# =============================================================================
+# DATOS
+# =============================================================================
+
+def load_feedback(program: str) -> tuple[pd.DataFrame, pd.DataFrame, dict, tuple, dict[str, Exception]]:
+    """
+    Carga y limpia el feedback de una cohorte: EM's y Human DD.
+
+    Las vistas de EM's y del equipo son las mismas que usan Risk-Reward y
+    Outliers, así que comparten descarga, limpieza (cohort_frames) y
+    métricas materializadas (cohort_metrics): las matrices startup × campo
+    y founder × campo de las gráficas salen de ahí.
+
+    Returns:
+        Tupla (df_em, df_olbi, métricas, versiones, errores). versiones es
+        la data_version de cada vista (EM's, equipo, Human DD).
+    """
+    frames, errors = load_views(AIRTABLE_SECTION, {
+        "team": (TABLE_KEY_DD, program),
+        "em": (TABLE_KEY_EM, program),
+        "olbi": (TABLE_KEY_OLBI, program),
+    }, schemas=SCHEMAS)
+
+    metrics = cohort_metrics(program, frames["em"], frames["team"])
+    df_em, _ = cohort_frames(program, frames["em"], frames["team"])
+    df_olbi = frames["olbi"]
+    if "Founder--Select" in df_olbi.columns:
+        df_olbi["Founder--Select"] = canonical_founders(df_olbi["Founder--Select"], program)
+    versions = tuple(frames[name].attrs.get("data_version") for name in ("em", "team", "olbi"))
+    return df_em, df_olbi, metrics, versions, errors
+
+
+def prepare_feedback(df_em: pd.DataFrame, fields: dict[str, list[str]]) -> pd.DataFrame:
+    """
+    Deja el feedback de los EM's listo para mostrarlo: crea vacíos los campos
+    que no existen y las puntuaciones de risk/reward a 0 pasan a NaN (sin
+    rellenar).
+    """
+    for key in RISK_REWARD_KEYS:
+        for col in fields[key]:
+            if col not in df_em.columns:
+                df_em[col] = np.nan
+
+    for col in ["Startup", "EM_Name"]:
+        if col not in df_em.columns:
+            df_em[col] = np.nan
+
+    scores = fields["risk_scores"] + fields["reward_scores"]
+    df_em[scores] = df_em[scores].replace(0, np.nan)
+    return df_em
+
+
+def startup_means(means: pd.DataFrame, startup: str, fields: list[str]) -> list[float]:
+    """Fila de la startup en la matriz startup × campo (NaN si no tiene feedback)"""
+    return means.reindex(index=[startup], columns=fields).iloc[0].tolist()
+
+
+def total_means(totals: pd.Series, fields: list[str]) -> list[float]:
+    """Medias de toda la cohorte de los campos, en el orden de `fields`"""
+    return totals.reindex(fields).tolist()
+
+
+# =============================================================================
+# GRÁFICAS
+# =============================================================================
+
+def spider_figure(values: list[float], values_total: list[float], labels: list[str], name: str = "Startup",
+                  title: str | None = None, size: int | None = 375) -> go.Figure:
+    """Gráfico de araña de la startup/founder frente a toda la cohorte (se cierra el polígono)"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatterpolar(
+        name="All",
+        r=values_total + values_total[:1],
+        theta=labels + labels[:1],
+        line=dict(color=COLOR_ALL)
+    ))
+
+    fig.add_trace(go.Scatterpolar(
+        name=name,
+        r=values + values[:1],
+        theta=labels + labels[:1],
+        fill='toself',
+        fillcolor=FILL_STARTUP,
+        line=dict(color=COLOR_STARTUP)
+    ))
+
+    layout = dict(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 4]
+            ))
+    )
+    if size is not None:
+        layout.update(height=size, width=size)
+    if title is not None:
+        layout.update(title=title)
+    fig.update_layout(**layout)
+    return fig
+
+
+def workstations_figure(values: list[float], values_total: list[float], labels: list[str]) -> go.Figure:
+    """Barras de workstations de la startup frente a toda la cohorte"""
+    fig = go.Figure()
+
+    fig.add_trace(trace=go.Bar(
+        x=labels,
+        y=values,
+        name='Startup',
+        marker=dict(
+            color='rgba(47, 208, 239, 0.6)',
+            line=dict(
+                color=COLOR_STARTUP,
+                width=2
+            )
+        )
+    ))
+
+    fig.add_trace(trace=go.Bar(
+        x=labels,
+        y=values_total,
+        name='All',
+        marker=dict(
+            color='rgba(255, 185, 80, 0.6)',
+            line=dict(
+                color=COLOR_ALL,
+                width=2
+            )
+        )
+    ))
+
+    fig.update_layout(
+        title='Workstations',
+        width=375,
+        height=375
+    )
+    return fig
+
+
+def _metric(label: str, value: float, total: float) -> tuple[str, float, float]:
+    """Métrica (etiqueta, valor, diferencia con toda la cohorte) redondeada a 2 decimales"""
+    return label, round(value, 2), round(value - total, 2)
+
+
+# =============================================================================
+# BLOQUES POR STARTUP
+# =============================================================================
+
+def build_startup_blocks(program: str, startup: str, metrics: dict, df_olbi: pd.DataFrame,
+                         olbi_index: dict[str, pd.Index]) -> dict:
+    """
+    Todo lo que se muestra de una startup salvo el feedback de cada EM.
+
+    Args:
+        program: Cohorte (registro de cohortes)
+        startup: Startup del roster de la cohorte
+        metrics: Métricas de la cohorte (cohort_metrics)
+        df_olbi: Formularios de Human DD ya limpios
+        olbi_index: Índice de founders de df_olbi
+
+    Returns:
+        Diccionario con "business" (risk, reward, workstations), "team",
+        "founders" y "olbi". Las figuras van como especificación de Plotly
+        (dict) y las métricas como (etiqueta, valor, delta).
+    """
+    cohort = COHORTS[program]
+    fields, labels = cohort["fields"], cohort["labels"]
+    means, totals = metrics["field_means"], metrics["field_totals"]
+
+    business = []
+    for kind, title in (("risk", "Risk metrics"), ("reward", "Reward metrics")):
+        values = startup_means(means, startup, fields[f"{kind}_scores"])
+        values_total = total_means(totals, fields[f"{kind}_scores"])
+        business.append({
+            "figure": spider_figure(values, values_total, labels[kind], title=title).to_dict(),
+            "metric": _metric("mean", statistics.mean(values), statistics.mean(values_total)),
+        })
+
+    values = startup_means(means, startup, fields["workstations"])
+    values_total = total_means(totals, fields["workstations"])
+    business.append({
+        "figure": workstations_figure(values, values_total, labels["workstations"]).to_dict(),
+        "metric": _metric("mean", statistics.mean(values), statistics.mean(values_total)),
+    })
+
+    values = startup_means(means, startup, fields["team"])
+    values_total = total_means(totals, fields["team"])
+    team = {
+        "figure": spider_figure(values, values_total, labels["team"], size=None).to_dict(),
+        "metric": _metric("Team mean", statistics.mean(values), statistics.mean(values_total)),
+    }
+
+    # Filas de los founders en la matriz founder × campo (NaN si no tienen feedback)
+    startup_founders = cohort["roster"][startup]
+    values_total = total_means(totals, fields["individual"])
+    all_individual_mean = statistics.mean([numero for numero in values_total if not math.isnan(numero)])
+    rows = metrics["founder_means"].reindex([founder_key(founder) for founder in startup_founders])
+    rows[["bonus_stars", "red_flags"]] = rows[["bonus_stars", "red_flags"]].fillna(0)
+
+    founders = []
+    for founder, (_, row) in zip(startup_founders, rows.iterrows()):
+        values = row.reindex(fields["individual"]).tolist()
+        numbers = [numero for numero in values if not math.isnan(numero)]
+        founder_mean = statistics.mean(numbers) if numbers else 0
+        founders.append({
+            "figure": spider_figure(values, values_total, labels["individual"],
+                                    name='Founder', title=f'Individual feedback for {founder}').to_dict(),
+            "metric": _metric("Individual mean", founder_mean, all_individual_mean),
+            "bonus_stars": int(row["bonus_stars"]),
+            "red_flags": int(row["red_flags"]),
+        })
+
+    olbi = []
+    for founder in startup_founders:
+        df_olbi_founder = founder_rows(df_olbi, olbi_index, founder)
+        if not df_olbi_founder.empty:
+            first = df_olbi_founder.iloc[0]
+            olbi.append({"founder": founder, "values": [(label, first.get(field)) for field, label in OLBI_FIELDS]})
+
+    return {"business": business, "team": team, "founders": founders, "olbi": olbi}
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=256)
+def _cached_startup_blocks(_metrics: dict, _df_olbi: pd.DataFrame, _olbi_index: dict[str, pd.Index], program: str,
+                           startup: str, data_version: tuple[str, str, str]) -> dict:
+    """build_startup_blocks cacheado por startup y versión de los datos"""
+    return build_startup_blocks(program, startup, _metrics, _df_olbi, _olbi_index)
+
+
+def startup_blocks(program: str, startup: str, metrics: dict, df_olbi: pd.DataFrame, olbi_index: dict[str, pd.Index],
+                   versions: tuple) -> dict:
+    """Bloques de una startup, una vez por refresco (sin versión se calculan directamente)"""
+    if None in versions:
+        return build_startup_blocks(program, startup, metrics, df_olbi, olbi_index)
+    return _cached_startup_blocks(metrics, df_olbi, olbi_index, program, startup, versions)
+
+
+# Un estado por programa: versión precalculada, cuándo y si hay un precálculo en marcha
+_warm_state: dict[str, dict] = {}
+_warm_lock = threading.Lock()
+
+
+def _session_alive(ctx) -> bool:
+    """Si la sesión que lanzó el precálculo sigue abierta (y se puede reutilizar su contexto)"""
+    if ctx is None:
+        return False
+    return not Runtime.exists() or Runtime.instance().is_active_session(ctx.session_id)
+
+
+def warm_up(program: str, metrics: dict, df_olbi: pd.DataFrame, olbi_index: dict[str, pd.Index], versions: tuple) -> None:
+    """
+    Precalcula en segundo plano los bloques de todas las startups de la
+    cohorte, para que cambiar de startup en el selector lea del cache.
+
+    Se lanza una vez por versión de los datos (y de nuevo cuando el cache
+    ha podido caducar) y nunca hay dos a la vez para el mismo programa; la
+    página no espera a que termine. Si la sesión que lo lanzó se cierra,
+    se abandona.
+    """
+    if None in versions:
+        return
+
+    with _warm_lock:
+        state = _warm_state.get(program)
+        if state is not None and (state["running"] or
+                                  (state["versions"] == versions and time.time() - state["started_at"] < CACHE_TTL)):
+            return
+        # Se reemplaza el estado anterior, así solo se guarda la última versión de cada programa
+        _warm_state[program] = {"versions": versions, "started_at": time.time(), "running": True}
+
+    ctx = get_script_run_ctx()
+
+    def attach_ctx() -> None:
+        # Así los hilos comparten el contexto de la sesión y el cache no avisa
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+    def warm(startup: str) -> None:
+        if not _session_alive(ctx):
+            return
+        try:
+            startup_blocks(program, startup, metrics, df_olbi, olbi_index, versions)
+        except Exception as e:
+            logger.warning("No se pudieron precalcular los bloques de '%s': %s", startup, e)
+
+    def worker() -> None:
+        try:
+            attach_ctx()
+            with ThreadPoolExecutor(max_workers=WARM_UP_THREADS, initializer=attach_ctx) as executor:
+                list(executor.map(warm, COHORTS[program]["roster"]))
+        finally:
+            with _warm_lock:
+                _warm_state[program]["running"] = False
+
+    threading.Thread(target=worker, name=f"warm-up-{program}", daemon=True).start()
+
+
+# =============================================================================
+# SECCIONES
+# =============================================================================
+
+def _badge(text: str) -> None:
+    st.markdown(
+    f"""
+        <span style='
+            background-color:#1fd0ef;
+            color:white;
+            padding:6px 12px;
+            border-radius:20px;
+            font-weight:600;
+            font-size:14px;
+        '>
+        {text}
+        </span>
+        """,
+        unsafe_allow_html=True
+    )
+
+
+def _mean_metric(metric: tuple[str, float, float]) -> None:
+    label, value, delta = metric
+    st.metric(label=label, value=value, delta=delta)
+
+
+def _em_feedback(df_em_startup_em: pd.DataFrame, fields: list[str], flags: list[str], explanations: list[str],
+                 labels: list[str]) -> None:
+    """Puntuación, flag y explicación de un EM para cada campo de risk o reward"""
+    for i, field in enumerate(fields):
+        if not df_em_startup_em[flags[i]].empty:
+            flag = df_em_startup_em[flags[i]].item()
+        else:
+            flag = np.nan
+
+        if flag == "🟢 Green flag":
+            color = "green"
+        elif flag == "🔴 Red flag":
+            color = "red"
+        else:
+            color = "orange"
+
+        if not df_em_startup_em[explanations[i]].empty:
+            explanation = df_em_startup_em[explanations[i]].item()
+        else:
+            explanation = np.nan
+
+        st.markdown(f"""
+        <p style="color: {color};">{labels[i]}<span style="color: black;">{[df_em_startup_em[field].item() if not df_em_startup_em[field].empty else ""]}</span>:
+        <span style="color: black;">{explanation}</span></p>
+        """, unsafe_allow_html=True)
+
+
+def business_metrics(blocks: list[dict], df_em_startup: pd.DataFrame, fields: dict[str, list[str]],
+                     labels: dict[str, list[str]]) -> None:
+    """Risk, reward y workstations de la startup, y el feedback de cada EM"""
+    with st.container(border=True):
+        st.markdown("""
+        <h5>Business Metrics</h5>
+        """,
+        unsafe_allow_html=True)
+
+        cols = st.columns(3)
+        for col, block in zip(cols, blocks):
+            with col:
+                st.plotly_chart(block["figure"])
+
+                cols_2 = st.columns(3)
+                with cols_2[1]:
+                    _mean_metric(block["metric"])
+
+        if not df_em_startup["EM_Name"].empty:
+            em_list = ["---"] + df_em_startup["EM_Name"].tolist()
+        else:
+            em_list = ["---"]
+        experience_maker = st.selectbox("Experience Maker Feedback", em_list, index=0)
+
+        if experience_maker != "---":
+            df_em_startup_em = df_em_startup[df_em_startup["EM_Name"] == experience_maker]
+
+            _badge("Risk")
+            _em_feedback(df_em_startup_em, fields["risk_scores"], fields["risk_flags"], fields["risk_exp"], labels["risk"])
+
+            _badge("Reward")
+            _em_feedback(df_em_startup_em, fields["reward_scores"], fields["reward_flags"], fields["reward_exp"], labels["reward"])
+
+
+def team_dd(block: dict, startup: str) -> None:
+    """Gráfico de araña del feedback de equipo de la startup"""
+    with st.container(border=True):
+        st.markdown(f"<h5>Team DD for {startup}</h5>", unsafe_allow_html=True)
+        st.plotly_chart(block["figure"], use_container_width=True)
+
+        cols = st.columns(3)
+        with cols[1]:
+            _mean_metric(block["metric"])
+
+
+def individual_dd(blocks: list[dict]) -> None:
+    """Gráfico de araña, media, bonus stars y red flags de cada founder"""
+    with st.container(border=True):
+        cols = st.columns(len(blocks))
+
+        for col, block in zip(cols, blocks):
+            with col:
+                st.plotly_chart(block["figure"])
+
+                subcols = st.columns(3)
+                with subcols[0]:
+                    _mean_metric(block["metric"])
+
+                with subcols[1]:
+                    st.metric(label="Bonus Stars", value=block["bonus_stars"])
+
+                with subcols[2]:
+                    st.metric(label="Red Flags", value=block["red_flags"])
+
+
+def human_dd(blocks: list[dict]) -> None:
+    """Resultados de los formularios de Human DD (BRS, GRIT y OLBI) de cada founder"""
+    if not blocks:
+        return
+
+    with st.container(border=True):
+        st.markdown("<h5>Human DD Forms</h5>", unsafe_allow_html=True)
+
+        for block in blocks:
+            st.markdown(f"{block['founder']}")
+
+            boxes = "".join(f"""
+                <div class="metric-box">
+                    <div class="metric-label">{label}</div>
+                    <div class="metric-value">{value}</div>
+                </div>""" for label, value in block["values"])
+
+            st.markdown(f"""
+            <style>
+            /* Contenedor principal para la fila de métricas */
+            .metric-row {{
+                display: flex;
+                justify-content: space-between;
+                gap: 15px; /* Espacio entre las cajas */
+            }}
+
+            /* Estilo para la etiqueta (el título de la métrica) */
+            .metric-label {{
+                font-size: 16px;
+                color: #555;
+                margin-bottom: 5px;
+            }}
+
+            /* Estilo para el valor (el número o texto principal) */
+            .metric-value {{
+                font-size: 20px; /* <-- ¡CAMBIA ESTE VALOR PARA AJUSTAR EL TAMAÑO! */
+                font-weight: bold;
+                color: #1E293B;
+            }}
+            </style>
+
+            <div class="metric-row">{boxes}
+            </div>
+            """, unsafe_allow_html=True)
+
+
+# =============================================================================
+# PÁGINA
+# =============================================================================
+
+def _page_styles() -> None:
+    # Contenedores con borde y métricas centradas
+    st.markdown("""
+    <style>
+        div[data-testid="stVerticalBlock"] div[data-testid="stVerticalBlock"] div.st-emotion-cache-1jicfl2 {
+            background-color: #d8dbdb;
+            border-radius: 10px;
+            padding: 20px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+            border: 2px solid black;
+        }
+        div[data-testid="stMetric"] {
+            align-self: center;
+        }
+        div[data-testid="stMetricLabel"] {
+            text-align: center;
+        }
+        div[data-testid="stMetricValue"] {
+            justify-content: center;
+        }
+        div[data-testid="stMetricDelta"] {
+            justify-content: center;
+        }
+    </style>
+    """, unsafe_allow_html=True)
+
+
+def render(location: str, year: str) -> None:
+    """
+    Página de feedback por startup (business, team, individual y Human DD)
+    de una cohorte.
+
+    Args:
+        location: Localización del programa (p.ej. "Mexico")
+        year: Año del programa (p.ej. "2025")
+    """
+    program = cohort_name(location, year)
+    setup_page(f"{location} - Investment - Per Startup", year)
+    _page_styles()
+
+    cohort = COHORTS.get(program)
+    if cohort is None:
+        coming_soon(program)
+        return
+
+    header("Program Feedback", cohort["title"])
+
+    df_em, df_olbi, metrics, versions, errors = load_feedback(program)
+    if errors:
+        st.error(f"Error al cargar los datos de Airtable (Error: {next(iter(errors.values()))})")
+        st.stop()
+
+    fields = cohort["fields"]
+    labels = cohort["labels"]
+    startup_founders = cohort["roster"]
+    startups = list(startup_founders.keys())
+
+    df_em = prepare_feedback(df_em, fields)
+
+    # Índice de founders del Human DD (clave normalizada -> filas), una vez por carga
+    olbi_index = founder_index(df_olbi["Founder--Select"]) if "Founder--Select" in df_olbi.columns else {}
+
+    st.markdown("""
+    <h4>Here you will find an overview of the program feedback</h4>
+    """,
+    unsafe_allow_html=True)
+
+    # La startup elegida se guarda en la url para poder enlazarla
+    widget_key = f"startup_selector_state_{program}"
+
+    if widget_key not in st.session_state:
+        param_from_url = st.query_params.get("startup")
+
+        if param_from_url and param_from_url in startups:
+            st.session_state[widget_key] = param_from_url
+        else:
+            st.session_state[widget_key] = startups[0]
+
+    def update_state_and_url():
+        st.query_params["startup"] = st.session_state[widget_key]
+
+    startup = st.selectbox(
+        "Select a startup",
+        options=startups,
+        key=widget_key,
+        index=startups.index(st.session_state[widget_key]),
+        on_change=update_state_and_url
+    )
+
+    df_em_startup = df_em[df_em["Startup"] == startup]
+
+    df_startups = metrics["startups"]
+    logo_url = df_startups.at[startup, "logo_url"] if startup in df_startups.index else ""
+    if logo_url:
+        st.image(logo_url, width=250)
+
+    blocks = startup_blocks(program, startup, metrics, df_olbi, olbi_index, versions)
+    business_metrics(blocks["business"], df_em_startup, fields, labels)
+    team_dd(blocks["team"], startup)
+    individual_dd(blocks["founders"])
+    human_dd(blocks["olbi"])
+
+    # El resto de startups se preparan mientras se mira esta
+    warm_up(program, metrics, df_olbi, olbi_index, versions)
@@ -0,0 +1,171 @@
+import pandas as pd
+import streamlit as st
+
+from dashboards.layout import cohort_name, coming_soon, header, setup_page
+from dashboards.widgets import comments, comparison_bars
+from utils.comparison import chart_rows, compare_cohorts, scores_long
+from utils.nps import CONFIDENCE, nps_table, responses_long
+from utils.program import PROGRAMS, guests_of_type, load_program_views, rescale_scores
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+# Tipos de invitado: clave en config/program.toml, Guest_type, cabecera y nombre en los textos
+AUDIENCES = [
+    ("Founders", "Startup", "Founders", "founders"),
+    ("EMs", "EM", "EM's", "EMs"),
+    ("VCs", "VC", "VC's", "VCs"),
+]
+
+# NPS de cada tipo de invitado: (campo, etiqueta)
+NPS_FIELDS = {
+    "Founders": [
+        ("Recommendation to Startups", "NPS Startups to Startups"),
+    ],
+    "EMs": [
+        ("EM's Fb | Recommendation to EM", "NPS EM's to EM's"),
+        ("Recommendation to Startups", "NPS EM's to Startup"),
+    ],
+    "VCs": [
+        ("VC's | Recommendation to vc", "NPS VC's to VC's"),
+        ("Recommendation to Startups", "NPS VC's to Startups"),
+    ],
+}
+
+# Campos de texto de cada tipo de invitado: (campo, título)
+COMMENT_FIELDS = {
+    "Founders": [
+        ("Improvement ideas", "Improvement ideas"),
+        ("Most positive aspect", "Most positive aspect"),
+        ("Top 3 outcomes", "Top 3 outcomes"),
+    ],
+    "EMs": [
+        ("Comments", "Comments"),
+        ("Improvement ideas", "Improvement ideas"),
+        ("EM's Fb | Top3 1:1's", "Top3 1:1's"),
+    ],
+    "VCs": [
+        ("Comments", "Comments"),
+        ("Improvement ideas", "Improvement ideas"),
+        ("Investment Interest", "Investment interest"),
+    ],
+}
+
+
+# =============================================================================
+# DATOS
+# =============================================================================
+
+def load_guests(program: str, past_program: str | None) -> tuple[pd.DataFrame, pd.DataFrame, dict[str, Exception]]:
+    """
+    Respuestas de los invitados de la cohorte y de su cohorte de comparación,
+    con los campos de escala 0-10 ya pasados a 1-4 (según cada cohorte).
+
+    Returns:
+        Tupla (df, df_past, errores). Sin cohorte de comparación df_past
+        queda vacío.
+    """
+    frames, errors = load_program_views([program] + ([past_program] if past_program else []))
+
+    df = rescale_scores(frames[program], PROGRAMS[program]["guests"].get("rescale", []))
+    if past_program is None:
+        return df, pd.DataFrame(), errors
+
+    past_rescale = PROGRAMS.get(past_program, {}).get("guests", {}).get("rescale", [])
+    df_past = rescale_scores(frames[past_program], past_rescale)
+    return df, df_past, errors
+
+
+def program_nps(df: pd.DataFrame, program: str) -> pd.DataFrame:
+    """NPS de todas las preguntas de recomendación de todos los tipos de invitado de la cohorte (utils.nps)"""
+    questions = {audience: [field for field, _ in fields] for audience, fields in NPS_FIELDS.items()}
+    guest_types = {audience: guest_type for audience, guest_type, _, _ in AUDIENCES}
+    return nps_table(responses_long({program: df}, questions, guest_types))
+
+
+# =============================================================================
+# SECCIONES
+# =============================================================================
+
+def nps_metric(nps: pd.DataFrame, key: tuple[str, str, str], label: str) -> None:
+    """NPS de una pregunta, con el reparto de respuestas y su intervalo de confianza al pasar el ratón"""
+    if key not in nps.index:
+        st.metric(value="N/A", label=label)
+        return
+
+    row = nps.loc[key]
+    st.metric(
+        value=round(row["nps"], 2),
+        label=label,
+        help=f"{int(row['promoters'])} promoters, {int(row['passives'])} passives and {int(row['detractors'])} "
+             f"detractors out of {int(row['n'])} answers. {CONFIDENCE:.0%} CI: "
+             f"[{row['nps_low']:.1f}, {row['nps_high']:.1f}]"
+    )
+
+
+def audience_section(df: pd.DataFrame, df_past: pd.DataFrame, nps: pd.DataFrame, audience: str, guest_type: str,
+                     heading: str, name: str, program: str, past_program: str | None) -> None:
+    """NPS, barras frente a la cohorte de comparación, resumen y comentarios de un tipo de invitado"""
+    guests = PROGRAMS[program]["guests"]
+    df_guest = guests_of_type(df, guest_type)
+    df_guest_past = guests_of_type(df_past, guest_type)
+
+    st.markdown(body=f"<h1 style='text-align: center;'>{heading}</h1>", unsafe_allow_html=True)
+
+    nps_fields = NPS_FIELDS[audience]
+    cols = st.columns(len(nps_fields)) if len(nps_fields) > 1 else [st.container()]
+    for col, (field, label) in zip(cols, nps_fields):
+        with col:
+            nps_metric(nps, (program, audience, field), label)
+
+    fields = guests["fields"][audience]
+    cohorts = [program] + ([past_program] if past_program else [])
+    stats = compare_cohorts(scores_long(dict(zip(cohorts, [df_guest, df_guest_past])), fields), cohorts)
+    comparison_bars(chart_rows(stats, fields, guests["labels"][audience], cohorts), title=f"{heading} feedback")
+
+    summary = guests.get("summaries", {}).get(audience)
+    if summary:
+        with st.expander(label="**Resumen de las ideas principales**"):
+            st.markdown(summary, unsafe_allow_html=True)
+
+    for field, title in COMMENT_FIELDS[audience]:
+        comments(df_guest, field, f"{title} from {name}", f"{title} from")
+
+
+# =============================================================================
+# PÁGINA
+# =============================================================================
+
+def render(location: str, year: str) -> None:
+    """
+    Página Guests feedback de una cohorte (founders, EM's y VC's).
+
+    Args:
+        location: Localización del programa (p.ej. "Mexico")
+        year: Año del programa (p.ej. "2025")
+    """
+    program = cohort_name(location, year)
+    setup_page(f"{location} - Program - Guests Feedback", year)
+
+    if program not in PROGRAMS:
+        coming_soon(program)
+        return
+
+    header("Decelera Program", "Guests")
+
+    past_program = PROGRAMS[program]["compare_to"]
+    df, df_past, errors = load_guests(program, past_program)
+
+    if program in errors:
+        st.warning(f"No se pudieron cargar los datos de este año. (Error: {errors[program]})")
+    if past_program in errors:
+        st.warning(f"No se pudieron cargar los datos comparativos de {past_program}. Se mostrará solo el año actual. (Error: {errors[past_program]})")
+
+    st.markdown(body="Here you will find the feedback submitted by founders, experience makers and VC's about the program")
+
+    nps = program_nps(df, program)
+    for i, (audience, guest_type, heading, name) in enumerate(AUDIENCES):
+        if i > 0:
+            st.markdown(body="---")
+        audience_section(df, df_past, nps, audience, guest_type, heading, name, program, past_program)
@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import streamlit as st
+
+from utils.cohorts import COHORTS
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+LOGO_URL = "https://images.squarespace-cdn.com/content/v1/67811e8fe702fd5553c65249/c5500619-9712-4b9b-83ee-a697212735ae/Disen%CC%83o+sin+ti%CC%81tulo+%2840%29.png"
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# Localizaciones del sidebar, en el orden del registro de cohortes
+LOCATIONS = list(dict.fromkeys(cohort["location"] for cohort in COHORTS.values()))
+
+INDENT = "&nbsp;&nbsp;&nbsp;&nbsp;"
+
+
+# =============================================================================
+# PÁGINA
+# =============================================================================
+
+def setup_page(title: str, year: str) -> None:
+    """Configuración de la página, año seleccionado por defecto y navegación propia"""
+    st.set_page_config(
+        page_title=title,
+        page_icon=LOGO_URL,
+        layout="wide"
+    )
+
+    if "selected_year" not in st.session_state:
+        st.session_state.selected_year = year
+
+    # Hide default Streamlit navigation elements
+    st.markdown("""
+        <style>
+            [data-testid="stSidebarNav"] {
+                display: none;
+            }
+        </style>
+    """, unsafe_allow_html=True)
+
+    sidebar()
+
+
+def header(title: str, subtitle: str) -> None:
+    """Logo y título centrados de las páginas de cohorte"""
+    st.markdown(f"""
+    <style>
+    .outer-container {{
+        display: flex;
+        justify-content: center; /* Centra horizontalmente */
+        width: 100%; /* Ocupa todo el ancho disponible */
+    }}
+    .container {{
+        display: flex;
+        align-items: center;
+    }}
+    .logo-img {{
+        width: 80px;
+        height: 80px;
+        margin-right: 20px;
+    }}
+    .title-text {{
+        font-size: 2.5em; /* Tamaño del título */
+        font-weight: bold;
+    }}
+    </style>
+    <div class="outer-container">
+    <div class="container">
+        <img class="logo-img" src="{LOGO_URL}">
+        <h1 class="title-text">{title}<br>{subtitle}</h1>
+    </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# =============================================================================
+# SIDEBAR
+# =============================================================================
+
+def _page_button(label: str, key: str, page: str) -> None:
+    # Solo se enlazan las páginas que existen (no todas las cohortes tienen todas)
+    if not (APP_DIR / page).exists():
+        return
+    if st.button(label, key=key, use_container_width=True):
+        st.switch_page(page)
+
+
+def sidebar() -> None:
+    """Navegación jerárquica: Home, Fast-tracks y las páginas de cada localización"""
+    year = st.session_state.selected_year
+
+    with st.sidebar:
+        _page_button("🏠 Home", "home_btn", "Home.py")
+        _page_button("⚡ Fast-tracks", "fast_tracks_btn", "pages/Fast-tracks.py")
+
+        for location in LOCATIONS:
+            key = location.lower()
+            st.markdown("---")
+            st.markdown(f"#### {location}")
+            st.markdown(f"{INDENT}**{year}**")
+
+            _page_button("Outliers", f"{key}_outliers", f"pages/{location}_Outliers_{year}.py")
+
+            st.markdown(f"{INDENT * 2}**Investment**")
+            _page_button("Risk-Reward Matrix", f"{key}_inv_general", f"pages/{location}_Risk_Reward_{year}.py")
+            _page_button("Individual, Team and Business DD", f"{key}_inv_startup", f"pages/{location}_Feedback_Details_{year}.py")
+
+            st.markdown(f"{INDENT * 2}**Program**")
+            _page_button("Guests feedback", f"{key}_prog_general", f"pages/{location}_Guests_Feedback_{year}.py")
+            _page_button("Breathe-Focus-Grow", f"{key}_prog_agenda", f"pages/{location}_Breathe-Focus-Grow_{year}.py")
+
+
+def coming_soon(program: str) -> None:
+    """Aviso de las cohortes que todavía no tienen datos"""
+    st.markdown(body=f"""
+    <h1 style='text-align: center;'>Decelera {program}<br>Proximamente</h1>
+    """, unsafe_allow_html=True)
+
+
+def cohort_name(location: str, year: str) -> str:
+    """Nombre de la cohorte (y de sus vistas de Airtable): "Localizacion Año" """
+    return f"{location} {year}"
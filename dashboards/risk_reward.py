@@ -0,0 +1,129 @@
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+from dashboards.layout import cohort_name, coming_soon, header, setup_page
+from utils.cohorts import COHORTS
+from utils.metrics import load_cohort_metrics
+
+# =============================================================================
+# GRÁFICA
+# =============================================================================
+
+def risk_reward_figure(df_em_means: pd.DataFrame) -> go.Figure:
+    """Matriz risk-reward de las startups (risk ya invertido en la materialización)"""
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=df_em_means["risk_mean"],
+        y=df_em_means["reward_mean"],
+        customdata=df_em_means["num_feedback"],
+        hovertemplate="Feedback enviado: %{customdata}<br>Risk: %{x:.2f}<br>Reward: %{y:.2f}<extra></extra>",
+        mode='markers+text',
+        text=df_em_means["Startup"],
+        textposition="top center",
+        marker=dict(
+            size=10,
+            color=df_em_means["risk_mean"],
+            colorscale='RdYlGn_r',
+            showscale=False,
+            colorbar=dict(
+                title="Distance to (risk=0, reward=4)"
+            )
+        )
+    ))
+
+    fig.update_layout(
+        xaxis_title='Risk mean',
+        yaxis_title='Reward mean',
+        font=dict(
+            family="Arial, sans-serif",
+            size=10,
+            color="black"
+        ),
+        xaxis=dict(
+            showline=True,
+            linewidth=2,
+            linecolor='black',
+            gridcolor='lightgray',
+            range=[df_em_means["risk_mean"].min() - 0.1, df_em_means["risk_mean"].max() + 0.1]
+        ),
+        yaxis=dict(
+            showline=True,
+            linewidth=2,
+            linecolor='black',
+            gridcolor='lightgray',
+            range=[df_em_means["reward_mean"].min() - 0.2, df_em_means["reward_mean"].max() + 0.2]
+        )
+    )
+    return fig
+
+
+# =============================================================================
+# PÁGINA
+# =============================================================================
+
+def render(location: str, year: str) -> None:
+    """
+    Página Risk-Reward Matrix de una cohorte.
+
+    Lee el ranking ya materializado (utils.metrics), que comparten todas
+    las páginas y sesiones mientras los datos no cambian.
+
+    Args:
+        location: Localización del programa (p.ej. "Mexico")
+        year: Año del programa (p.ej. "2025")
+    """
+    program = cohort_name(location, year)
+    setup_page(f"{location} - Investment - General", year)
+
+    cohort = COHORTS.get(program)
+    if cohort is None:
+        coming_soon(program)
+        return
+
+    header("Program Feedback", cohort["title"])
+
+    st.markdown("""
+    <style>
+    h5 {
+    text-align: center;
+    }
+    </style>
+
+    <h5>Risk - Reward Matrix</h5>
+    """, unsafe_allow_html=True)
+
+    metrics, errors = load_cohort_metrics(program)
+    for e in errors.values():
+        st.warning(f"Error al cargar los datos de Airtable (Error: {e})")
+
+    # Ranking ya materializado: startups del roster con feedback, por Distance
+    df_em_ordered = metrics["ranking"]
+
+    if df_em_ordered.empty:
+        return
+
+    st.plotly_chart(risk_reward_figure(df_em_ordered))
+
+    st.markdown("""
+    <h4>Top Companies According to Risk-Reward Matrix</h4>
+    """, unsafe_allow_html=True)
+
+    for row in df_em_ordered.itertuples(index=False):
+        with st.container(border=True):
+
+            st.markdown(f"""
+                <div style="display: flex; align-items: left; margin-left: 0;">
+                    <img src={row.logo_url} width="50">
+                    <h4 style="margin-left: 10px; font-weight: bold; color: #333;"><a href="https://decelera-dashboards.streamlit.app/{location}_Feedback_Details_{st.session_state.selected_year}?startup={row.Startup}">{row.Startup}</a></h4>
+                </div>
+                """,
+                unsafe_allow_html=True)
+            cols = st.columns(3)
+            with cols[0]:
+                st.metric(label="Distance to (risk=0, reward=4)", value=round(row.Distance, 2))
+            with cols[1]:
+                st.metric(label="Individual Mean", value=round(row.individual_mean, 2), delta=round(row.individual_delta, 2))
+            with cols[2]:
+                st.metric(label="Team Mean", value=round(row.team_mean, 2), delta=round(row.team_delta, 2))
@@ -0,0 +1,104 @@
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+#Escala de color Decelera
+COLOR_SCALE = [
+    [0.0, '#FFB950'],
+    [0.5, '#FAF3DC'],
+    [1.0, '#1FD0EF']
+]
+
+
+# =============================================================================
+# GRÁFICAS
+# =============================================================================
+
+def comparison_bars(rows: pd.DataFrame, title: str, range_min: float = 0, legend_title: str = "Periodo") -> None:
+    """
+    Gráfico de barras de la cohorte frente a sus cohortes de comparación.
+
+    Args:
+        rows: Barras en formato largo con label, cohort, mean y n, ya
+            ordenadas (utils.comparison.chart_rows). La primera cohorte es
+            la actual; el resto solo se dibujan si tienen alguna media
+        title: Título de la gráfica
+        range_min: Inicio del eje y
+        legend_title: Título de la leyenda
+    """
+    fig = go.Figure()
+    cohorts = list(rows["cohort"].unique())
+
+    for i, cohort in enumerate(cohorts):
+        bars = rows[rows["cohort"] == cohort]
+        values = bars["mean"].tolist()
+
+        if i == 0:
+            #Programa actual (con escala de colores)
+            marker = dict(color=values, colorscale=COLOR_SCALE, line=dict(color='black', width=1.5))
+            text_color = 'black'
+        elif bars["mean"].notna().any():
+            #Programas de comparación (transparentes, que llamen menos la atención). Plotly ignora los NaN
+            marker = dict(color='rgba(0,0,0,0)', line=dict(color='darkgrey', width=1.5))
+            text_color = 'darkgrey'
+        else:
+            continue
+
+        fig.add_trace(go.Bar(
+            name=cohort,
+            x=bars["label"].tolist(),
+            y=values,
+            customdata=bars["n"].tolist(),
+            hovertemplate='Muestra: %{customdata}<extra></extra>',
+            texttemplate=[f'{y:.2f}' if pd.notna(y) else '' for y in values],
+            textposition='outside',
+            marker=marker,
+            textfont=dict(color=text_color)
+        ))
+
+    all_values = rows["mean"].dropna()
+    range_max = all_values.max() * 1.15 if not all_values.empty else 5
+
+    fig.update_layout(
+        title=title,
+        yaxis_title='Mean Score',
+        template="plotly_white",
+        barmode='group',
+        yaxis=dict(
+            range=[range_min, range_max]
+        ),
+        xaxis=dict(
+            tickfont=dict(color='black'),
+            tickangle=-45
+        ),
+        legend_title_text=legend_title,
+    )
+
+    st.plotly_chart(fig, use_container_width=True)
+
+
+# =============================================================================
+# COMENTARIOS
+# =============================================================================
+
+def comments(df: pd.DataFrame, field: str, title: str, item_title: str) -> None:
+    """
+    Expander con un expander por respuesta de texto de un campo.
+
+    Args:
+        df: Respuestas (con la columna Name)
+        field: Campo de texto
+        title: Título del expander
+        item_title: Título de cada respuesta, seguido del nombre
+    """
+    with st.expander(label=title):
+        if df.empty or field not in df.columns or "Name" not in df.columns:
+            return
+
+        for name, comment in df[["Name", field]].dropna(subset=[field]).itertuples(index=False):
+            with st.expander(label=f"{item_title} {name}"):
+                st.markdown(body=comment)
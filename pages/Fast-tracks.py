@@ -1,8 +1,12 @@
 import streamlit as st
 import pandas as pd
-from pyairtable import Api
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
+from utils.airtable import CACHE_TTL, sync_view
+from utils.deal_cards import CARD_SORT_OPTIONS, card_page, extract_card_fields, hot_deals, qualified_deals, search_and_sort
+from utils.dealflow import (cumulative_counts, find_funnel_columns, funnel_by_period, funnel_events, range_counts,
+                            week_references)
+from utils.regions import region_counts
 
 # Page configuration
 st.set_page_config(
@@ -167,27 +171,12 @@ with st.sidebar:
 # AIRTABLE DATA CONNECTION
 # =============================================================================
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
 def load_dealflow_data():
     """Load dealflow data from Airtable using a specific view"""
     try:
-        # Load configuration from Streamlit secrets
-        api_key = st.secrets["airtable_fast_tracks"]["api_key"]
-        base_id = st.secrets["airtable_fast_tracks"]["base_id"]
-        table_id = st.secrets["airtable_fast_tracks"]["table_id"]
+        # Only records modified since the last sync are fetched and merged by record id
         view_id = st.secrets["airtable_fast_tracks"]["view_id"]
-        
-        api = Api(api_key)
-        table = api.table(base_id, table_id)
-        
-        # Fetch records from the specific view
-        records = table.all(view=view_id)
-        
-        # Extract fields
-        data = [record['fields'] for record in records]
-        df = pd.DataFrame(data)
-        
-        return df
+        return sync_view("airtable_fast_tracks", "table_id", view_id)
     except Exception as e:
         st.error(f"Error loading data from Airtable: {e}")
         st.info("Make sure to configure the following in your .streamlit/secrets.toml:\n\n"
@@ -213,99 +202,317 @@ def get_current_week_range() -> tuple[datetime, datetime]:
     end_of_week = start_of_week + timedelta(days=6)
     return start_of_week, end_of_week
 
-def get_founder_full_name(row, startup_name):
-    """Combine founder name and surname"""
-    # List of possible name field patterns
-    name_patterns = [
-        "PH1_founder_name_$startup",
-        "PH1_founder_name",
-        f"PH1_founder_name_{startup_name}",
-        "founder_name"
-    ]
-    
-    # List of possible surname field patterns (note: sur_name vs surname)
-    surname_patterns = [
-        "PH1_founder_sur_name_$startup",
-        "PH1_founder_surname_$startup",
-        "PH1_founder_sur_name",
-        "PH1_founder_surname",
-        f"PH1_founder_sur_name_{startup_name}",
-        f"PH1_founder_surname_{startup_name}",
-        "founder_surname",
-        "founder_sur_name"
-    ]
-    
-    # Try to find name
-    first_name = ""
-    for pattern in name_patterns:
-        value = row.get(pattern, "")
-        if pd.notna(value) and str(value).strip():
-            first_name = str(value).strip()
-            break
-    
-    # Try to find surname
-    last_name = ""
-    for pattern in surname_patterns:
-        value = row.get(pattern, "")
-        if pd.notna(value) and str(value).strip():
-            last_name = str(value).strip()
-            break
-    
-    # Combine if we found at least one part
-    if first_name or last_name:
-        full_name = f"{first_name} {last_name}".strip()
-        return full_name if full_name else "N/A"
-    
-    return "N/A"
-
-def get_field_value(row, field_patterns, default="N/A"):
-    """Return the first non-empty value from multiple field name patterns."""
-    
-    for pattern in field_patterns:
-        if pattern not in row:
-            continue
-        
-        value = row[pattern]
-
-        # 1) Si es NaN (float), saltar
-        if isinstance(value, float) and pd.isna(value):
-            continue
-
-        # 2) Si es array de numpy → convertir a lista
-        if isinstance(value, (list, tuple)):
-            pass  # se gestiona abajo
-        elif hasattr(value, "__array__"):  # numpy array
-            value = value.tolist()
-
-        # 3) Si es lista (Airtable multiselect o attachments)
-        if isinstance(value, list):
-            if len(value) == 0:
-                continue
-
-            first = value[0]
-
-            # 3.1 Caso attachment (dict con url y filename)
-            if isinstance(first, dict):
-                if "url" in first:
-                    return first["url"]
-                if "filename" in first:
-                    return first["filename"]
-                # fallback
-                return str(first)
-
-            # 3.2 Caso multiselect simple
-            first_str = str(first).strip()
-            if first_str and first_str.lower() != "nan":
-                return first_str
-            continue
-
-        # 4) Valor escalar válido
-        value_str = str(value).strip()
-        if value_str and value_str.lower() != "nan":
-            return value_str
-
-    return default
-
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=8)
+def _cached_funnel_counts(_funnel_df: pd.DataFrame, funnel_columns: dict, data_version: str) -> pd.DataFrame:
+    return cumulative_counts(funnel_events(_funnel_df, funnel_columns))
+
+def load_funnel_counts(funnel_df: pd.DataFrame, funnel_columns: dict) -> pd.DataFrame:
+    """Precompute cumulative daily funnel counts (the only pass over the dealflow rows), once per data refresh"""
+    data_version = funnel_df.attrs.get("data_version")
+    if data_version is None:
+        return cumulative_counts(funnel_events(funnel_df, funnel_columns))
+    return _cached_funnel_counts(funnel_df, funnel_columns, data_version)
+
+def period_label(period_start: pd.Timestamp, granularity: str, today: pd.Timestamp) -> str:
+    """Label for a funnel table row, marking the period that contains today"""
+    if granularity == "D":
+        label, is_current = period_start.strftime("%a %d %b %Y"), period_start == today
+    elif granularity == "M":
+        label, is_current = period_start.strftime("%B %Y"), (period_start.year, period_start.month) == (today.year, today.month)
+    else:
+        label = f"Week {period_start.isocalendar()[1]}"
+        is_current = period_start <= today < period_start + pd.Timedelta(days=7)
+    return f"📍 {label} (Current)" if is_current else label
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=8)
+def _cached_deal_cards(_df: pd.DataFrame, data_version: str) -> pd.DataFrame:
+    return extract_card_fields(_df)
+
+def load_deal_cards(df: pd.DataFrame) -> pd.DataFrame:
+    """Card fields for every deal, resolved and extracted once per data refresh"""
+    data_version = df.attrs.get("data_version")
+    if data_version is None:
+        return extract_card_fields(df)
+    return _cached_deal_cards(df, data_version)
+
+
+def render_deal_card(card: dict):
+    """Render one deal card (Hot Deals, Qualified Startups) from a row of the deal card table"""
+    startup_name = card["startup_name"]
+    founder_name = card["founder_name"]
+    one_liner = card["one_liner"]
+    business_model = card["business_model"]
+    location = card["location"]
+    stage = card["stage"]
+    reference = card["reference"]
+    reference_details = card["reference_details"]
+    signals_list = card["signals"]
+    red_flags_list = card["red_flags"] or ["N/A"]
+    green_flags_list = card["green_flags"] or ["N/A"]
+
+    # Create card with main info
+    with st.container(border=True):
+        st.markdown(f"### {startup_name}")
+
+        # Show founder name above one liner
+        if founder_name and founder_name != "N/A":
+            st.markdown(f"**👤 {founder_name}**")
+
+        # Show one liner if available
+        if one_liner and one_liner != "N/A":
+            st.markdown(f"*{one_liner}*")
+
+        # Expandable details section - ALL OTHER info goes here
+        with st.expander("📊 View Full Details"):
+
+            # Show stage
+            if (stage and stage != "N/A"):
+                st.markdown(f"**🚀 Stage**  \n{stage}")
+
+            # Show business model and location
+            if (business_model and business_model != "N/A") or (location and location != "N/A"):
+                info_col1, info_col2 = st.columns(2)
+                with info_col1:
+                    if business_model and business_model != "N/A":
+                        st.markdown(f"**💼 Business Model**  \n{business_model}")
+                with info_col2:
+                    if location and location != "N/A":
+                        st.markdown(f"**📍 Location**  \n{location}")
+                st.markdown("")
+
+            # Financial details
+            round_size = card["round_size"]
+            current_valuation = card["current_valuation"]
+            stake = card["stake"]
+
+            # Deck links
+            deck_url = card["deck_url"]
+            deck_attachment_url = card["deck_attachment_url"]
+
+            # Show financial info
+            if (round_size and round_size != "N/A") or (current_valuation and current_valuation != "N/A") or (stake and stake != "N/A"):
+                detail_col1, detail_col2 = st.columns(2)
+                with detail_col1:
+                    if round_size and round_size != "N/A":
+                        st.markdown(f"**💰 Round Size**  \n{round_size}")
+                    if current_valuation and current_valuation != "N/A":
+                        st.markdown(f"**📈 Current Valuation**  \n{current_valuation}")
+                with detail_col2:
+                    if stake and stake != "N/A":
+                        st.markdown(f"**🎯 Stake**  \n{stake}")
+                st.markdown("")
+
+            # Show referal info
+            if (reference and reference != "N/A") or (reference_details and reference_details != "N/A"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    if reference and reference != "N/A":
+                        st.markdown(f"**🔗 Reference**  \n{reference}")
+                with col2:
+                    if reference_details and reference_details != "N/A":
+                        st.markdown(f"**🔗 Reference Details**  \n{reference_details}")
+                st.markdown("")
+
+            # Show signals and red flags
+            cols_signals = st.columns(2)
+            if (signals_list and signals_list != "N/A"):
+                with cols_signals[0]:
+                    st.markdown("**Signals:**")
+                    for signal in signals_list:
+                        st.markdown(f"{signal}")
+
+            if (red_flags_list and red_flags_list != ["N/A"]) or (green_flags_list and green_flags_list != ["N/A"]):
+                with cols_signals[1]:
+                    st.markdown("**Red Flags:**")
+                    for red_flag in red_flags_list:
+                        st.markdown(f"{red_flag}")
+                    st.markdown("**Green Flags:**")
+                    for green_flag in green_flags_list:
+                        st.markdown(f"{green_flag}")
+
+            # Show alternativo de links
+            if deck_attachment_url and not deck_url:
+                st.markdown(f'<a href="{deck_attachment_url}">📄 Deck</a>', unsafe_allow_html=True)
+
+            elif deck_url and not deck_attachment_url:
+                st.markdown(f'<a href="{deck_url}">📄 Deck</a>', unsafe_allow_html=True)
+
+            elif deck_url and deck_attachment_url:
+                st.markdown(
+                    f'<a href="{deck_url}">📄 Deck</a> | '
+                    f'<a href="{deck_attachment_url}">📄 Deck (Attachment)</a>',
+                    unsafe_allow_html=True
+                )
+
+
+def render_zombie_card(card: dict):
+    """Render one Zombie Deals card (adds responsible and tracking dates)"""
+    startup_name = card["startup_name"]
+    founder_name = card["founder_name"]
+    one_liner = card["one_liner"]
+    business_model = card["business_model"]
+    location = card["location"]
+    stage = card["stage"]
+    source_date = card["source_date"]
+    first_videocall = card["first_videocall"]
+    responsible = card["responsible"]
+    reference = card["reference"]
+    reference_details = card["reference_details"]
+    signals_list = card["signals"]
+    red_flags_list = card["red_flags"]
+    green_flags_list = card["green_flags"]
+
+    # --- UI de la Tarjeta ---
+    with st.container(border=True):
+        st.markdown(f"### {startup_name}")
+
+        if founder_name and founder_name != "N/A":
+            st.markdown(f"**👤 {founder_name}**")
+
+        if one_liner and one_liner != "N/A":
+            st.markdown(f"*{one_liner}*")
+
+        with st.expander("📊 View Full Details"):
+
+            # Responsible & Stage
+            if (stage and stage != "N/A") or (responsible and responsible != "N/A"):
+                info_col1, info_col2 = st.columns(2)
+                with info_col1:
+                    if responsible and responsible != "N/A":
+                        st.markdown(f"**👤 Responsible** \n{responsible}")
+                with info_col2:
+                    if stage and stage != "N/A":
+                        st.markdown(f"**🚀 Stage** \n{stage}")
+                st.markdown("")
+            # Dates
+            if (source_date and source_date != "N/A") or (first_videocall and first_videocall != "N/A"):
+                info_col1, info_col2 = st.columns(2)
+                with info_col1:
+                    if source_date and source_date != "N/A":
+                        st.markdown(f"**📅 Source Date** \n{source_date}")
+                with info_col2:
+                    if first_videocall and first_videocall != "N/A":
+                        st.markdown(f"**📅 First Videocall** \n{first_videocall}")
+                st.markdown("")
+            # Model & Location
+            if (business_model and business_model != "N/A") or (location and location != "N/A"):
+                info_col1, info_col2 = st.columns(2)
+                with info_col1:
+                    if business_model and business_model != "N/A":
+                        st.markdown(f"**💼 Business Model** \n{business_model}")
+                with info_col2:
+                    if location and location != "N/A":
+                        st.markdown(f"**📍 Location** \n{location}")
+                st.markdown("")
+
+            # Financials
+            round_size = card["round_size"]
+            current_valuation = card["current_valuation"]
+            stake = card["stake"]
+
+            # Financials Display
+            if (round_size and round_size != "N/A") or (current_valuation and current_valuation != "N/A") or (stake and stake != "N/A"):
+                detail_col1, detail_col2 = st.columns(2)
+                with detail_col1:
+                    if round_size and round_size != "N/A":
+                        st.markdown(f"**💰 Round Size** \n{round_size}")
+                    if current_valuation and current_valuation != "N/A":
+                        st.markdown(f"**📈 Current Valuation** \n{current_valuation}")
+                with detail_col2:
+                    if stake and stake != "N/A":
+                        st.markdown(f"**🎯 Stake** \n{stake}")
+                st.markdown("")
+
+            # Reference (TYPO CORREGIDO AQUI)
+            if (reference and reference != "N/A") or (reference_details and reference_details != "N/A"):
+                col1, col2 = st.columns(2)
+                with col1:
+                    if reference and reference != "N/A":
+                        st.markdown(f"**🔗 Reference** \n{reference}")
+                with col2:
+                    if reference_details and reference_details != "N/A":
+                        st.markdown(f"**🔗 Reference Details** \n{reference_details}")
+                st.markdown("")
+
+            # Signals & Flags (MEJORA VISUAL)
+            cols_signals = st.columns(2)
+            if signals_list:
+                with cols_signals[0]:
+                    st.markdown("**Signals:**")
+                    for signal in signals_list:
+                        st.markdown(f"- {signal}")
+
+            if red_flags_list or green_flags_list:
+                with cols_signals[1]:
+                    if red_flags_list and red_flags_list != ["N/A"]:
+                        st.markdown("**Red Flags:**")
+                        for red_flag in red_flags_list:
+                            st.markdown(f"- {red_flag}")
+
+                    if green_flags_list and green_flags_list != ["N/A"]:
+                        st.markdown("**Green Flags:**")
+                        for green_flag in green_flags_list:
+                            st.markdown(f"- {green_flag}")
+
+            # Links
+            deck_url = card["deck_url"]
+            deck_attachment_url = card["deck_attachment_url"]
+
+            if deck_attachment_url and not deck_url:
+                st.markdown(f'<a href="{deck_attachment_url}" target="_blank">📄 Deck</a>', unsafe_allow_html=True)
+            elif deck_url and not deck_attachment_url:
+                st.markdown(f'<a href="{deck_url}" target="_blank">📄 Deck</a>', unsafe_allow_html=True)
+            elif deck_url and deck_attachment_url:
+                st.markdown(
+                    f'<a href="{deck_url}" target="_blank">📄 Deck</a> | '
+                    f'<a href="{deck_attachment_url}" target="_blank">📄 Deck (Attachment)</a>',
+                    unsafe_allow_html=True
+                )
+
+
+def render_card_grid(section_cards: pd.DataFrame, render_card, num_cols: int = 2):
+    """Lay out a list of deal cards in a grid, one card per column"""
+    records = section_cards.to_dict("records")
+    for i in range(0, len(records), num_cols):
+        cols = st.columns(num_cols)
+        for col_idx, card in enumerate(records[i:i+num_cols]):
+            with cols[col_idx]:
+                render_card(card)
+
+
+def reset_card_page(key: str):
+    """Back to the first page when the search, sort or page size of a card list changes"""
+    st.session_state[f"{key}_page"] = 1
+
+def render_card_list(section_cards: pd.DataFrame, render_card, key: str, page_sizes=(10, 20, 50)):
+    """Searchable, sortable and paginated card list: only the visible page of cards is built"""
+    c_search, c_sort, c_size = st.columns([2, 1, 1])
+    with c_search:
+        query = st.text_input("Search", placeholder="Startup, founder, one-liner, location...", key=f"{key}_search",
+                              on_change=reset_card_page, args=(key,))
+    with c_sort:
+        sort_by = st.selectbox("Sort by", list(CARD_SORT_OPTIONS), key=f"{key}_sort",
+                               on_change=reset_card_page, args=(key,))
+    with c_size:
+        page_size = st.selectbox("Per page", page_sizes, key=f"{key}_page_size",
+                                 on_change=reset_card_page, args=(key,))
+    
+    matching = search_and_sort(section_cards, query, sort_by)
+    if matching.empty:
+        st.info("No startups match your search.")
+        return
+    
+    num_pages = (len(matching) - 1) // page_size + 1
+    if st.session_state.get(f"{key}_page", 1) > num_pages:
+        # The list shrank with a data refresh
+        reset_card_page(key)
+    page = st.number_input("Page", min_value=1, max_value=num_pages, step=1, key=f"{key}_page") if num_pages > 1 else 1
+    
+    first = (page - 1) * page_size + 1
+    last = min(page * page_size, len(matching))
+    st.caption(f"Showing {first}-{last} of {len(matching)} startups (page {page} of {num_pages})")
+    
+    render_card_grid(card_page(matching, page, page_size), render_card)
 
 # =============================================================================
 # DASHBOARD METRICS
@@ -314,7 +521,11 @@ def get_field_value(row, field_patterns, default="N/A"):
 # Calculamos el inicio y fin de la semana actual
 start_of_week, end_of_week = get_current_week_range()
 
+# Maximum history (in weeks) selectable in the funnel table
+MAX_WEEKS_BACK = 52
+
 if not df.empty:
+    cards = load_deal_cards(df)
 
     # =============================================================================
     # URGENCY METRICS (THIS WEEK)
@@ -344,57 +555,11 @@ if not df.empty:
     location_col = next((col for col in df.columns if col.lower() in ['location', 'constitution_location', 'country', 'ph1_constitution_location', "PH1_Constitution_Location"]), None)
 
     if location_col:
-        # 2. Define Keywords for Classification
-        europe_keywords = [
-            'spain', 'espana', 'españa', 'uk', 'united kingdom', 'england', 'london', 
-            'germany', 'france', 'italy', 'portugal', 'greece', 'poland', 'lithuania', 
-            'ukraine', 'estonia', 'hungary', 'netherlands', 'holand', 'ireland', 
-            'norway', 'sweden', 'finland', 'denmark', 'switzerland', 'europe', 
-            'baltics', 'nordics', 'slovakia', 'eslovaquia', 'barcelona', 'czech', 
-            'romania', 'belgium', 'austria', 'luxembourg', 'turkey', 'türkiye'
-        ]
-
-        americas_keywords = [
-            'united states', 'usa', 'us', 'america', 'mexico', 'brazil', 'brasil', 
-            'argentina', 'colombia', 'chile', 'panama', 'cayman', 'uruguay', 
-            'guatemala', 'peru', 'ecuador', 'canada', 'latam', 'latin america', 
-            'washington', 'kentucky', 'porto alegre', 'sao paulo', 'costa rica',
-            'bolivia', 'venezuela', 'mclean', 'ny', 'sf'
-        ]
-
-        # 3. Counting Function - using all records
-        europe_count = 0
-        americas_count = 0
-        other_count = 0
-
-        for location_raw in df[location_col]:
-            # --- CORRECCIÓN AQUÍ ---
-            # Primero verificamos si es una lista (caso común en Airtable)
-            if isinstance(location_raw, list):
-                if not location_raw: # Si la lista está vacía
-                    continue
-                # Unimos los elementos de la lista en un solo string
-                loc_str = " ".join([str(item) for item in location_raw]).lower()
-            
-            # Si no es lista, verificamos si es nulo (NaN/None)
-            elif pd.isna(location_raw):
-                continue
-            
-            # Si es un string o número normal
-            else:
-                loc_str = str(location_raw).lower()
-            # -----------------------
-            
-            # Check for matches
-            is_europe = any(k in loc_str for k in europe_keywords)
-            is_americas = any(k in loc_str for k in americas_keywords)
-
-            if is_europe:
-                europe_count += 1
-            elif is_americas:
-                americas_count += 1
-            else:
-                other_count += 1
+        # 2. Classify the whole column at once (shared word-boundary matcher, Europe first)
+        counts_by_region = region_counts(df[location_col])
+        europe_count = counts_by_region["Europe"]
+        americas_count = counts_by_region["Americas"]
+        other_count = counts_by_region["Other"]
     else:
         # Define defaults to avoid errors later if columns are missing
         europe_count = 0
@@ -404,163 +569,30 @@ if not df.empty:
     st.markdown("---")
     
     # Find required columns once
-    date_sourced_cols = [col for col in df.columns if 'date' in col.lower() and 'source' in col.lower()]
-    if not date_sourced_cols:
-        date_sourced_cols = [col for col in df.columns if col in ['Date Sourced', 'Date_Sourced', 'DateSourced']]
-    
-    contact_stage_cols = [col for col in df.columns if 'contact' in col.lower() and 'stage' in col.lower()]
-    if not contact_stage_cols:
-        contact_stage_cols = [col for col in df.columns if col in ['Contact_Stage', 'Contact Stage', 'ContactStage']]
+    funnel_columns = find_funnel_columns(df)
+    date_col = funnel_columns["date_sourced"]
+    date_sourced_cols = [date_col] if date_col else []
+    
+    # Parse dates once and precompute cumulative daily counts; any range is then O(periods)
+    funnel_counts = load_funnel_counts(df[[col for col in funnel_columns.values() if col]], funnel_columns)
+    max_weeks_back = 12  # Weeks shown in the summary table
+    weeks_ahead = 2
+    today = pd.Timestamp(datetime.today().date())
+    current_week = pd.Timestamp(start_of_week.date())
+    first_week = current_week - pd.Timedelta(weeks=max_weeks_back)
+    last_day = current_week + pd.Timedelta(weeks=weeks_ahead + 1) - pd.Timedelta(days=1)
+    weekly_counts = funnel_by_period(funnel_counts, first_week, last_day, "W")
     
     weeks_data = []
-    current_week_index = None  # Track which row is the current week
-    max_weeks_back = 12  # Calculate data for up to 12 weeks back
+    current_week_index = max_weeks_back  # Track which row is the current week
     
-    for i in range(-max_weeks_back, 3):  # 12 weeks ago to 2 weeks ahead
-        week_start = start_of_week + timedelta(weeks=i)
-        week_end = week_start + timedelta(days=6)  # Sunday
-        
-        # Calculate week number
-        week_num = week_start.isocalendar()[1]
-        
-        # Mark current week (when i == 0)
-        if i == 0:
-            current_week_index = len(weeks_data)
-        
-        new_deals = 0
-        contacted = 0
-        first_contacted = 0
-        no_response = 0
-        videocall_done = 0
-        videocall_pending = 0
-        pending_info = 0
-        
-        if date_sourced_cols and contact_stage_cols:
-            date_col = date_sourced_cols[0]
-            stage_col = contact_stage_cols[0]
-            
-            # Look for Date_First_Contact field (when the contact/call happened)
-            last_contacted_cols = [col for col in df.columns if 'last' in col.lower() and 'contacted' in col.lower()]
-            first_contact_date_cols = [col for col in df.columns if 'first' in col.lower() and 'contact' in col.lower() and 'date' in col.lower()]
-            if not first_contact_date_cols:
-                first_contact_date_cols = [col for col in df.columns if col in ['Date_First_Contact', 'Date First Contact', 'First_Contact_Date', 'First Contact Date']]
-            
-            for idx, row in df.iterrows():
-                # Count New Deals based on Date Sourced
-                date_sourced = row.get(date_col)
-                if pd.notna(date_sourced):
-                    try:
-                        # Convert to datetime if it's a string
-                        if isinstance(date_sourced, str):
-                            sourced_date = pd.to_datetime(date_sourced)
-                        else:
-                            sourced_date = date_sourced
-                        
-                        # Check if date falls within this week
-                        if week_start.date() <= sourced_date.date() <= week_end.date():
-                            new_deals += 1
-                    except:
-                        pass
-                
-                # Count Contacted based on first_videocall_done
-                first_videocall_done_date = row.get("first_videocall_done")
-                if pd.notna(first_videocall_done_date):
-                    try:
-                        # Convert to datetime if it's a string
-                        if isinstance(first_videocall_done_date, str):
-                            contact_date_obj = pd.to_datetime(first_videocall_done_date)
-                        else:
-                            contact_date_obj = first_videocall_done_date
-                        
-                        # Check if date falls within this week
-                        if week_start.date() <= contact_date_obj.date() <= week_end.date():
-                            contacted += 1
-                    except:
-                        pass
-                
-                # Count First Contacted based on Date_First_Contact
-                if first_contact_date_cols:
-                    first_contact_date = row.get(first_contact_date_cols[0])
-                    if pd.notna(first_contact_date):
-                        try:
-                            # Convert to datetime if it's a string
-                            if isinstance(first_contact_date, str):
-                                first_contact_date_obj = pd.to_datetime(first_contact_date)
-                            else:
-                                first_contact_date_obj = first_contact_date
-                            
-                            # Check if date falls within this week
-                            if week_start.date() <= first_contact_date_obj.date() <= week_end.date():
-                                first_contacted += 1
-                        except:
-                            pass
-                
-                # For contact stage statuses: use Date_First_Contact for timing
-                stage = row.get(stage_col, "")
-                if pd.notna(stage):
-                    stage_lower = str(stage).lower()
-                    
-                    # Get the contact date for this status
-                    contact_date = None
-                    if first_contact_date_cols:
-                        contact_date = row.get(first_contact_date_cols[0])
-                    
-                    # For videocall statuses, use Date_First_Contact
-                    if "videocall done" in stage_lower or "video call done" in stage_lower:
-                        if pd.notna(contact_date):
-                            try:
-                                if isinstance(contact_date, str):
-                                    contact_date_obj = pd.to_datetime(contact_date)
-                                else:
-                                    contact_date_obj = contact_date
-                                
-                                if week_start.date() <= contact_date_obj.date() <= week_end.date():
-                                    videocall_done += 1
-                            except:
-                                pass
-                    
-                    elif "videocall pending" in stage_lower or "video call pending" in stage_lower:
-                        if pd.notna(contact_date):
-                            try:
-                                if isinstance(contact_date, str):
-                                    contact_date_obj = pd.to_datetime(contact_date)
-                                else:
-                                    contact_date_obj = contact_date
-                                
-                                if week_start.date() <= contact_date_obj.date() <= week_end.date():
-                                    videocall_pending += 1
-                            except:
-                                pass
-                    
-                    # For other statuses, use Date_First_Contact if available, else Date Sourced
-                    else:
-                        status_date = contact_date if pd.notna(contact_date) else date_sourced
-                        if pd.notna(status_date):
-                            try:
-                                if isinstance(status_date, str):
-                                    status_date_obj = pd.to_datetime(status_date)
-                                else:
-                                    status_date_obj = status_date
-                                
-                                if week_start.date() <= status_date_obj.date() <= week_end.date():
-                                    if "no response" in stage_lower:
-                                        no_response += 1
-                                    elif "pending information" in stage_lower:
-                                        pending_info += 1
-                            except:
-                                pass
-        
-        # Add marker for current week
-        week_label = f"Week {week_num}"
-        if i == 0:
-            week_label = f"📍 Week {week_num} (Current)"
-        
+    for period_start, counts in weekly_counts.iterrows():
         weeks_data.append({
-            "Week": week_label,
-            "New Deals": new_deals,
-            "Calls": contacted,
-            "First Contact": first_contacted,
-            "No Response": no_response,
+            "Week": period_label(period_start, "W", today),
+            "New Deals": counts["New Deals"],
+            "Calls": counts["Calls"],
+            "First Contact": counts["First Contact"],
+            "No Response": counts["No Response"],
         })
     
     # Create DataFrame and display as table
@@ -689,29 +721,54 @@ if not df.empty:
     
     # Display the styled table
     with st.expander("View table of weekly fast-tracks"):
-        # Slider to choose how many weeks back to display (inside expander)
-        weeks_back = st.slider("Weeks back to display", min_value=1, max_value=12, value=4, key="weeks_back_slider")
+        granularities = {"Weekly": "W", "Daily": "D", "Monthly": "M"}
+        q_col1, q_col2 = st.columns(2)
+        with q_col1:
+            granularity_label = st.selectbox("Granularity", list(granularities), key="funnel_granularity")
+        with q_col2:
+            range_mode = st.radio("Range", ["Last weeks", "Custom range"], horizontal=True, key="funnel_range_mode")
+        granularity = granularities[granularity_label]
+        
+        if range_mode == "Last weeks":
+            # Slider to choose how many weeks back to display (plus current + 2 future weeks)
+            weeks_back = st.slider("Weeks back to display", min_value=1, max_value=MAX_WEEKS_BACK, value=4, key="weeks_back_slider")
+            range_start = current_week - pd.Timedelta(weeks=weeks_back)
+            range_end = last_day
+        else:
+            default_range = ((current_week - pd.Timedelta(weeks=13)).date(), today.date())
+            selected_range = st.date_input("Date range", value=default_range, key="funnel_date_range")
+            if isinstance(selected_range, (list, tuple)) and len(selected_range) == 2:
+                range_start, range_end = (pd.Timestamp(d) for d in selected_range)
+            else:
+                st.info("Select a start and an end date.")
+                range_start = range_end = today
         
-        # Filter dataframe based on slider (keep weeks_back past weeks + current + 2 future)
-        # The data has max_weeks_back (12) past weeks, current week is at index max_weeks_back (12)
-        start_idx = max_weeks_back - weeks_back  # e.g., if weeks_back=4, start at index 8
-        filtered_weeks_df = weeks_df.iloc[start_idx:-1].reset_index(drop=True)  # Exclude totals row
+        # Each row and the totals are differences of precomputed cumulative counts
+        period_counts = funnel_by_period(funnel_counts, range_start, range_end, granularity)
+        label_col = {"W": "Week", "D": "Day", "M": "Month"}[granularity]
+        filtered_weeks_df = pd.DataFrame({
+            label_col: [period_label(p, granularity, today) for p in period_counts.index],
+            "New Deals": period_counts["New Deals"].values,
+            "Calls": period_counts["Calls"].values,
+            "First Contact": period_counts["First Contact"].values,
+            "No Response": period_counts["No Response"].values,
+        })
         
-        # Recalculate totals for filtered data
+        range_totals = range_counts(funnel_counts, range_start, range_end)
         totals_filtered = {
-            "Week": "Totals",
-            "New Deals": filtered_weeks_df["New Deals"].sum(),
-            "Calls": filtered_weeks_df["Calls"].sum(),
-            "First Contact": filtered_weeks_df["First Contact"].sum(),
-            "No Response": filtered_weeks_df["No Response"].sum(),
+            label_col: "Totals",
+            "New Deals": range_totals["New Deals"],
+            "Calls": range_totals["Calls"],
+            "First Contact": range_totals["First Contact"],
+            "No Response": range_totals["No Response"],
         }
         filtered_weeks_df = pd.concat([filtered_weeks_df, pd.DataFrame([totals_filtered])], ignore_index=True)
         
         # Re-apply styling to filtered data
         def highlight_current_week_filtered(row):
-            if "📍" in str(row.get("Week", "")):
+            if "📍" in str(row.get(label_col, "")):
                 return ['background-color: #1e3a5f; color: white; font-weight: bold'] * len(row)
-            elif row.get("Week") == "Totals":
+            elif row.get(label_col) == "Totals":
                 return ['background-color: #2d4a6f; color: white; font-weight: bold'] * len(row)
             else:
                 return [''] * len(row)
@@ -723,7 +780,7 @@ if not df.empty:
             use_container_width=True,
             hide_index=True,
             column_config={
-                "Week": st.column_config.TextColumn("Week", width="small"),
+                label_col: st.column_config.TextColumn(label_col, width="small"),
                 "New Deals": st.column_config.NumberColumn("New Deals", width="small"),
                 "Calls": st.column_config.NumberColumn("Calls", width="small"),
                 "First Contact": st.column_config.NumberColumn("First Contact", width="small"),
@@ -753,59 +810,12 @@ if not df.empty:
         reference_other_col = reference_other_cols[0] if reference_other_cols else None
         date_col = date_sourced_cols[0]
         
-        # Get deals from current week only
-        # Store as dict with main reference as key and dict of details as value
-        current_week_references = {}
-        
-        for idx, row in df.iterrows():
-            date_sourced = row.get(date_col)
-            
-            if pd.notna(date_sourced):
-                try:
-                    if isinstance(date_sourced, str):
-                        sourced_date = pd.to_datetime(date_sourced)
-                    else:
-                        sourced_date = date_sourced
-                    
-                    # Check if date falls within current week
-                    if start_of_week.date() <= sourced_date.date() <= (start_of_week + timedelta(days=6)).date():
-                        reference = row.get(reference_col)
-                        reference_other = row.get(reference_other_col) if reference_other_col else None
-                        
-                        # Get main reference value
-                        ref_value = ""
-                        if pd.notna(reference):
-                            ref_value = str(reference).strip()
-                            # Handle list format
-                            if isinstance(reference, list) and len(reference) > 0:
-                                ref_value = str(reference[0]).strip()
-                        
-                        # Get additional reference details (optional)
-                        ref_other_value = ""
-                        if reference_other_col and pd.notna(reference_other):
-                            ref_other_value = str(reference_other).strip()
-                            if isinstance(reference_other, list) and len(reference_other) > 0:
-                                ref_other_value = str(reference_other[0]).strip()
-                        
-                        if ref_value:
-                            # Use main reference as key
-                            if ref_value not in current_week_references:
-                                current_week_references[ref_value] = {
-                                    'count': 0,
-                                    'details': set()  # Store unique detail values
-                                }
-                            
-                            current_week_references[ref_value]['count'] += 1
-                            
-                            # Add detail if present
-                            if ref_other_value:
-                                current_week_references[ref_value]['details'].add(ref_other_value)
-                except:
-                    pass
+        # Deals sourced this week, with the same parsed dates and week mask as the funnel
+        current_week_references = week_references(df, date_col, reference_col, reference_other_col, current_week)
         
-        if current_week_references:
+        if not current_week_references.empty:
             # Calculate total
-            total_deals = sum(ref_data['count'] for ref_data in current_week_references.values())
+            total_deals = int(current_week_references["count"].sum())
             
             # Display header with total
             col_header1, col_header2 = st.columns([2, 1])
@@ -816,9 +826,6 @@ if not df.empty:
             
             st.write("")
             
-            # Sort by count
-            sorted_refs = sorted(current_week_references.items(), key=lambda x: x[1]['count'], reverse=True)
-            
             # Add custom CSS for fixed height containers
             st.markdown("""
                 <style>
@@ -834,18 +841,18 @@ if not df.empty:
             num_cols = 3
             cols = st.columns(num_cols)
             
-            for i, (ref_name, ref_data) in enumerate(sorted_refs):
+            # Sorted by count
+            references = zip(current_week_references.index, current_week_references["count"], current_week_references["details"])
+            for i, (ref_name, count, details) in enumerate(references):
                 with cols[i % num_cols]:
                     with st.container(border=True):
                         # Main reference as prominent metric
-                        count = ref_data['count']
                         st.metric(label=ref_name, value=f"{count} deal{'s' if count != 1 else ''}")
                         
                         # Show details as secondary info if present
-                        if ref_data['details']:
-                            details_list = sorted(list(ref_data['details']))
+                        if details:
                             st.caption("")  # Add spacing
-                            for detail in details_list:
+                            for detail in details:
                                 st.caption(f"• {detail}")
                         else:
                             # Add empty space to maintain alignment
@@ -864,209 +871,16 @@ if not df.empty:
     
     st.write("### 🔥 Hot Deals")
     with st.expander("View Hot Deals"):
-        # Find urgency field
-        urgency_field_cols = [col for col in df.columns if col == 'Urgency' or col == 'urgency']
-        if not urgency_field_cols:
-            urgency_field_cols = [col for col in df.columns if 'urgency' in col.lower() and 'contact' not in col.lower()]
-        
-        if urgency_field_cols:
-            urgency_field = urgency_field_cols[0]
-            
-            # Filter for "Hot" urgency
-            hot_df = df[df[urgency_field].astype(str).str.strip().str.lower() == 'hot']
-            
-            # If empty, try contains
-            if hot_df.empty:
-                hot_df = df[df[urgency_field].astype(str).str.lower().str.contains('hot', na=False)]
-            
-            # Exclude startups with "Killed" stage
-            stage_col_for_filter = next((col for col in df.columns if col.lower() in ['stage', 'stage_$startup']), None)
-            if stage_col_for_filter and not hot_df.empty:
-                hot_df = hot_df[hot_df[stage_col_for_filter].astype(str).str.strip().str.lower() != 'killed']
+        if "urgency" not in cards.attrs["missing_fields"]:
+            # Hot urgency, excluding startups with "Killed" stage
+            hot_cards = hot_deals(cards)
             
-            if not hot_df.empty:
-                st.write(f"**Total:** {len(hot_df)} startups")
+            if not hot_cards.empty:
+                st.write(f"**Total:** {len(hot_cards)} startups")
                 st.write("")
                 
-                # Display in a 2-column grid with cards
-                num_cols = 2
-                rows = [hot_df.iloc[i:i+num_cols] for i in range(0, len(hot_df), num_cols)]
-                
-                for row_idx, row_data in enumerate(rows):
-                    cols = st.columns(num_cols)
-                    for col_idx, (_, startup_row) in enumerate(row_data.iterrows()):
-                        with cols[col_idx]:
-                            # Get startup name - use "Startup name" field specifically
-                            startup_name = "Unknown Startup"
-                            
-                            # Try exact match first: "Startup name"
-                            if 'Startup name' in df.columns:
-                                val = startup_row.get('Startup name')
-                                if pd.notna(val):
-                                    startup_name = str(val)
-                            # Try variations
-                            elif 'Startup_name' in df.columns:
-                                val = startup_row.get('Startup_name')
-                                if pd.notna(val):
-                                    startup_name = str(val)
-                            elif 'startup_name' in df.columns:
-                                val = startup_row.get('startup_name')
-                                if pd.notna(val):
-                                    startup_name = str(val)
-                            else:
-                                # Fallback: find any column with "startup" and "name"
-                                startup_name_cols = [col for col in df.columns if 'startup' in col.lower() and 'name' in col.lower()]
-                                if startup_name_cols:
-                                    val = startup_row.get(startup_name_cols[0])
-                                    if pd.notna(val):
-                                        startup_name = str(val)
-                            
-                            # Get founder name using helper function
-                            founder_name = get_founder_full_name(startup_row, startup_name)
-                            
-                            # Get one liner
-                            one_liner_cols = [col for col in df.columns if 'one' in col.lower() and 'liner' in col.lower()]
-                            one_liner = get_field_value(startup_row, one_liner_cols, "N/A") if one_liner_cols else "N/A"
-                            
-                            # Get business model
-                            bm_patterns = ["PH1_business_model", "Business Model", "business_model"]
-                            business_model = get_field_value(startup_row, bm_patterns, "N/A")
-                            
-                            # Get location
-                            location_patterns = ["PH1_Constitution_Location", "Constitution_Location", "Location", "location"]
-                            location = get_field_value(startup_row, location_patterns, "N/A")
-
-                            # Get stage
-                            stage_patterns = ["stage", "stage_$startup"]
-                            stage = get_field_value(startup_row, stage_patterns, "N/A")
-
-                            # Get round size
-                            round_size_patterns = ["PH1_Round_Size", "Round_Size", "round_size"]
-                            round_size = get_field_value(startup_row, round_size_patterns, "N/A")
-
-                            # Get stake
-                            stake_patterns = ["PH1_Stake", "Stake", "stake"]
-                            stake = get_field_value(startup_row, stake_patterns, "N/A")
-
-                            # Get reference
-                            reference_patterns = ["PH1_Reference", "Reference", "reference", "PH1_reference_$startups"]
-                            reference = get_field_value(startup_row, reference_patterns, "N/A")
-
-                            # Get reference details
-                            reference_details_patterns = ["PH1_Reference_Details", "Reference_Details", "reference_details", "PH1_reference_other_$startups"]
-                            reference_details = get_field_value(startup_row, reference_details_patterns, "N/A")
-
-                            # Get signals
-                            signals_patterns = ["Signals"]
-                            signals = get_field_value(startup_row, signals_patterns, "N/A")
-                            signals_list = [sign.strip() for sign in signals.split("|") if signals != "N/A"]
-
-                            # Get red and green flags
-                            red_flags = get_field_value(startup_row, ["redflags_summary"], "N/A")
-                            red_flags_list = [s.strip() for s in red_flags.split("\n")]
-
-                            green_flags = get_field_value(startup_row, ["greenflags_summary"], "N/A")
-                            green_flags_list = [s.strip() for s in green_flags.split("\n")]
-                            
-                            # Create card with main info
-                            with st.container(border=True):
-                                st.markdown(f"### {startup_name}")
-                                
-                                # Show founder name above one liner
-                                if founder_name and founder_name != "N/A":
-                                    st.markdown(f"**👤 {founder_name}**")
-                                
-                                # Show one liner if available
-                                if one_liner and one_liner != "N/A":
-                                    st.markdown(f"*{one_liner}*")
-                                
-                                # Expandable details section - ALL OTHER info goes here
-                                with st.expander("📊 View Full Details"):
-                                    
-                                    # Show stage
-                                    if (stage and stage != "N/A"):
-                                        st.markdown(f"**🚀 Stage**  \n{stage}")
-                                    
-                                    # Show business model and location
-                                    if (business_model and business_model != "N/A") or (location and location != "N/A"):
-                                        info_col1, info_col2 = st.columns(2)
-                                        with info_col1:
-                                            if business_model and business_model != "N/A":
-                                                st.markdown(f"**💼 Business Model**  \n{business_model}")
-                                        with info_col2:
-                                            if location and location != "N/A":
-                                                st.markdown(f"**📍 Location**  \n{location}")
-                                        st.markdown("")
-                                    
-                                    # Get financial details
-                                    round_size = get_field_value(startup_row, ["Round_Size", "Round Size", "round_size"], "N/A")
-                                    valuation_patterns = ["PH1_current_valuation", "Current_Valuation", "Valuation"]
-                                    current_valuation = get_field_value(startup_row, valuation_patterns, "N/A")
-                                    stake = get_field_value(startup_row, ["Stake_Formula", "Stake Formula", "stake_formula", "Stake"], "N/A")
-                                    
-                                    # Get deck links
-                                    deck_url = get_field_value(startup_row, ["deck_URL", "Deck_URL", "Deck URL"], "")
-                                    deck_startup = get_field_value(startup_row, ["deck_$startup", "deck_startup", "Deck"], "")
-                                    if isinstance(deck_startup, dict):
-                                        deck_attachment_url = deck_startup["url"]
-                                    else:
-                                        deck_attachment_url = ""
-                                    
-                                    # Show financial info
-                                    if (round_size and round_size != "N/A") or (current_valuation and current_valuation != "N/A") or (stake and stake != "N/A"):
-                                        detail_col1, detail_col2 = st.columns(2)
-                                        with detail_col1:
-                                            if round_size and round_size != "N/A":
-                                                st.markdown(f"**💰 Round Size**  \n{round_size}")
-                                            if current_valuation and current_valuation != "N/A":
-                                                st.markdown(f"**📈 Current Valuation**  \n{current_valuation}")
-                                        with detail_col2:
-                                            if stake and stake != "N/A":
-                                                st.markdown(f"**🎯 Stake**  \n{stake}")
-                                        st.markdown("")
-                                    
-                                    # Show referal info
-                                    if (reference and reference != "N/A") or (reference_details and reference_details != "N/A"):
-                                        col1, col2 = st.columns(2)
-                                        with col1:
-                                            if reference and reference != "N/A":
-                                                st.markdown(f"**🔗 Reference**  \n{reference}")
-                                        with col2:
-                                            if reference_details and reference_details != "N/A":
-                                                st.markdown(f"**🔗 Reference Details**  \n{reference_details}")
-                                        st.markdown("")
-                                    
-                                    # Show signals and red flags
-                                    cols_signals = st.columns(2)
-                                    if (signals_list and signals_list != "N/A"):
-                                        with cols_signals[0]:
-                                            st.markdown("**Signals:**")
-                                            for signal in signals_list:
-                                                st.markdown(f"{signal}")
-                                    
-                                    if (red_flags_list and red_flags_list != ["N/A"]) or (green_flags_list and green_flags_list != ["N/A"]):
-                                        with cols_signals[1]:
-                                            st.markdown("**Red Flags:**")
-                                            for red_flag in red_flags_list:
-                                                st.markdown(f"{red_flag}")
-                                            st.markdown("**Green Flags:**")
-                                            for green_flag in green_flags_list:
-                                                st.markdown(f"{green_flag}")
-                                            
-                                    # Show alternativo de links
-                                    if deck_attachment_url and not deck_url:
-                                        st.markdown(f'<a href="{deck_attachment_url}">📄 Deck</a>', unsafe_allow_html=True)
-
-                                    elif deck_url and not deck_attachment_url:
-                                        st.markdown(f'<a href="{deck_url}">📄 Deck</a>', unsafe_allow_html=True)
-
-                                    elif deck_url and deck_attachment_url:
-                                        st.markdown(
-                                            f'<a href="{deck_url}">📄 Deck</a> | '
-                                            f'<a href="{deck_attachment_url}">📄 Deck (Attachment)</a>',
-                                            unsafe_allow_html=True
-                                        )
-
+                # Display the current page in a 2-column grid with cards
+                render_card_list(hot_cards, render_deal_card, key="hot")
             else:
                 st.info("No startups with 'Hot' urgency found.")
         else:
@@ -1083,209 +897,16 @@ if not df.empty:
     with st.expander("View Qualified Startups"):
         st.write("")
         
-        # Find stage field - be more specific
-        stage_field_cols = [col for col in df.columns if col == 'Stage' or col == 'stage']
-        if not stage_field_cols:
-            # Fallback: any field containing 'stage' but not other words
-            stage_field_cols = [col for col in df.columns if 'stage' in col.lower() and 'contact' not in col.lower()]
-        
-        if stage_field_cols:
-            stage_field = stage_field_cols[0]
-            
-            # Filter for "Qualified" stage - try multiple matching strategies
-            # First try exact match
-            qualified_df = df[df[stage_field].astype(str).str.strip().str.lower() == 'qualified']
+        if "pipeline_stage" not in cards.attrs["missing_fields"]:
+            # "Qualified" stage (exact match, else contains), excluding "Killed"
+            qualified_cards = qualified_deals(cards)
             
-            # If empty, try contains
-            if qualified_df.empty:
-                qualified_df = df[df[stage_field].astype(str).str.lower().str.contains('qualified', na=False)]
-            
-            # Exclude startups with "Killed" stage (in case stage field differs)
-            if not qualified_df.empty:
-                qualified_df = qualified_df[qualified_df[stage_field].astype(str).str.strip().str.lower() != 'killed']
-            
-            if not qualified_df.empty:
-                st.write(f"**Total:** {len(qualified_df)} startups")
+            if not qualified_cards.empty:
+                st.write(f"**Total:** {len(qualified_cards)} startups")
                 st.write("")
                 
-                # Display in a 2-column grid with cards
-                num_cols = 2
-                rows = [qualified_df.iloc[i:i+num_cols] for i in range(0, len(qualified_df), num_cols)]
-                
-                for row_idx, row_data in enumerate(rows):
-                    cols = st.columns(num_cols)
-                    for col_idx, (_, startup_row) in enumerate(row_data.iterrows()):
-                        with cols[col_idx]:
-                            # Get startup name - use "Startup name" field specifically
-                            startup_name = "Unknown Startup"
-                            
-                            # Try exact match first: "Startup name"
-                            if 'Startup name' in df.columns:
-                                val = startup_row.get('Startup name')
-                                if pd.notna(val):
-                                    startup_name = str(val)
-                            # Try variations
-                            elif 'Startup_name' in df.columns:
-                                val = startup_row.get('Startup_name')
-                                if pd.notna(val):
-                                    startup_name = str(val)
-                            elif 'startup_name' in df.columns:
-                                val = startup_row.get('startup_name')
-                                if pd.notna(val):
-                                    startup_name = str(val)
-                            else:
-                                # Fallback: find any column with "startup" and "name"
-                                startup_name_cols = [col for col in df.columns if 'startup' in col.lower() and 'name' in col.lower()]
-                                if startup_name_cols:
-                                    val = startup_row.get(startup_name_cols[0])
-                                    if pd.notna(val):
-                                        startup_name = str(val)
-                            
-                            # Get founder name using helper function
-                            founder_name = get_founder_full_name(startup_row, startup_name)
-                            
-                            # Get one liner
-                            one_liner_cols = [col for col in df.columns if 'one' in col.lower() and 'liner' in col.lower()]
-                            one_liner = get_field_value(startup_row, one_liner_cols, "N/A") if one_liner_cols else "N/A"
-                            
-                            # Get business model
-                            bm_patterns = ["PH1_business_model", "Business Model", "business_model"]
-                            business_model = get_field_value(startup_row, bm_patterns, "N/A")
-                            
-                            # Get location
-                            location_patterns = ["PH1_Constitution_Location", "Constitution_Location", "Location", "location"]
-                            location = get_field_value(startup_row, location_patterns, "N/A")
-                            
-                            # Get stage
-                            stage_patterns = ["stage", "stage_$startup"]
-                            stage = get_field_value(startup_row, stage_patterns, "N/A")
-
-                            # Get round size
-                            round_size_patterns = ["PH1_Round_Size", "Round_Size", "round_size"]
-                            round_size = get_field_value(startup_row, round_size_patterns, "N/A")
-
-                            # Get stake
-                            stake_patterns = ["PH1_Stake", "Stake", "stake"]
-                            stake = get_field_value(startup_row, stake_patterns, "N/A")
-
-                            # Get reference
-                            reference_patterns = ["PH1_Reference", "Reference", "reference", "PH1_reference_$startups"]
-                            reference = get_field_value(startup_row, reference_patterns, "N/A")
-
-                            # Get reference details
-                            reference_details_patterns = ["PH1_Reference_Details", "Reference_Details", "reference_details", "PH1_reference_other_$startups"]
-                            reference_details = get_field_value(startup_row, reference_details_patterns, "N/A")
-
-                            # Get signals
-                            signals_patterns = ["Signals"]
-                            signals = get_field_value(startup_row, signals_patterns, "N/A")
-                            signals_list = [sign.strip() for sign in signals.split("|") if signals != "N/A"]
-
-                            # Get red and green flags
-                            red_flags = get_field_value(startup_row, ["redflags_summary"], "N/A")
-                            red_flags_list = [s.strip() for s in red_flags.split("\n")]
-
-                            green_flags = get_field_value(startup_row, ["greenflags_summary"], "N/A")
-                            green_flags_list = [s.strip() for s in green_flags.split("\n")]
-                            
-                            # Create card with main info
-                            with st.container(border=True):
-                                st.markdown(f"### {startup_name}")
-                                
-                                # Show founder name above one liner
-                                if founder_name and founder_name != "N/A":
-                                    st.markdown(f"**👤 {founder_name}**")
-                                
-                                # Show one liner if available
-                                if one_liner and one_liner != "N/A":
-                                    st.markdown(f"*{one_liner}*")
-                                
-                                # Expandable details section - ALL OTHER info goes here
-                                with st.expander("📊 View Full Details"):
-                                    
-                                    # Show stage
-                                    if (stage and stage != "N/A"):
-                                        st.markdown(f"**🚀 Stage**  \n{stage}")
-
-                                    # Show business model and location
-                                    if (business_model and business_model != "N/A") or (location and location != "N/A"):
-                                        info_col1, info_col2 = st.columns(2)
-                                        with info_col1:
-                                            if business_model and business_model != "N/A":
-                                                st.markdown(f"**💼 Business Model**  \n{business_model}")
-                                        with info_col2:
-                                            if location and location != "N/A":
-                                                st.markdown(f"**📍 Location**  \n{location}")
-                                        st.markdown("")
-                                    
-                                    # Get financial details
-                                    round_size = get_field_value(startup_row, ["Round_Size", "Round Size", "round_size"], "N/A")
-                                    valuation_patterns = ["PH1_current_valuation", "Current_Valuation", "Valuation"]
-                                    current_valuation = get_field_value(startup_row, valuation_patterns, "N/A")
-                                    stake = get_field_value(startup_row, ["Stake_Formula", "Stake Formula", "stake_formula", "Stake"], "N/A")
-                                    
-                                    # Get deck links
-                                    deck_url = get_field_value(startup_row, ["deck_URL", "Deck_URL", "Deck URL"], "")
-                                    deck_startup = get_field_value(startup_row, ["deck_$startup", "deck_startup", "Deck"], "")
-                                    if isinstance(deck_startup, dict):
-                                        deck_attachment_url = deck_startup["url"]
-                                    else:
-                                        deck_attachment_url = ""
-                                    
-                                    # Show financial info
-                                    if (round_size and round_size != "N/A") or (current_valuation and current_valuation != "N/A") or (stake and stake != "N/A"):
-                                        detail_col1, detail_col2 = st.columns(2)
-                                        with detail_col1:
-                                            if round_size and round_size != "N/A":
-                                                st.markdown(f"**💰 Round Size**  \n{round_size}")
-                                            if current_valuation and current_valuation != "N/A":
-                                                st.markdown(f"**📈 Current Valuation**  \n{current_valuation}")
-                                        with detail_col2:
-                                            if stake and stake != "N/A":
-                                                st.markdown(f"**🎯 Stake**  \n{stake}")
-                                        st.markdown("")
-                                    
-                                    # Show referal info
-                                    if (reference and reference != "N/A") or (reference_details and reference_details != "N/A"):
-                                        col1, col2 = st.columns(2)
-                                        with col1:
-                                            if reference and reference != "N/A":
-                                                st.markdown(f"**🔗 Reference**  \n{reference}")
-                                        with col2:
-                                            if reference_details and reference_details != "N/A":
-                                                st.markdown(f"**🔗 Reference Details**  \n{reference_details}")
-                                        st.markdown("")
-                                    
-                                    # Show signals and red flags
-                                    cols_signals = st.columns(2)
-                                    if (signals_list and signals_list != "N/A"):
-                                        with cols_signals[0]:
-                                            st.markdown("**Signals:**")
-                                            for signal in signals_list:
-                                                st.markdown(f"{signal}")
-                                    
-                                    if (red_flags_list and red_flags_list != ["N/A"]) or (green_flags_list and green_flags_list != ["N/A"]):
-                                        with cols_signals[1]:
-                                            st.markdown("**Red Flags:**")
-                                            for red_flag in red_flags_list:
-                                                st.markdown(f"{red_flag}")
-                                            st.markdown("**Green Flags:**")
-                                            for green_flag in green_flags_list:
-                                                st.markdown(f"{green_flag}")
-                                    
-                                    # Show alternativo de los links de los decks
-                                    if deck_attachment_url and not deck_url:
-                                        st.markdown(f'<a href="{deck_attachment_url}">📄 Deck</a>', unsafe_allow_html=True)
-
-                                    elif deck_url and not deck_attachment_url:
-                                        st.markdown(f'<a href="{deck_url}">📄 Deck</a>', unsafe_allow_html=True)
-
-                                    elif deck_url and deck_attachment_url:
-                                        st.markdown(
-                                            f'<a href="{deck_url}">📄 Deck</a> | '
-                                            f'<a href="{deck_attachment_url}">📄 Deck (Attachment)</a>',
-                                            unsafe_allow_html=True
-                                        )
+                # Same card table and renderer as Hot Deals
+                render_card_list(qualified_cards, render_deal_card, key="qualified")
             else:
                 st.info("No startups with 'Qualified' stage found.")
         else:
@@ -1322,185 +943,16 @@ if not df.empty:
                 (df["Stage"] != "Killed")
             )
             
-            # Creamos el DataFrame de Zombies
-            zombie_df = df[mask].copy()
+            # Tarjetas de los Zombies (misma tabla de tarjetas que Hot y Qualified)
+            zombie_cards = cards[mask]
             # --- VISUALIZACIÓN ---
             
-            if not zombie_df.empty:
-                st.write(f"**Total:** {len(zombie_df)} startups")
+            if not zombie_cards.empty:
+                st.write(f"**Total:** {len(zombie_cards)} startups")
                 st.write("")
                 
-                # Display in a 2-column grid with cards
-                num_cols = 2
-                # Dividimos el dataframe en chunks para las filas
-                rows = [zombie_df.iloc[i:i+num_cols] for i in range(0, len(zombie_df), num_cols)]
-                
-                for row_idx, row_data in enumerate(rows):
-                    cols = st.columns(num_cols)
-                    # Iteramos sobre las columnas (tarjetas) de esta fila
-                    for col_idx, (_, startup_row) in enumerate(row_data.iterrows()):
-                        with cols[col_idx]:
-                            # --- Extracción de Datos ---
-                            
-                            # Get startup name - logic preserved
-                            startup_name = "Unknown Startup"
-                            if 'Startup name' in df.columns:
-                                val = startup_row.get('Startup name')
-                                if pd.notna(val): startup_name = str(val)
-                            elif 'Startup_name' in df.columns:
-                                val = startup_row.get('Startup_name')
-                                if pd.notna(val): startup_name = str(val)
-                            elif 'startup_name' in df.columns:
-                                val = startup_row.get('startup_name')
-                                if pd.notna(val): startup_name = str(val)
-                            else:
-                                startup_name_cols = [col for col in df.columns if 'startup' in col.lower() and 'name' in col.lower()]
-                                if startup_name_cols:
-                                    val = startup_row.get(startup_name_cols[0])
-                                    if pd.notna(val): startup_name = str(val)
-                            
-                            # Helper functions calls (Assumed to be defined elsewhere)
-                            founder_name = get_founder_full_name(startup_row, startup_name)
-                            
-                            one_liner_cols = [col for col in df.columns if 'one' in col.lower() and 'liner' in col.lower()]
-                            one_liner = get_field_value(startup_row, one_liner_cols, "N/A") if one_liner_cols else "N/A"
-                            
-                            bm_patterns = ["PH1_business_model", "Business Model", "business_model"]
-                            business_model = get_field_value(startup_row, bm_patterns, "N/A")
-                            
-                            location_patterns = ["PH1_Constitution_Location", "Constitution_Location", "Location", "location"]
-                            location = get_field_value(startup_row, location_patterns, "N/A")
-                            stage_patterns = ["stage", "stage_$startup"]
-                            stage = get_field_value(startup_row, stage_patterns, "N/A")
-                            source_date_patterns = ["date_sourced"]
-                            source_date = get_field_value(startup_row, source_date_patterns, "N/A")
-                            first_videocall_patterns = ["first_videocall_done"]
-                            first_videocall_raw = get_field_value(startup_row, first_videocall_patterns, "N/A")
-                            first_videocall = first_videocall_raw.split("T")[0] if "T" in str(first_videocall_raw) else str(first_videocall_raw)
-                            responsible_patterns = ["Responsible"]
-                            responsible = get_field_value(startup_row, responsible_patterns, "N/A")
-                            reference_patterns = ["PH1_Reference", "Reference", "reference", "PH1_reference_$startups"]
-                            reference = get_field_value(startup_row, reference_patterns, "N/A")
-                            reference_details_patterns = ["PH1_Reference_Details", "Reference_Details", "reference_details", "PH1_reference_other_$startups"]
-                            reference_details = get_field_value(startup_row, reference_details_patterns, "N/A")
-                            signals_patterns = ["Signals"]
-                            signals = get_field_value(startup_row, signals_patterns, "N/A")
-                            signals_list = [sign.strip() for sign in signals.split("|")] if signals != "N/A" else []
-                            red_flags = get_field_value(startup_row, ["redflags_summary"], "N/A")
-                            red_flags_list = [s.strip() for s in red_flags.split("\n")] if red_flags != "N/A" else []
-                            green_flags = get_field_value(startup_row, ["greenflags_summary"], "N/A")
-                            green_flags_list = [s.strip() for s in green_flags.split("\n")] if green_flags != "N/A" else []
-                            
-                            # --- UI de la Tarjeta ---
-                            with st.container(border=True):
-                                st.markdown(f"### {startup_name}")
-                                
-                                if founder_name and founder_name != "N/A":
-                                    st.markdown(f"**👤 {founder_name}**")
-                                
-                                if one_liner and one_liner != "N/A":
-                                    st.markdown(f"*{one_liner}*")
-                                
-                                with st.expander("📊 View Full Details"):
-                                    
-                                    # Responsible & Stage
-                                    if (stage and stage != "N/A") or (responsible and responsible != "N/A"):
-                                        info_col1, info_col2 = st.columns(2)
-                                        with info_col1:
-                                            if responsible and responsible != "N/A":
-                                                st.markdown(f"**👤 Responsible** \n{responsible}")
-                                        with info_col2:
-                                            if stage and stage != "N/A":
-                                                st.markdown(f"**🚀 Stage** \n{stage}")
-                                        st.markdown("")
-                                    # Dates
-                                    if (source_date and source_date != "N/A") or (first_videocall and first_videocall != "N/A"):
-                                        info_col1, info_col2 = st.columns(2)
-                                        with info_col1:
-                                            if source_date and source_date != "N/A":
-                                                st.markdown(f"**📅 Source Date** \n{source_date}")
-                                        with info_col2:
-                                            if first_videocall and first_videocall != "N/A":
-                                                st.markdown(f"**📅 First Videocall** \n{first_videocall}")
-                                        st.markdown("")
-                                    # Model & Location
-                                    if (business_model and business_model != "N/A") or (location and location != "N/A"):
-                                        info_col1, info_col2 = st.columns(2)
-                                        with info_col1:
-                                            if business_model and business_model != "N/A":
-                                                st.markdown(f"**💼 Business Model** \n{business_model}")
-                                        with info_col2:
-                                            if location and location != "N/A":
-                                                st.markdown(f"**📍 Location** \n{location}")
-                                        st.markdown("")
-                                    
-                                    # Financials extraction
-                                    round_size = get_field_value(startup_row, ["Round_Size", "Round Size", "round_size", "PH1_Round_Size"], "N/A")
-                                    current_valuation = get_field_value(startup_row, ["PH1_current_valuation", "Current_Valuation", "Valuation"], "N/A")
-                                    stake = get_field_value(startup_row, ["PH1_Stake", "Stake", "stake", "Stake_Formula", "Stake Formula", "stake_formula"], "N/A")
-                                    
-                                    # Financials Display
-                                    if (round_size and round_size != "N/A") or (current_valuation and current_valuation != "N/A") or (stake and stake != "N/A"):
-                                        detail_col1, detail_col2 = st.columns(2)
-                                        with detail_col1:
-                                            if round_size and round_size != "N/A":
-                                                st.markdown(f"**💰 Round Size** \n{round_size}")
-                                            if current_valuation and current_valuation != "N/A":
-                                                st.markdown(f"**📈 Current Valuation** \n{current_valuation}")
-                                        with detail_col2:
-                                            if stake and stake != "N/A":
-                                                st.markdown(f"**🎯 Stake** \n{stake}")
-                                        st.markdown("")
-                                    
-                                    # Reference (TYPO CORREGIDO AQUI)
-                                    if (reference and reference != "N/A") or (reference_details and reference_details != "N/A"):
-                                        col1, col2 = st.columns(2)
-                                        with col1:
-                                            if reference and reference != "N/A":
-                                                st.markdown(f"**🔗 Reference** \n{reference}")
-                                        with col2:
-                                            if reference_details and reference_details != "N/A":
-                                                st.markdown(f"**🔗 Reference Details** \n{reference_details}")
-                                        st.markdown("")
-                                    
-                                    # Signals & Flags (MEJORA VISUAL)
-                                    cols_signals = st.columns(2)
-                                    if signals_list:
-                                        with cols_signals[0]:
-                                            st.markdown("**Signals:**")
-                                            for signal in signals_list:
-                                                st.markdown(f"- {signal}")
-                                    
-                                    if red_flags_list or green_flags_list:
-                                        with cols_signals[1]:
-                                            if red_flags_list and red_flags_list != ["N/A"]:
-                                                st.markdown("**Red Flags:**")
-                                                for red_flag in red_flags_list:
-                                                    st.markdown(f"- {red_flag}")
-                                            
-                                            if green_flags_list and green_flags_list != ["N/A"]:
-                                                st.markdown("**Green Flags:**")
-                                                for green_flag in green_flags_list:
-                                                    st.markdown(f"- {green_flag}")
-                                                    
-                                    # Links
-                                    deck_url = get_field_value(startup_row, ["deck_URL", "Deck_URL", "Deck URL"], "")
-                                    deck_startup = get_field_value(startup_row, ["deck_$startup", "deck_startup", "Deck"], "")
-                                    
-                                    deck_attachment_url = ""
-                                    if isinstance(deck_startup, dict) and "url" in deck_startup:
-                                        deck_attachment_url = deck_startup["url"]
-                                    
-                                    if deck_attachment_url and not deck_url:
-                                        st.markdown(f'<a href="{deck_attachment_url}" target="_blank">📄 Deck</a>', unsafe_allow_html=True)
-                                    elif deck_url and not deck_attachment_url:
-                                        st.markdown(f'<a href="{deck_url}" target="_blank">📄 Deck</a>', unsafe_allow_html=True)
-                                    elif deck_url and deck_attachment_url:
-                                        st.markdown(
-                                            f'<a href="{deck_url}" target="_blank">📄 Deck</a> | '
-                                            f'<a href="{deck_attachment_url}" target="_blank">📄 Deck (Attachment)</a>',
-                                            unsafe_allow_html=True
-                                        )
+                # Display the current page in a 2-column grid with cards
+                render_card_list(zombie_cards, render_zombie_card, key="zombie")
             else:
                 st.info("No zombie deals found. All startups have been updated recently!")
         else:
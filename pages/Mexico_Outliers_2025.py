@@ -1,18 +1,14 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import unicodedata
-from pyairtable import Api
+from utils.cohorts import load_cohort_views
+from utils.metrics import cohort_metrics
+from utils.outliers import classify_profiles, cross_cohort_outliers
 
 # =============================================================================
 # CONFIGURACIÓN
 # =============================================================================
 
-API_KEY = st.secrets["airtable_mexico_investment"]["api_key"]      #Api key de nuestro airtable
-BASE_ID = st.secrets["airtable_mexico_investment"]["base_id"]     #base id del CRM
-TABLE_ID_EM = st.secrets["airtable_mexico_investment"]["table_id_em"]     #Tabla con el feedback de los EM's
-TABLE_ID_DD = st.secrets["airtable_mexico_investment"]["table_id_team"]      #Tabla con el feedback del equipo de los forms
-
 THRESHOLD = 0.9
 TWO_METRIC_THRESHOLD = 0.8
 
@@ -156,71 +152,6 @@ with st.sidebar:
 # DATOS ESTÁTICOS
 # =============================================================================
 
-startup_founders = {
-    "ROOK": ["Marco Benitez", "Jonas Ducker", "Daniel Martinez"],
-    "Figuro": ["Juan Camilo Gonzalez"],
-    "Admina": ["David Gomez", "Andres Gomez"],
-    "Ecosis": ["Enrique Arredondo", "Roberto Riveroll"],
-    "CALMIO": ["Andrés Ospina", "Camilo Ospina"],
-    "Pitz": ["Natalia Salcedo"],
-    "BondUP": ["Michelle Schnitzer"],
-    "Jelt": ["Sergio Ramirez"],
-    "Moabits SL": ["Alejandro Ortiz", "David Santibanez", "Juan Martin Pawluszek"],
-    "Ximple": ["Daniel Sujo", "Joao Ramos", "Clarissa Morrisson"],
-    "Kuri": ["Ludwig Pucha Cofrep"],
-    "CROMODATA": ["Juan Pablo  Merea Otermin", "Keila Barral Masri", "Matias  Karlsson"],
-    "Ternadia": ["Angel Sanchez", "Raul Merino"],
-    "Tu Cambio": ["Luis Saavedra", "Carla Leal"],
-    "Airbag": ["Adrian Trucios"],
-    "Handit.ai": ["Jose Manuel Ramirez", "Cristhian Camilo Gomez"],
-    "Verticcal": ["Santiago Gallo Restrepo", "Pablo Sanchez Villamarin"],
-    "Neat": ["Nicolas Chacon", "Javier Benavides"],
-    "CIFRATO": ["Yerson Cacua", "Juan Pisco"],
-    "Konvex": ["Andres Cristobal Sosa Tellez"]
-}
-
-founder_list = []
-for startup in startup_founders.keys():
-    founder_list.extend(startup_founders[startup])
-
-fields = {
-    "team": [
-        "Castle Contest | Conflict resolution (Team)",
-        "Castle Contest | Clear vision and alignment (Team)",
-        "Castle Contest | Confidence and respect between founders (Team)",
-        "Castle Contest | Clear roles",
-        "Castle Contest | Complementary hard skills between founders",
-        "Castle Contest | Execution and speed (Team)",
-        "1:1's | Team ambition (Team)",
-        "1:1's | Product and customer focus (Team)"
-    ],
-    "individual": [
-        "Workstations | Integrity and honesty (Individual)",
-        "Workstations | Relevant experience and network (Individual)",
-        "Paellas contest | Visionary leadership (Individual)",
-        "Paellas contest | Active listening (Individual)",
-        "Paellas contest | Flexibility (Individual)",
-        "Paellas contest | Self awareness and management of emotions (Individual)",
-        "Openness",
-        "Purpose",
-        "Dilema 1",
-        "Dilema 2"
-    ],
-    "risk_reward": [
-        "RISK | State of development_Score",
-        "RISK | Momentum_Score",
-        "RISK | Management_Score",
-        "Reward | Market_Score",
-        "Reward | Team_Score",
-        "Reward | Pain_Score",
-        "Reward | Scalability_Score"
-    ],
-    "workstations": [
-        "Workstations | Challenge clearness (Bussiness)",
-        "Workstations | Challenge importance (Bussiness)"
-    ]
-}
-
 METRICS = {
     "individual": {
         "mean_col": "media_individual",
@@ -243,150 +174,6 @@ METRICS = {
 # FUNCIONES AUXILIARES
 # =============================================================================
 
-def fix_cell(val):
-    """Corrige valores NaN especiales de Airtable"""
-    if isinstance(val, dict) and "specialValue" in val:
-        return float("nan")
-    return val
-
-
-def normalize_name(s: str) -> str:
-    """Normaliza nombres eliminando acentos y estandarizando formato"""
-    if not isinstance(s, str):
-        return ""
-    
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    s = s.lower()
-    s = s.replace("\u00A0", " ").replace("\u200b", " ")
-    s = " ".join(s.split())
-    s = s.strip()
-    return s
-
-
-def metricas_agrupadas(df_to_check, columns_list, field_to_group_by, mean_field_name):
-    """
-    Calcula la media de las columnas especificadas y agrupa por un campo.
-    
-    Args:
-        df_to_check: DataFrame con los datos
-        columns_list: Lista de columnas a promediar
-        field_to_group_by: Campo por el cual agrupar
-        mean_field_name: Nombre de la columna de media resultante
-    
-    Returns:
-        DataFrame con el campo de agrupación y la media calculada
-    """
-    if not columns_list:
-        return pd.DataFrame(columns=[field_to_group_by, mean_field_name])
-    
-    # Convertir a numérico
-    numeric_columns = df_to_check[columns_list].apply(pd.to_numeric, errors="coerce")
-    
-    # Calcular media por fila
-    df_to_check[mean_field_name] = numeric_columns.mean(axis=1)
-    
-    # Agrupar si el campo existe
-    if field_to_group_by in df_to_check.columns:
-        df_output = df_to_check.groupby(field_to_group_by, as_index=False)[mean_field_name].mean()
-    else:
-        df_output = pd.DataFrame(columns=[field_to_group_by, mean_field_name])
-    
-    return df_output
-
-
-def classify_profile(row, threshold):
-    """
-    Clasifica el perfil de un founder según sus puntuaciones z en las tres métricas.
-    
-    Args:
-        row: Fila del DataFrame con las puntuaciones z
-        threshold: Umbral para considerar valores altos/bajos
-    
-    Returns:
-        String con la clasificación del perfil
-    """
-    zi = row[METRICS["individual"]["z_col"]]
-    zt = row[METRICS["team"]["z_col"]]
-    zb = row[METRICS["business"]["z_col"]]
-
-    hi_i = zi >= threshold
-    lo_i = zi <= -threshold
-    hi_t = zt >= threshold
-    lo_t = zt <= -threshold
-    hi_b = zb >= threshold
-    lo_b = zb <= -threshold
-
-    # Clasificaciones ordenadas por prioridad
-    if hi_i and hi_t and hi_b:
-        return "Strategic profile (high in individual, team and business)"
-    
-    if hi_i and hi_t and not hi_b and not lo_b:
-        return "Solid founder and team, weak business"
-    
-    if hi_i and (lo_t or lo_b):
-        return "Individual talent wasted by team or business"
-    
-    if hi_t and lo_i and not lo_b:
-        return "Strong team, weak business"
-    
-    if hi_b and (lo_i or lo_t):
-        return "Weak founder in a strong project"
-    
-    if (lo_i and lo_t) or (lo_i and lo_b) or (lo_t and lo_b):
-        return "High risk (person/team/business below average)"
-    
-    if hi_i or hi_t or hi_b:
-        return "Promising profile (high in at least one metric)"
-    
-    return "Nothing to highlight"
-
-def classify_profile_startup(row, threshold):
-    """
-    Clasifica el perfil de una startup según sus puntuaciones z en las tres métricas.
-    
-    Args:
-        row: Fila del DataFrame con las puntuaciones z
-        threshold: Umbral para considerar valores altos/bajos
-    
-    Returns:
-        String con la clasificación del perfil
-    """
-    zi = "z_media_individual_agg"
-    zt = row[METRICS["team"]["z_col"]]
-    zb = row[METRICS["business"]["z_col"]]
-
-    hi_i = zi >= threshold
-    lo_i = zi <= -threshold
-    hi_t = zt >= threshold
-    lo_t = zt <= -threshold
-    hi_b = zb >= threshold
-    lo_b = zb <= -threshold
-
-    # Clasificaciones ordenadas por prioridad
-    if hi_i and hi_t and hi_b:
-        return "Strategic company (high in individual, team and business)"
-    
-    if hi_i and hi_t and not hi_b and not lo_b:
-        return "Solid founder and team, weak business"
-    
-    if hi_i and (lo_t or lo_b):
-        return "Individual talents wasted by team or business"
-    
-    if hi_t and lo_i and not lo_b:
-        return "Strong team, weak business"
-    
-    if hi_b and (lo_i or lo_t):
-        return "Strong business, weak founders"
-    
-    if (lo_i and lo_t) or (lo_i and lo_b) or (lo_t and lo_b):
-        return "High risk (person/team/business below average)"
-    
-    if hi_i or hi_t or hi_b:
-        return "Promising company (high in at least one metric)"
-    
-    return "Nothing to highlight"
-
 def scatter_two_dim(df, x_col, y_col, label_x, label_y, third_value, title, label, show_name=True):
     """
     Crea un gráfico de dispersión 2D con Plotly Express.
@@ -560,138 +347,35 @@ def render_founder_card(df_founder, show_name=True):
 # CARGA DE DATOS
 # =============================================================================
 
-api = Api(API_KEY)
-
-# Cargar datos de EM (Entrepreneur Metrics)
-try:
-    em_records = api.table(BASE_ID, TABLE_ID_EM).all(view=PROGRAM_NAME)
-    em_data = [record["fields"] for record in em_records]
-    em_df = pd.DataFrame(em_data)
-except Exception as e:
-    st.error(f"Error al cargar los datos de la tabla de EMs: {e}")
-    em_df = pd.DataFrame()
-
-# Cargar datos de DD (Due Diligence)
-try:
-    dd_records = api.table(BASE_ID, TABLE_ID_DD).all(view=PROGRAM_NAME)
-    dd_data = [record["fields"] for record in dd_records]
-    dd_df = pd.DataFrame(dd_data)
-except Exception as e:
-    st.error(f"Error al cargar los datos de la tabla de DDs: {e}")
-    dd_df = pd.DataFrame()
-
-# Aplicar corrección de NaN's
-em_df = em_df.map(func=fix_cell)
-dd_df = dd_df.map(func=fix_cell)
+# Cargar el feedback de todas las cohortes en paralelo (esta y las demás, para el ranking entre cohortes)
+cohort_frames, errors = load_cohort_views()
 
-# =============================================================================
-# PROCESAMIENTO DE DATOS
-# =============================================================================
+if f"{PROGRAM_NAME}/em" in errors:
+    st.error(f"Error al cargar los datos de la tabla de EMs: {errors[f'{PROGRAM_NAME}/em']}")
+if f"{PROGRAM_NAME}/dd" in errors:
+    st.error(f"Error al cargar los datos de la tabla de DDs: {errors[f'{PROGRAM_NAME}/dd']}")
 
-# Procesar columnas combinadas (Openness y Purpose)
-cols_openness = [
-    "Workstations | Openness (Individual)",
-    "Paellas contest | Openness (Individual)"
-]
-cols_purpose = [
-    "1:1's | Purpose (Individual)",
-    "Workstations | Purpose (Individual)"
-]
-
-present_cols_openness = [c for c in cols_openness if c in dd_df.columns]
-present_cols_purpose = [c for c in cols_purpose if c in dd_df.columns]
-
-if present_cols_openness:
-    dd_df["Openness"] = dd_df[present_cols_openness].apply(
-        pd.to_numeric, errors="coerce"
-    ).mean(axis=1)
-else:
-    dd_df["Openness"] = pd.Series(dtype=float)
+# El feedback del equipo solo se usa ya para los logos y las fotos
+dd_df = cohort_frames[PROGRAM_NAME][1]
 
-if present_cols_purpose:
-    dd_df["Purpose"] = dd_df[present_cols_purpose].apply(
-        pd.to_numeric, errors="coerce"
-    ).mean(axis=1)
-else:
-    dd_df["Purpose"] = pd.Series(dtype=float)
+# Las cohortes que no cargan se quedan fuera del ranking entre cohortes
+failed_cohorts = sorted({key.rsplit("/", 1)[0] for key in errors} - {PROGRAM_NAME})
+if failed_cohorts:
+    st.warning(f"No se pudieron cargar las cohortes {', '.join(failed_cohorts)}; no aparecen en el ranking entre cohortes")
 
-# Crear mapeo de personas a startups
-person_to_company = {
-    person: company
-    for company, people in startup_founders.items()
-    for person in people
+# Tablas de métricas de cada cohorte (materializadas una vez por refresco de los datos)
+founder_tables = {
+    cohort: cohort_metrics(cohort, em, dd)["founders"]
+    for cohort, (em, dd) in cohort_frames.items()
+    if cohort not in failed_cohorts
 }
 
-df_people = pd.DataFrame(
-    [(person, company) for person, company in person_to_company.items()],
-    columns=["Name", "Startup"]
-)
-df_people["Name_norm"] = df_people["Name"].apply(normalize_name)
-df_people = df_people.dropna(subset="Startup")
-
-founder_list_norm = []
-for founder in founder_list:
-    founder_norm = normalize_name(founder)
-    founder_list_norm.append(founder_norm)
-
-# Renombrar columna Name si es necesario
-if "Founder_str" in dd_df.columns and "Name" not in dd_df.columns:
-    dd_df.rename(columns={"Founder_str": "Name"}, inplace=True)
-elif "Name" not in dd_df.columns:
-    dd_df["Name"] = None
-
-# =============================================================================
-# CÁLCULO DE MÉTRICAS
-# =============================================================================
-
-# 1. Métricas individuales
-individual_cols = [c for c in fields["individual"] if c in dd_df.columns]
-df_individual = metricas_agrupadas(dd_df, individual_cols, "Name", "media_individual")
-df_individual["Name_norm"] = df_individual["Name"].apply(normalize_name)
-
-# 2. Métricas de equipo
-team_cols = [c for c in fields["team"] if c in dd_df.columns]
-df_team = metricas_agrupadas(dd_df, team_cols, "Startup", "media_equipo")
-
-# 3. Métricas de business
-risk_reward_cols = [c for c in fields["risk_reward"] if c in em_df.columns]
-df_business_rr = metricas_agrupadas(em_df, risk_reward_cols, "Startup", "media_risk_reward")
-
-workstations_cols = [c for c in fields["workstations"] if c in dd_df.columns]
-df_business_ws = metricas_agrupadas(dd_df, workstations_cols, "Startup", "media_workstations")
-
-# Combinar métricas de business
-df_business = pd.merge(df_business_rr, df_business_ws, on="Startup", how="outer")
-business_cols = [col for col in ["media_risk_reward", "media_workstations"] if col in df_business.columns]
-if business_cols:
-    df_business["media_business"] = df_business[business_cols].mean(axis=1)
-    df_business = df_business[["Startup", "media_business"]]
-
 # =============================================================================
 # CONSOLIDACIÓN DE DATOS
 # =============================================================================
 
-# Merge de todos los datos
-df_final = df_individual.merge(df_people[["Name_norm", "Startup"]], on="Name_norm", how="left")
-
-if not df_team.empty:
-    df_final = df_final.merge(df_team, on="Startup", how="left", suffixes=('', '_DROP_TEAM'))
-
-if not df_business.empty:
-    df_final = df_final.merge(df_business, on="Startup", how="left", suffixes=('', '_DROP_BUS'))
-
-# ELIMINACIÓN AGRESIVA DE COLUMNAS DUPLICADAS
-# Eliminar todas las columnas que terminen en _DROP
-drop_cols = [col for col in df_final.columns if '_DROP' in col]
-if drop_cols:
-    print(f"Eliminando columnas con sufijo _DROP: {drop_cols}")
-    df_final.drop(columns=drop_cols, inplace=True)
-
-# Verificar y eliminar duplicados por índice de columnas
-if df_final.columns.duplicated().any():
-    print(f"⚠️ ADVERTENCIA: Columnas duplicadas detectadas: {df_final.columns[df_final.columns.duplicated()].tolist()}")
-    df_final = df_final.loc[:, ~df_final.columns.duplicated(keep='first')]
-    print(f"Columnas después de eliminar duplicados: {df_final.columns.tolist()}")
+# Medias individual, de equipo y de business y sus z por founder
+df_final = founder_tables[PROGRAM_NAME].copy()
 
 # Añadir logos
 if "original logo" in dd_df.columns and "Startup" in dd_df.columns:
@@ -705,46 +389,26 @@ else:
 if "Headshot" in dd_df.columns and "Founder_str" in dd_df.columns:
     df_logo_mapping = dd_df[["Founder_str", "Headshot"]].drop_duplicates(subset=["Founder_str"], keep="first")
     logo_series = df_logo_mapping.set_index("Founder_str")["Headshot"]
-    df_final["Headshot"] = df_final["Founder_str"].map(logo_series)
+    df_final["Headshot"] = df_final["Name"].map(logo_series)
 else:
     df_final["Headshot"] = None
 
-# VERIFICACIÓN FINAL DE DUPLICADOS
-if df_final.columns.duplicated().any():
-    print("❌ ERROR: Aún hay columnas duplicadas después de la limpieza")
-    print(f"Columnas duplicadas: {df_final.columns[df_final.columns.duplicated()].tolist()}")
-    # Forzar eliminación
-    df_final = df_final.T.drop_duplicates().T
-
-# Calcular z-scores
-for metric in ["media_individual", "media_equipo", "media_business"]:
-    if metric in df_final.columns:
-        mu = df_final[metric].mean()
-        sigma = df_final[metric].std()
-        if sigma > 0:
-            df_final[f"z_{metric}"] = (df_final[metric] - mu) / sigma
-        else:
-            df_final[f"z_{metric}"] = 0
-    else:
-        df_final[f"z_{metric}"] = None
-
-# Clasificar perfiles
-df_final["Perfil_exec"] = df_final.apply(classify_profile, axis=1, args=(THRESHOLD,))
-
-# VERIFICACIÓN FINAL ANTES DE USAR EN PLOTLY
-print(f"✓ Columnas finales: {len(df_final.columns)}")
-print(f"✓ ¿Hay duplicados?: {df_final.columns.duplicated().any()}")
-if df_final.columns.duplicated().any():
-    print(f"Columnas duplicadas restantes: {df_final.columns[df_final.columns.duplicated()].tolist()}")
+# Clasificar perfiles (vectorizado sobre todas las filas)
+df_final["Perfil_exec"] = classify_profiles(
+    df_final[METRICS["individual"]["z_col"]],
+    df_final[METRICS["team"]["z_col"]],
+    df_final[METRICS["business"]["z_col"]],
+    THRESHOLD,
+)
 
-df_final = df_final[df_final["Name_norm"].isin(founder_list_norm)]
+df_final = df_final[df_final["in_roster"]]
 
 # =============================================================================
 # CÁLCULO DE PERFIL A NIVEL DE STARTUP (USANDO LA MEDIA INDIVIDUAL)
 # =============================================================================
 
 # 1. Calcular la media de Z-score Individual por Startup
-df_z_individual_agg = df_final.groupby('Startup', as_index=False)[
+df_z_individual_agg = df_final.groupby('Startup', as_index=False, observed=True)[
     METRICS["individual"]["z_col"]
 ].mean().rename(columns={METRICS["individual"]["z_col"]: "z_media_individual_agg"})
 
@@ -765,32 +429,19 @@ df_startup_profiles = df_startup_profiles.merge(
     how="left"
 )
 
-# 3. Preparar el DataFrame para usar classify_profile
-
-# Renombramos temporalmente las columnas para que coincidan con la función classify_profile
-df_startup_profiles.rename(columns={
-    "z_media_individual_agg": METRICS["individual"]["z_col"] # Usamos el nombre original esperado
-}, inplace=True)
-
-
-# 4. Aplicar la clasificación de perfil de Startup
-df_startup_profiles["Perfil_startup"] = df_startup_profiles.apply(
-    classify_profile, 
-    axis=1, 
-    args=(THRESHOLD,)
+# 3. Aplicar la clasificación de perfil de Startup (misma cascada, con la z individual agregada)
+df_startup_profiles["Perfil_startup"] = classify_profiles(
+    df_startup_profiles["z_media_individual_agg"],
+    df_startup_profiles[METRICS["team"]["z_col"]],
+    df_startup_profiles[METRICS["business"]["z_col"]],
+    THRESHOLD,
 )
 
-
-# 5. Volver a renombrar la columna Z-score para evitar confusiones en el df_final
-df_startup_profiles.rename(columns={
-    METRICS["individual"]["z_col"]: "z_media_individual_agg" # Volvemos al nombre agregado
-}, inplace=True)
-
 # Seleccionamos solo las columnas necesarias para el merge
 df_startup_profiles = df_startup_profiles[["Startup", "Perfil_startup"]]
 
 
-# 6. Fusionar la nueva clasificación al df_final (a todas las filas de founders)
+# 4. Fusionar la nueva clasificación al df_final (a todas las filas de founders)
 df_final = df_final.merge(
     df_startup_profiles, 
     on="Startup", 
@@ -1124,4 +775,49 @@ with tab_tvb:
             df_startup_row = df_all_founders.iloc[[0]].copy()
             df_startup_row["media_individual"].iloc[0] = avg_individual_mean
 
-            render_founder_card(df_startup_row, show_name=False)
\ No newline at end of file
+            render_founder_card(df_startup_row, show_name=False)
+# =============================================================================
+# SECCIÓN 3: RANKING ENTRE COHORTES
+# =============================================================================
+
+st.markdown("<h2>3. Cross-cohort ranking</h2>", unsafe_allow_html=True)
+st.markdown(
+    "Founders of every cohort in one table. **Cohort z** compares each founder with their own cohort; "
+    "**Pooled z** and the percentiles compare them with all cohorts together."
+)
+
+df_cohorts = cross_cohort_outliers(founder_tables, THRESHOLD)
+
+show_all_cohorts = st.toggle("Show all cohorts", value=False, key="cross_cohort_all")
+df_ranking = df_cohorts if show_all_cohorts else df_cohorts[df_cohorts["Cohort"] == PROGRAM_NAME]
+
+ranking_sort = st.selectbox(
+    "Rank by",
+    [METRICS[key]["label"] for key in METRICS],
+    key="cross_cohort_sort"
+)
+sort_metric = next(key for key in METRICS if METRICS[key]["label"] == ranking_sort)
+
+ranking_cols = {"Cohort": "Cohort", "Name": "Founder", "Startup": "Startup"}
+for key, metric in METRICS.items():
+    ranking_cols[metric["mean_col"]] = f"{metric['label']} mean"
+    ranking_cols[metric["z_col"]] = f"{metric['label']} cohort z"
+    ranking_cols[f"z_pool_{metric['mean_col']}"] = f"{metric['label']} pooled z"
+    ranking_cols[f"pct_{metric['mean_col']}"] = f"{metric['label']} percentile"
+ranking_cols["Perfil_exec"] = "Cohort profile"
+ranking_cols["Perfil_pool"] = "Pooled profile"
+
+df_ranking = (
+    df_ranking.sort_values(f"z_pool_{METRICS[sort_metric]['mean_col']}", ascending=False, na_position="last")
+    [list(ranking_cols)]
+    .rename(columns=ranking_cols)
+)
+st.dataframe(
+    df_ranking.round(2),
+    hide_index=True,
+    use_container_width=True,
+    column_config={
+        f"{metric['label']} percentile": st.column_config.ProgressColumn(min_value=0, max_value=1, format="%.2f")
+        for metric in METRICS.values()
+    }
+)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Los tests importan utils/ y dashboards/ desde la raíz del repositorio
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
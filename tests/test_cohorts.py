@@ -0,0 +1,36 @@
+import pandas as pd
+
+from utils.cohorts import SCHEMAS, TABLE_KEY_EM, canonical_startups, clean_cohort_frames
+from utils.ingest import records_frame
+
+
+def _em_frame(startups: list[str | None]) -> pd.DataFrame:
+    """Feedback de EM's cargado como en load_views (Startup categórica)"""
+    records = [{"fields": {"EM_Name": "EM", "RISK | Momentum_Score": 3} | ({"Startup": name} if name else {})}
+               for name in startups]
+    return records_frame(records, SCHEMAS[TABLE_KEY_EM])
+
+
+def test_alias_only_startup_is_renamed_after_schema():
+    df = _em_frame(["Lowerton ", "Lowerton "])
+    assert isinstance(df["Startup"].dtype, pd.CategoricalDtype)
+
+    startups = canonical_startups(df["Startup"], "Menorca 2025")
+
+    assert startups.tolist() == ["Lowerton", "Lowerton"]
+    assert list(startups.cat.categories) == ["Lowerton"]
+
+
+def test_alias_and_canonical_categories_are_merged():
+    df = _em_frame(["BondUp", "BondUP", "Figuro", None])
+
+    startups = canonical_startups(df["Startup"], "Mexico 2025")
+
+    assert startups.iloc[:3].tolist() == ["BondUP", "BondUP", "Figuro"]
+    assert pd.isna(startups.iloc[3])
+    assert sorted(startups.cat.categories) == ["BondUP", "Figuro"]
+
+
+def test_clean_cohort_frames_with_alias_only_data():
+    em_df, dd_df = clean_cohort_frames("Menorca 2025", _em_frame(["Lowerton "]), pd.DataFrame())
+    assert em_df["Startup"].tolist() == ["Lowerton"]
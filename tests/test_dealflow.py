@@ -0,0 +1,27 @@
+import pandas as pd
+
+from utils.dealflow import week_references
+
+WEEK = pd.Timestamp("2026-10-12")
+
+
+def test_week_references_counts_deals_sourced_that_week():
+    df = pd.DataFrame({
+        "Date Sourced": ["2026-10-12", "2026-10-18T22:00:00.000Z", "2026-10-11", "2026-10-14", "garbage", None, "2026-10-13"],
+        "Reference": [["Ana"], " Ana ", "Ana", "Bea", "Bea", "Bea", None],
+        "Reference Other": ["Demo day", None, None, ["Intro", "x"], None, None, "Lost"],
+    })
+
+    refs = week_references(df, "Date Sourced", "Reference", "Reference Other", WEEK)
+
+    assert refs.index.tolist() == ["Ana", "Bea"]
+    assert refs["count"].tolist() == [2, 1]
+    assert refs["details"].tolist() == [["Demo day"], ["Intro"]]
+
+
+def test_week_references_without_detail_column_or_deals():
+    df = pd.DataFrame({"Date Sourced": ["2026-10-01"], "Reference": ["Ana"]})
+
+    assert week_references(df, "Date Sourced", "Reference", None, WEEK).empty
+    refs = week_references(df, "Date Sourced", "Reference", None, "2026-09-28")
+    assert refs.to_dict("index") == {"Ana": {"count": 1, "details": []}}
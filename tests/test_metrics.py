@@ -0,0 +1,28 @@
+import pandas as pd
+
+from utils.cohorts import SCHEMAS, TABLE_KEY_DD, TABLE_KEY_EM
+from utils.ingest import records_frame
+from utils.metrics import FIELDS, startup_field_means, startup_metrics
+
+
+def _frame(table_key: str, rows: list[dict]) -> pd.DataFrame:
+    """Feedback cargado como en load_views (Startup categórica)"""
+    return records_frame([{"fields": fields} for fields in rows], SCHEMAS[table_key])
+
+
+def test_unused_startup_categories_are_not_grouped():
+    em_df = _frame(TABLE_KEY_EM, [
+        {"Startup": "Figuro", "EM_Name": "EM", "RISK | Momentum_Score": 2, "Reward | Market_Score": 4},
+        {"Startup": "Ghost", "EM_Name": "EM", "RISK | Momentum_Score": 1, "Reward | Market_Score": 1},
+    ])
+    dd_df = _frame(TABLE_KEY_DD, [{"Startup": "Figuro", FIELDS["team"][0]: 3}, {"Startup": "Ghost"}])
+    # Ghost se queda como categoría sin filas, como tras filtrar la cohorte
+    em_df, dd_df = em_df[em_df["Startup"] == "Figuro"], dd_df[dd_df["Startup"] == "Figuro"]
+    assert "Ghost" in em_df["Startup"].cat.categories
+
+    startups = startup_metrics(em_df, dd_df)
+    means, _ = startup_field_means(em_df, dd_df)
+
+    assert startups.index.tolist() == ["Figuro"]
+    assert startups.loc["Figuro", "num_feedback"] == 1
+    assert means.index.tolist() == ["Figuro"]
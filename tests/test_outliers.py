@@ -0,0 +1,27 @@
+import pandas as pd
+import pytest
+
+from utils.outliers import METRIC_COLS, cross_cohort_outliers
+
+
+def _founders(values: list[float], in_roster: list[bool]) -> pd.DataFrame:
+    """Tabla de founders de una cohorte (como build_cohort_metrics, sin las z)"""
+    names = [f"F{i}" for i in range(len(values))]
+    return pd.DataFrame({"Name": names, "Name_norm": [n.lower() for n in names], "Startup": "S",
+                         **{metric: values for metric in METRIC_COLS}, "in_roster": in_roster})
+
+
+def test_cohort_and_pooled_zscores_use_every_founder():
+    tables = {"A": _founders([1.0, 2.0, 3.0], [True, True, False]),
+              "B": _founders([10.0, 20.0], [True, True])}
+
+    df = cross_cohort_outliers(tables, threshold=1.0)
+
+    assert df[["Cohort", "Name"]].values.tolist() == [["A", "F0"], ["A", "F1"], ["B", "F0"], ["B", "F1"]]
+    # z dentro de la cohorte: A = (1, 2, 3), aunque F2 no esté en el roster
+    assert df["z_media_individual"].tolist() == pytest.approx([-1.0, 0.0, -0.7071, 0.7071], abs=1e-4)
+    # z global y percentil sobre los mismos 5 founders
+    pooled = pd.Series([1.0, 2.0, 3.0, 10.0, 20.0])
+    expected_z = ((pooled - pooled.mean()) / pooled.std())[[0, 1, 3, 4]]
+    assert df["z_pool_media_individual"].tolist() == pytest.approx(expected_z.tolist())
+    assert df["pct_media_individual"].tolist() == pytest.approx([0.2, 0.4, 0.8, 1.0])
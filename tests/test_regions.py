@@ -0,0 +1,41 @@
+import pandas as pd
+
+from utils.regions import DEFAULT_REGION, classify_location, region_counts
+
+
+def test_derived_forms_of_long_keywords_match():
+    assert classify_location("European Union") == "Europe"
+    assert classify_location("Europe-based") == "Europe"
+    assert classify_location("Americans abroad") == "Americas"
+
+
+def test_demonyms_match():
+    assert classify_location("Brazilian") == "Americas"
+    assert classify_location("Mexican founders") == "Americas"
+    assert classify_location("Chileno") == "Americas"
+    assert classify_location("Peruvian team") == "Americas"
+    assert classify_location("Spanish company") == "Europe"
+    assert classify_location("Europeans") == "Europe"
+
+
+def test_keywords_inside_unrelated_words_do_not_match():
+    assert classify_location("Perugia") == DEFAULT_REGION
+    assert classify_location("Francesca Street") == DEFAULT_REGION
+    assert classify_location("Chilena Ltd, Perugia") == "Americas"
+
+
+def test_short_keywords_need_whole_words():
+    assert classify_location("Australia") == DEFAULT_REGION
+    assert classify_location("Company in Sydney") == DEFAULT_REGION
+    assert classify_location("usage based") == DEFAULT_REGION
+    assert classify_location("Based in the US") == "Americas"
+    assert classify_location("NY, USA") == "Americas"
+
+
+def test_europe_wins_when_both_regions_match():
+    assert classify_location("Spain and Mexico") == "Europe"
+
+
+def test_region_counts_ignores_empty_cells():
+    values = pd.Series(["European Union", ["Brazil", "Chile"], None, [], "India"])
+    assert region_counts(values) == {"Europe": 1, "Americas": 1, DEFAULT_REGION: 1}
@@ -0,0 +1 @@
+"""Shared helpers for the Decelera dashboard pages."""
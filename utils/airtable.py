@@ -0,0 +1,321 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pandas as pd
+import streamlit as st
+from pyairtable import Api
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+from utils.ingest import apply_schema, records_frame
+from utils.snapshots import OFFLINE, read_snapshot, snapshot_age, write_snapshot
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+DEFAULT_CACHE_TTL = 300  # segundos, igual que el cache de Fast-tracks
+MAX_CONCURRENT_FETCHES = 8  # Airtable limita a 5 req/s por base, pyairtable reintenta los 429
+FULL_SYNC_INTERVAL = 6 * 3600  # cada cuánto la sincronización incremental hace una descarga completa
+SYNC_OVERLAP = 120  # margen (segundos) al pedir cambios, por desfases de reloj con Airtable
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_ttl() -> int:
+    """Lee el TTL del cache desde [cache] ttl en secrets.toml (si existe)"""
+    try:
+        return int(st.secrets["cache"]["ttl"])
+    except Exception:
+        return DEFAULT_CACHE_TTL
+
+
+CACHE_TTL = _cache_ttl()
+
+
+# =============================================================================
+# CARGA DE DATOS
+# =============================================================================
+
+def download_view(api_key: str, base_id: str, table_id: str, view: str, schema: dict[str, str] | None = None) -> pd.DataFrame:
+    """Descarga una vista de Airtable directamente, sin cache ni snapshots (ver utils.ingest)"""
+    records = Api(api_key).table(base_id, table_id).all(view=view)
+    return records_frame(records, schema)
+
+
+def _versioned(df: pd.DataFrame, base_id: str, table_id: str, view: str, fetched_at: float) -> pd.DataFrame:
+    """Anota en df.attrs["data_version"] de qué descarga sale el DataFrame"""
+    df.attrs["data_version"] = f"{base_id}/{table_id}/{view}@{fetched_at}"
+    return df
+
+
+_refreshing: set[tuple[str, str, str]] = set()
+_refreshed_at: dict[tuple[str, str, str], float] = {}
+_refreshing_lock = threading.Lock()
+
+
+def _refresh_token(base_id: str, table_id: str, view: str) -> float:
+    """Momento del último refresco en segundo plano de la vista (0 si no ha habido ninguno)"""
+    with _refreshing_lock:
+        return _refreshed_at.get((base_id, table_id, view), 0.0)
+
+
+def _refresh_in_background(api_key: str, base_id: str, table_id: str, view: str, schema: dict[str, str] | None = None) -> None:
+    """Descarga la vista en un hilo aparte y actualiza su snapshot (una vez por vista)"""
+    key = (base_id, table_id, view)
+    with _refreshing_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def worker() -> None:
+        try:
+            write_snapshot(download_view(api_key, base_id, table_id, view, schema), base_id, table_id, view)
+            # Cambia la clave del cache de esta vista: la siguiente ejecución ya lee el snapshot nuevo
+            with _refreshing_lock:
+                _refreshed_at[key] = time.time()
+        except Exception as e:
+            logger.warning("No se pudo refrescar el snapshot de '%s': %s", view, e)
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    threading.Thread(target=worker, name=f"refresh-{view}", daemon=True).start()
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_view(_api_key: str, base_id: str, table_id: str, view: str, schema: dict[str, str] | None = None,
+               refreshed_at: float = 0.0) -> pd.DataFrame:
+    """
+    Devuelve una vista de Airtable como DataFrame.
+
+    El cache está indexado por (base_id, table_id, view); la api key no forma
+    parte de la clave (el prefijo "_" hace que Streamlit no la hashee).
+    `refreshed_at` (ver _refresh_token) cambia cuando termina un refresco en
+    segundo plano, así que solo se invalida la vista refrescada.
+
+    Si existe un snapshot en disco se sirve directamente y, si es más antiguo
+    que el TTL, se refresca en segundo plano. Sin snapshot se descarga de
+    Airtable y se guarda. En modo offline solo se usan los snapshots.
+
+    En df.attrs["data_version"] va un identificador de la descarga (cambia
+    cuando el snapshot se refresca), para cachear tablas derivadas sin
+    hashear el DataFrame.
+
+    Los valores especiales de Airtable llegan ya como NaN y las columnas con
+    el tipo de `schema`, tanto si vienen de Airtable como del snapshot.
+    """
+    snapshot = read_snapshot(base_id, table_id, view)
+
+    if OFFLINE:
+        if snapshot is None:
+            raise FileNotFoundError(f"No hay snapshot de la vista '{view}' y el modo offline está activo")
+        df, meta = snapshot
+        return _versioned(apply_schema(df, schema), base_id, table_id, view, meta.get("fetched_at", 0))
+
+    if snapshot is not None:
+        df, meta = snapshot
+        if snapshot_age(meta) >= CACHE_TTL:
+            _refresh_in_background(_api_key, base_id, table_id, view, schema)
+        return _versioned(apply_schema(df, schema), base_id, table_id, view, meta.get("fetched_at", 0))
+
+    df = _versioned(download_view(_api_key, base_id, table_id, view, schema), base_id, table_id, view, time.time())
+    try:
+        write_snapshot(df, base_id, table_id, view)
+    except Exception as e:
+        logger.warning("No se pudo guardar el snapshot de '%s': %s", view, e)
+    return df
+
+
+def load_view(section: str, table_key: str, view: str, schema: dict[str, str] | None = None) -> pd.DataFrame:
+    """
+    Carga una vista usando las credenciales de una sección de secrets.toml.
+
+    Args:
+        section: Sección de secrets (p.ej. "airtable_mexico_investment")
+        table_key: Clave del id de la tabla dentro de la sección (p.ej. "table_id_em")
+        view: Nombre de la vista de Airtable (p.ej. "Mexico 2025")
+        schema: Esquema de la tabla, campo -> tipo (ver utils.ingest)
+
+    Returns:
+        DataFrame con los campos de los registros de la vista
+    """
+    config = st.secrets[section]
+    base_id, table_id = config["base_id"], config[table_key]
+    return fetch_view(config["api_key"], base_id, table_id, view, schema, _refresh_token(base_id, table_id, view))
+
+
+def load_views(section: str, views: dict[str, tuple[str, str]],
+               schemas: dict[str, dict[str, str]] | None = None) -> tuple[dict[str, pd.DataFrame], dict[str, Exception]]:
+    """
+    Carga varias vistas de la misma sección en paralelo.
+
+    Las peticiones son independientes, así que el tiempo total lo marca la
+    vista más lenta y no la suma de todas.
+
+    Args:
+        section: Sección de secrets (p.ej. "airtable_mexico_investment")
+        views: Diccionario nombre -> (clave de la tabla, vista), p.ej.
+            {"team": ("table_id_team", "Mexico 2025"), "em": ("table_id_em", "Mexico 2025")}
+        schemas: Esquema de cada tabla, clave de la tabla -> (campo -> tipo).
+            Las tablas sin esquema llegan con los tipos que infiere pandas
+
+    Returns:
+        Tupla (dataframes, errores). Las vistas que fallan se devuelven como
+        DataFrame vacío y su excepción queda en errores con el mismo nombre.
+    """
+    config = st.secrets[section]
+    ctx = get_script_run_ctx()
+
+    def attach_ctx() -> None:
+        # Así los hilos comparten el contexto de la sesión y el cache no avisa
+        add_script_run_ctx(threading.current_thread(), ctx)
+
+    frames: dict[str, pd.DataFrame] = {}
+    errors: dict[str, Exception] = {}
+
+    workers = max(1, min(MAX_CONCURRENT_FETCHES, len(views)))
+    with ThreadPoolExecutor(max_workers=workers, initializer=attach_ctx) as executor:
+        futures = {
+            name: executor.submit(fetch_view, config["api_key"], config["base_id"], config[table_key], view,
+                                  (schemas or {}).get(table_key),
+                                  _refresh_token(config["base_id"], config[table_key], view))
+            for name, (table_key, view) in views.items()
+        }
+        for name, future in futures.items():
+            try:
+                frames[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+                frames[name] = pd.DataFrame()
+
+    return frames, errors
+
+
+# =============================================================================
+# SINCRONIZACIÓN INCREMENTAL
+# =============================================================================
+
+def download_records(api_key: str, base_id: str, table_id: str, view: str, formula: str | None = None) -> pd.DataFrame:
+    """Descarga los registros de una vista (opcionalmente filtrados) indexados por su record id"""
+    options = {"view": view}
+    if formula:
+        options["formula"] = formula
+    records = Api(api_key).table(base_id, table_id).all(**options)
+    return records_frame(records, index=pd.Index([record["id"] for record in records], name="record_id"))
+
+
+def modified_since_formula(since: float, modified_field: str | None = None) -> str:
+    """
+    Fórmula de Airtable que filtra los registros modificados después de `since`.
+
+    Sin `modified_field` se usa LAST_MODIFIED_TIME(), que cubre cualquier campo.
+    """
+    stamp = datetime.fromtimestamp(since, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+    modified = f"{{{modified_field}}}" if modified_field else "LAST_MODIFIED_TIME()"
+    return f"IS_AFTER({modified}, DATETIME_PARSE('{stamp}'))"
+
+
+@st.cache_resource(show_spinner=False)
+def _sync_state(base_id: str, table_id: str, view: str) -> dict:
+    """Estado compartido (por proceso) de la sincronización incremental de una vista"""
+    # "syncing" marca que una sesión está descargando; las demás esperan en "lock" solo si aún no hay datos
+    return {"df": None, "last_sync": 0.0, "last_full_sync": 0.0, "syncing": False, "lock": threading.Condition()}
+
+
+def sync_view(section: str, table_key: str, view: str, modified_field: str | None = None,
+              min_interval: float = CACHE_TTL, full_sync_interval: float = FULL_SYNC_INTERVAL) -> pd.DataFrame:
+    """
+    Carga una vista de forma incremental.
+
+    La primera vez (o cada `full_sync_interval` segundos) descarga la vista
+    entera; el resto de veces solo pide los registros modificados desde la
+    última sincronización y los fusiona por record id con el DataFrame
+    cacheado. Entre sincronizaciones (`min_interval`) no se llama a Airtable.
+
+    Los registros borrados o que salen de la vista sin modificarse solo
+    desaparecen en la siguiente descarga completa.
+
+    La descarga se hace fuera del lock y solo la lanza una sesión a la vez;
+    mientras tanto las demás reciben el DataFrame anterior (o esperan, si
+    todavía no hay ninguno).
+
+    Args:
+        section: Sección de secrets (p.ej. "airtable_fast_tracks")
+        table_key: Clave del id de la tabla dentro de la sección
+        view: Nombre o id de la vista de Airtable
+        modified_field: Campo "last modified time" a usar en el filtro (por
+            defecto LAST_MODIFIED_TIME())
+
+    Returns:
+        DataFrame con los campos de la vista, indexado por record id. En
+        df.attrs["data_version"] va un identificador que cambia con cada
+        sincronización que trae cambios (sirve de clave para cachear tablas
+        derivadas sin hashear el DataFrame).
+    """
+    config = st.secrets[section]
+    base_id, table_id = config["base_id"], config[table_key]
+    state = _sync_state(base_id, table_id, view)
+
+    with state["lock"]:
+        if state["df"] is None:
+            # Arrancamos desde el snapshot si lo escribió una sincronización anterior
+            snapshot = read_snapshot(base_id, table_id, view)
+            if snapshot is not None and snapshot[1].get("incremental"):
+                df, meta = snapshot
+                df.attrs["data_version"] = f"{base_id}/{table_id}/{view}@{meta['synced_at']}"
+                state.update(df=df, last_sync=meta["synced_at"], last_full_sync=meta["full_synced_at"])
+
+        if OFFLINE:
+            if state["df"] is None:
+                raise FileNotFoundError(f"No hay snapshot de la vista '{view}' y el modo offline está activo")
+            return state["df"].copy()
+
+        while True:
+            now = time.time()
+            if state["df"] is not None and (state["syncing"] or now - state["last_sync"] < min_interval):
+                return state["df"].copy()
+            if not state["syncing"]:
+                break
+            # Otra sesión está haciendo la primera descarga
+            state["lock"].wait()
+
+        state["syncing"] = True
+        full_sync = state["df"] is None or now - state["last_full_sync"] >= full_sync_interval
+        since = state["last_sync"]
+
+    try:
+        if full_sync:
+            downloaded = download_records(config["api_key"], base_id, table_id, view)
+        else:
+            formula = modified_since_formula(since - SYNC_OVERLAP, modified_field)
+            downloaded = download_records(config["api_key"], base_id, table_id, view, formula=formula)
+
+        changed = full_sync or not downloaded.empty
+        with state["lock"]:
+            if full_sync:
+                df = downloaded
+                state["last_full_sync"] = now
+            elif changed:
+                df = pd.concat([state["df"].drop(index=downloaded.index, errors="ignore"), downloaded])
+            else:
+                df = state["df"]
+            if changed:
+                df.attrs["data_version"] = f"{base_id}/{table_id}/{view}@{now}"
+            state.update(df=df, last_sync=now)
+            state["lock"].notify_all()
+
+        if changed:
+            try:
+                write_snapshot(df, base_id, table_id, view, incremental=True,
+                               synced_at=now, full_synced_at=state["last_full_sync"])
+            except Exception as e:
+                logger.warning("No se pudo guardar el snapshot de '%s': %s", view, e)
+    finally:
+        with state["lock"]:
+            state["syncing"] = False
+            state["lock"].notify_all()
+
+    return df.copy()
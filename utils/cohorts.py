@@ -0,0 +1,180 @@
+import tomllib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.airtable import load_views
+from utils.founders import founder_key
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+AIRTABLE_SECTION = "airtable_mexico_investment"     #Sección de secrets.toml con las credenciales del CRM
+TABLE_KEY_EM = "table_id_em"     #Tabla con el feedback de los EM's
+TABLE_KEY_DD = "table_id_team"      #Tabla con el feedback del equipo de los forms
+TABLE_KEY_OLBI = "table_id_olbi"      #Tabla con los formularios de Human DD (BRS, GRIT, OLBI)
+
+REGISTRY_PATH = Path(__file__).resolve().parent.parent / "config" / "cohorts.toml"
+
+# Listas de [fields] con puntuaciones de cada tabla (flags y explicaciones son texto)
+SCORE_KEYS_EM = ["risk_scores", "reward_scores"]
+SCORE_KEYS_DD = ["team", "individual", "openness_sources", "purpose_sources", "workstations"]
+
+
+# =============================================================================
+# REGISTRO DE COHORTES
+# =============================================================================
+
+def load_config(path: Path = REGISTRY_PATH) -> dict:
+    """Lee el fichero de configuración de las cohortes (config/cohorts.toml)"""
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def build_registry(config: dict) -> dict[str, dict]:
+    """
+    Prepara el registro de cohortes a partir de la configuración.
+
+    Returns:
+        Diccionario vista -> cohorte. Cada cohorte trae location, year,
+        view, title (nombre a mostrar), roster (startup -> founders), fields y labels (los globales
+        con lo que sobrescriba la cohorte), excluded_ems y los alias ya
+        preparados para traducir nombres: startup_aliases (nombre exacto ->
+        canónico) y founder_aliases (founder_key -> nombre canónico).
+    """
+    registry = {}
+    for view, cohort in config.get("cohorts", {}).items():
+        registry[view] = {
+            "location": cohort["location"],
+            "year": str(cohort["year"]),
+            "view": view,
+            "title": cohort.get("title", view),
+            "roster": cohort.get("startups", {}),
+            "fields": {**config.get("fields", {}), **cohort.get("fields", {})},
+            "labels": {**config.get("labels", {}), **cohort.get("labels", {})},
+            "excluded_ems": cohort.get("excluded_ems", []),
+            "startup_aliases": cohort.get("startup_aliases", {}),
+            "founder_aliases": {
+                founder_key(alias): canonical
+                for alias, canonical in cohort.get("founder_aliases", {}).items()
+            },
+        }
+    return registry
+
+
+# Se lee una vez por proceso, al importar el módulo
+_config = load_config()
+
+FIELDS = _config.get("fields", {})     #Campos comunes a todas las cohortes
+LABELS = _config.get("labels", {})
+COHORTS = build_registry(_config)
+COHORT_ROSTERS = {view: cohort["roster"] for view, cohort in COHORTS.items()}
+
+
+
+def score_fields(keys: list[str]) -> list[str]:
+    """Campos de puntuación de las listas `keys` de todas las cohortes, sin repetir"""
+    return list(dict.fromkeys(
+        field for cohort in COHORTS.values() for key in keys for field in cohort["fields"].get(key, [])
+    ))
+
+
+# Esquema de cada tabla (ver utils.ingest.apply_schema): se aplica una vez al cargar las vistas
+SCHEMAS = {
+    TABLE_KEY_EM: {
+        **dict.fromkeys(score_fields(SCORE_KEYS_EM), "float32"),
+        "Startup": "category",
+        "EM_Name": "category",
+    },
+    TABLE_KEY_DD: {
+        **dict.fromkeys(score_fields(SCORE_KEYS_DD), "float32"),
+        "Startup": "category",
+    },
+}
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def canonical_startups(values: pd.Series, cohort: str) -> pd.Series:
+    """Traduce los alias de startup de la cohorte a su nombre canónico"""
+    aliases = COHORTS.get(cohort, {}).get("startup_aliases", {})
+    if not aliases:
+        return values
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        return values.replace(aliases)
+
+    # Startup es categórica (SCHEMAS): se traducen las categorías y los alias
+    # de un mismo nombre se fusionan en una sola, sin tocar las filas
+    renamed = [aliases.get(name, name) for name in values.cat.categories]
+    categories = list(dict.fromkeys(renamed))
+    positions = np.array([categories.index(name) for name in renamed] + [-1])
+    codes = positions[values.cat.codes.to_numpy()]   # el código -1 (NaN) cae en el último, que sigue siendo -1
+    return pd.Series(pd.Categorical.from_codes(codes, categories), index=values.index, name=values.name)
+
+
+def canonical_founders(values: pd.Series, cohort: str) -> pd.Series:
+    """Traduce los alias de founder de la cohorte a su nombre canónico"""
+    aliases = COHORTS.get(cohort, {}).get("founder_aliases", {})
+    if not aliases:
+        return values
+    return values.map(lambda name: aliases.get(founder_key(name), name) if isinstance(name, str) else name)
+
+
+def clean_cohort_frames(cohort: str, em_df: pd.DataFrame, dd_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Limpia el feedback de una cohorte: fuera el feedback de los EM's
+    excluidos y alias de startups y founders traducidos a su nombre
+    canónico. Los valores especiales de Airtable ya llegan como NaN
+    (utils.ingest).
+    """
+    excluded = tuple(COHORTS.get(cohort, {}).get("excluded_ems", []))
+    if excluded and "EM_Name" in em_df.columns:
+        # EM_Name es categórica: la función se evalúa una vez por EM, no por fila
+        is_excluded = em_df["EM_Name"].map(lambda name: isinstance(name, str) and name.startswith(excluded))
+        em_df = em_df[~is_excluded.astype(bool)]
+
+    if "Startup" in em_df.columns:
+        em_df = em_df.assign(Startup=canonical_startups(em_df["Startup"], cohort))
+    if "Startup" in dd_df.columns:
+        dd_df = dd_df.assign(Startup=canonical_startups(dd_df["Startup"], cohort))
+    if "Founder_str" in dd_df.columns:
+        dd_df = dd_df.assign(Founder_str=canonical_founders(dd_df["Founder_str"], cohort))
+    return em_df, dd_df
+
+
+# =============================================================================
+# CARGA DE DATOS
+# =============================================================================
+
+def load_cohort_views(cohorts: list[str] | None = None) -> tuple[dict[str, tuple[pd.DataFrame, pd.DataFrame]], dict[str, Exception]]:
+    """
+    Carga el feedback de EM's y del equipo de varias cohortes a la vez.
+
+    Todas las vistas (dos por cohorte) se piden en una sola llamada a
+    load_views, así que se descargan en paralelo. Los DataFrames llegan ya
+    tipados (SCHEMAS) pero sin el resto de la limpieza
+    (ver clean_cohort_frames) y conservan su attrs["data_version"].
+
+    Args:
+        cohorts: Vistas a cargar (por defecto todas las del registro)
+
+    Returns:
+        Tupla (frames, errores). frames va de cohorte -> (em_df, dd_df);
+        errores usa claves "<cohorte>/em" y "<cohorte>/dd".
+    """
+    if cohorts is None:
+        cohorts = list(COHORTS)
+
+    views = {}
+    for cohort in cohorts:
+        views[f"{cohort}/em"] = (TABLE_KEY_EM, cohort)
+        views[f"{cohort}/dd"] = (TABLE_KEY_DD, cohort)
+
+    loaded, errors = load_views(AIRTABLE_SECTION, views, schemas=SCHEMAS)
+
+    frames = {cohort: (loaded[f"{cohort}/em"], loaded[f"{cohort}/dd"]) for cohort in cohorts}
+    return frames, errors
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# DATOS
+# =============================================================================
+
+def scores_long(frames: dict[str, pd.DataFrame], fields: list[str]) -> pd.DataFrame:
+    """
+    Respuestas de varias cohortes en formato largo, una fila por respuesta.
+
+    Args:
+        frames: Respuestas de cada cohorte (cohorte -> DataFrame)
+        fields: Campos de puntuación (los que no existen en una cohorte se ignoran)
+
+    Returns:
+        DataFrame con cohort, field y score (sin respuestas vacías)
+    """
+    parts = []
+    for cohort, df in frames.items():
+        present = [field for field in dict.fromkeys(fields) if field in df.columns]
+        if df.empty or not present:
+            continue
+        parts.append(df[present].melt(var_name="field", value_name="score").assign(cohort=cohort))
+
+    if not parts:
+        return pd.DataFrame({"cohort": pd.Series(dtype=object), "field": pd.Series(dtype=object),
+                             "score": pd.Series(dtype=float)})
+    return pd.concat(parts, ignore_index=True)[["cohort", "field", "score"]].dropna(subset=["score"])
+
+
+# =============================================================================
+# COMPARACIÓN
+# =============================================================================
+
+def compare_cohorts(scores: pd.DataFrame, cohorts: list[str]) -> pd.DataFrame:
+    """
+    Media, respuestas y diferencia frente a la primera cohorte de cada campo
+    y cohorte, en un solo groupby.
+
+    Args:
+        scores: Respuestas en formato largo (scores_long)
+        cohorts: Cohortes a comparar; la primera es la de referencia (la
+            actual) y el resto se comparan con ella
+
+    Returns:
+        DataFrame indexado por (field, cohort) con mean (NaN sin respuestas),
+        n y delta (mean - mean de la primera cohorte). Están todas las
+        combinaciones de los campos con respuestas y las cohortes pedidas.
+    """
+    stats = (
+        scores[scores["cohort"].isin(cohorts)]
+        .groupby(["field", "cohort"], observed=True)["score"].agg(["mean", "count"])
+        .rename(columns={"count": "n"})
+    )
+    fields = stats.index.get_level_values("field").unique()
+    stats = stats.reindex(pd.MultiIndex.from_product([fields, cohorts], names=["field", "cohort"]))
+    stats["mean"] = stats["mean"].astype(float)
+    stats["n"] = stats["n"].fillna(0).astype(int)
+
+    reference = stats.loc[stats.index.get_level_values("cohort") == cohorts[0], "mean"].droplevel("cohort")
+    stats["delta"] = stats["mean"] - reference.reindex(stats.index.get_level_values("field")).to_numpy()
+    return stats
+
+
+def chart_rows(stats: pd.DataFrame, fields: list[str], labels: list[str], cohorts: list[str]) -> pd.DataFrame:
+    """
+    Filas de una gráfica de barras: los campos de `fields` con su etiqueta,
+    ordenados por la media de la primera cohorte (de mayor a menor, los NaN
+    al final).
+
+    Args:
+        stats: Comparación de las cohortes (compare_cohorts)
+        fields: Campos de la gráfica
+        labels: Etiqueta de cada campo, en el orden de `fields`
+        cohorts: Cohortes de la gráfica; la primera marca el orden
+
+    Returns:
+        DataFrame en formato largo con label, cohort, mean, n y delta, primero
+        todas las barras de la primera cohorte y después las de las demás
+    """
+    columns = pd.MultiIndex.from_product([["mean", "n", "delta"], cohorts])
+    wide = stats.unstack("cohort").reindex(index=fields, columns=columns)
+    order = np.argsort(-wide[("mean", cohorts[0])].fillna(-1).to_numpy(), kind="stable")
+    wide = wide.iloc[order]
+
+    return pd.concat([
+        pd.DataFrame({
+            "label": [labels[i] for i in order],
+            "cohort": cohort,
+            "mean": wide[("mean", cohort)].to_numpy(dtype=float),
+            "n": wide[("n", cohort)].fillna(0).to_numpy(dtype=int),
+            "delta": wide[("delta", cohort)].to_numpy(dtype=float),
+        })
+        for cohort in cohorts
+    ], ignore_index=True)
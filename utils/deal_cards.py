@@ -0,0 +1,299 @@
+import re
+
+import pandas as pd
+
+from utils.dealflow import parse_days
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+STARTUP_NAME_COLUMNS = ["Startup name", "Startup_name", "startup_name"]
+
+URGENCY_RANK = {"hot": 0, "warm": 1, "cold": 2}
+
+# Orden de las listas de tarjetas: etiqueta -> (columna, ascendente)
+CARD_SORT_OPTIONS = {
+    "Urgency": ("urgency_rank", True),
+    "Date sourced (newest)": ("sourced_at", False),
+    "Round size (largest)": ("round_size_value", False),
+    "Name": ("startup_name", True),
+}
+
+SEARCH_FIELDS = ["startup_name", "founder_name", "one_liner", "business_model", "location"]
+
+# Nombres alternativos de cada campo lógico de las tarjetas, por prioridad.
+# "{startup}" se sustituye por el nombre de la startup de cada fila.
+CARD_FIELD_PATTERNS = {
+    "founder_first_name": [
+        "PH1_founder_name_$startup",
+        "PH1_founder_name",
+        "PH1_founder_name_{startup}",
+        "founder_name",
+    ],
+    "founder_last_name": [
+        "PH1_founder_sur_name_$startup",
+        "PH1_founder_surname_$startup",
+        "PH1_founder_sur_name",
+        "PH1_founder_surname",
+        "PH1_founder_sur_name_{startup}",
+        "PH1_founder_surname_{startup}",
+        "founder_surname",
+        "founder_sur_name",
+    ],
+    "business_model": ["PH1_business_model", "Business Model", "business_model"],
+    "location": ["PH1_Constitution_Location", "Constitution_Location", "Location", "location"],
+    "stage": ["stage", "stage_$startup"],
+    "round_size": ["Round_Size", "Round Size", "round_size", "PH1_Round_Size"],
+    "current_valuation": ["PH1_current_valuation", "Current_Valuation", "Valuation"],
+    "stake": ["Stake_Formula", "Stake Formula", "stake_formula", "Stake", "PH1_Stake", "stake"],
+    "reference": ["PH1_Reference", "Reference", "reference", "PH1_reference_$startups"],
+    "reference_details": ["PH1_Reference_Details", "Reference_Details", "reference_details", "PH1_reference_other_$startups"],
+    "signals": ["Signals"],
+    "red_flags": ["redflags_summary"],
+    "green_flags": ["greenflags_summary"],
+    "deck_url": ["deck_URL", "Deck_URL", "Deck URL"],
+    "deck_attachment": ["deck_$startup", "deck_startup", "Deck"],
+    "source_date": ["date_sourced"],
+    "first_videocall": ["first_videocall_done"],
+    "responsible": ["Responsible"],
+}
+
+
+# =============================================================================
+# RESOLUCIÓN DE COLUMNAS
+# =============================================================================
+
+def resolve_card_columns(columns) -> dict[str, list[tuple[str, str | None]]]:
+    """
+    Traduce cada campo lógico de las tarjetas a las columnas reales de Airtable.
+
+    Se ejecuta una vez por carga de datos, en vez de probar todos los
+    patrones en cada tarjeta.
+
+    Returns:
+        Diccionario campo -> lista de (columna, startup). `startup` es None
+        salvo en las columnas específicas de una startup ("{startup}"), que
+        solo aplican a las filas de esa startup.
+    """
+    columns = [str(col) for col in columns]
+    present = set(columns)
+
+    name_col = next((col for col in STARTUP_NAME_COLUMNS if col in present), None)
+    if name_col is None:
+        name_col = next((col for col in columns if 'startup' in col.lower() and 'name' in col.lower()), None)
+
+    urgency_col = next((col for col in columns if col in ['Urgency', 'urgency']), None)
+    if urgency_col is None:
+        urgency_col = next((col for col in columns if 'urgency' in col.lower() and 'contact' not in col.lower()), None)
+
+    stage_col = next((col for col in columns if col in ['Stage', 'stage']), None)
+    if stage_col is None:
+        stage_col = next((col for col in columns if 'stage' in col.lower() and 'contact' not in col.lower()), None)
+
+    sourced_col = next((col for col in columns if 'date' in col.lower() and 'source' in col.lower()), None)
+    if sourced_col is None:
+        sourced_col = next((col for col in columns if col in ['Date Sourced', 'Date_Sourced', 'DateSourced']), None)
+
+    resolved = {
+        "startup_name": [(name_col, None)] if name_col else [],
+        "sourced_at": [(sourced_col, None)] if sourced_col else [],
+        "one_liner": [(col, None) for col in columns if 'one' in col.lower() and 'liner' in col.lower()],
+        "urgency": [(urgency_col, None)] if urgency_col else [],
+        "pipeline_stage": [(stage_col, None)] if stage_col else [],
+    }
+
+    for field, patterns in CARD_FIELD_PATTERNS.items():
+        static = [p for p in patterns if "{startup}" not in p]
+        entries = []
+        for pattern in patterns:
+            if "{startup}" in pattern:
+                prefix = pattern.replace("{startup}", "")
+                entries.extend(
+                    (col, col[len(prefix):]) for col in columns
+                    if col.startswith(prefix) and col not in static and col[len(prefix):]
+                )
+            elif pattern in present:
+                entries.append((pattern, None))
+        resolved[field] = entries
+
+    return resolved
+
+
+# =============================================================================
+# EXTRACCIÓN DE CAMPOS
+# =============================================================================
+
+def cell_text(value) -> str | None:
+    """
+    Texto a mostrar de una celda de Airtable; None si está vacía.
+
+    Listas (multiselect) -> primer elemento; adjuntos -> url (o nombre del
+    fichero); arrays de numpy se tratan como listas.
+    """
+    if isinstance(value, float) and pd.isna(value):
+        return None
+    if value is None:
+        return None
+
+    if not isinstance(value, (list, tuple, str, dict)) and hasattr(value, "__array__"):
+        value = value.tolist()
+
+    if isinstance(value, (list, tuple)):
+        if len(value) == 0:
+            return None
+        first = value[0]
+        if isinstance(first, dict):
+            if "url" in first:
+                return first["url"]
+            if "filename" in first:
+                return first["filename"]
+            return str(first)
+        first_str = str(first).strip()
+        return first_str if first_str and first_str.lower() != "nan" else None
+
+    value_str = str(value).strip()
+    return value_str if value_str and value_str.lower() != "nan" else None
+
+
+def _coalesce(df: pd.DataFrame, entries: list[tuple[str, str | None]], startup_names: pd.Series) -> pd.Series:
+    """Primer valor no vacío de las columnas de un campo, por fila"""
+    result = pd.Series(None, index=df.index, dtype=object)
+    for col, startup in entries:
+        values = df[col].map(cell_text).astype(object)
+        if startup is not None:
+            values = values.where(startup_names == startup)
+        result = result.where(result.notna(), values)
+    return result
+
+
+_AMOUNT = re.compile(r"(\d+(?:[.,]\d+)?)\s*([kKmM]?)")
+
+
+def parse_amount(text) -> float:
+    """
+    Importe numérico de un texto de Airtable ("500k", "€1.5M", "250.000 €").
+
+    Devuelve NaN si no hay ningún número.
+    """
+    if not isinstance(text, str):
+        return float("nan")
+    compact = re.sub(r"(?<=\d)[.,](?=\d{3}\b)", "", text)
+    match = _AMOUNT.search(compact)
+    if not match:
+        return float("nan")
+    value = float(match.group(1).replace(",", "."))
+    suffix = match.group(2).lower()
+    return value * {"k": 1e3, "m": 1e6}.get(suffix, 1)
+
+
+def _split_list(values: pd.Series, separator: str) -> pd.Series:
+    """Separa un campo de texto en una lista de líneas limpias ([] si está vacío)"""
+    return values.map(lambda v: [part.strip() for part in v.split(separator)] if isinstance(v, str) and v else [])
+
+
+def extract_card_fields(df: pd.DataFrame, resolved: dict[str, list[tuple[str, str | None]]] | None = None) -> pd.DataFrame:
+    """
+    Extrae todos los campos de las tarjetas de una vez, columna a columna.
+
+    Args:
+        df: Dealflow tal y como llega de Airtable
+        resolved: Resultado de resolve_card_columns() (se calcula si no se pasa)
+
+    Returns:
+        DataFrame con el mismo índice que `df` y una columna por campo. Los
+        campos vacíos van como "N/A" (o "" en los enlaces del deck);
+        signals, red_flags y green_flags son listas; urgency y
+        pipeline_stage van en minúsculas para filtrar las secciones. En
+        attrs["missing_fields"] quedan los campos sin columna en la vista.
+    """
+    if resolved is None:
+        resolved = resolve_card_columns(df.columns)
+
+    startup_names = _coalesce(df, resolved["startup_name"], pd.Series(None, index=df.index, dtype=object))
+    texts = {
+        field: _coalesce(df, entries, startup_names)
+        for field, entries in resolved.items()
+        if field != "startup_name"
+    }
+
+    first = texts.pop("founder_first_name").fillna("")
+    last = texts.pop("founder_last_name").fillna("")
+    founder = (first + " " + last).str.strip()
+
+    cards = pd.DataFrame(index=df.index)
+    cards["startup_name"] = startup_names.fillna("Unknown Startup")
+    cards["founder_name"] = founder.where(founder != "", "N/A")
+    for field in ["one_liner", "business_model", "location", "stage", "round_size", "current_valuation",
+                  "stake", "reference", "reference_details", "source_date", "responsible"]:
+        cards[field] = texts[field].fillna("N/A")
+
+    first_videocall = texts["first_videocall"]
+    cards["first_videocall"] = first_videocall.str.split("T").str[0].fillna("N/A")
+
+    cards["signals"] = _split_list(texts["signals"], "|")
+    cards["red_flags"] = _split_list(texts["red_flags"], "\n")
+    cards["green_flags"] = _split_list(texts["green_flags"], "\n")
+
+    cards["urgency"] = texts["urgency"].fillna("").str.lower()
+    cards["pipeline_stage"] = texts["pipeline_stage"].fillna("").str.lower()
+
+    # Claves de orden y búsqueda de las listas paginadas
+    cards["urgency_rank"] = cards["urgency"].map(URGENCY_RANK).fillna(len(URGENCY_RANK)).astype(int)
+    cards["sourced_at"] = parse_days(texts["sourced_at"])
+    cards["round_size_value"] = texts["round_size"].map(parse_amount).astype(float)
+    search_text = cards[SEARCH_FIELDS[0]].str.lower()
+    for field in SEARCH_FIELDS[1:]:
+        search_text = search_text + " " + cards[field].str.lower()
+    cards["search_text"] = search_text
+
+    cards["deck_url"] = texts["deck_url"].fillna("")
+    # cell_text ya devuelve la url del primer adjunto
+    deck_attachment = texts["deck_attachment"].fillna("")
+    cards["deck_attachment_url"] = deck_attachment.where(deck_attachment.str.startswith("http"), "")
+
+    cards.attrs["missing_fields"] = [field for field, entries in resolved.items() if not entries]
+    return cards
+
+
+# =============================================================================
+# SECCIONES
+# =============================================================================
+
+def _status_mask(values: pd.Series, status: str) -> pd.Series:
+    """Coincidencia exacta con el estado; si ninguna fila coincide, se busca como subcadena"""
+    exact = values == status
+    return exact if exact.any() else values.str.contains(status, regex=False)
+
+
+def hot_deals(cards: pd.DataFrame) -> pd.DataFrame:
+    """Tarjetas con urgencia Hot que no están en stage Killed"""
+    return cards[_status_mask(cards["urgency"], "hot") & (cards["pipeline_stage"] != "killed")]
+
+
+def qualified_deals(cards: pd.DataFrame) -> pd.DataFrame:
+    """Tarjetas en stage Qualified que no están en Killed"""
+    return cards[_status_mask(cards["pipeline_stage"], "qualified") & (cards["pipeline_stage"] != "killed")]
+
+
+# =============================================================================
+# LISTAS PAGINADAS
+# =============================================================================
+
+def search_and_sort(cards: pd.DataFrame, query: str = "", sort_by: str = "Urgency") -> pd.DataFrame:
+    """
+    Filtra las tarjetas por texto (nombre, founder, one-liner, modelo,
+    ubicación) y las ordena según CARD_SORT_OPTIONS. Los valores vacíos van
+    al final.
+    """
+    query = query.strip().lower()
+    if query:
+        cards = cards[cards["search_text"].str.contains(query, regex=False)]
+    column, ascending = CARD_SORT_OPTIONS[sort_by]
+    return cards.sort_values(column, ascending=ascending, na_position="last", kind="stable")
+
+
+def card_page(cards: pd.DataFrame, page: int, page_size: int) -> pd.DataFrame:
+    """Tarjetas de la página `page` (empezando en 1)"""
+    start = (page - 1) * page_size
+    return cards.iloc[start:start + page_size]
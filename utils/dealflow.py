@@ -0,0 +1,256 @@
+import pandas as pd
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+FUNNEL_METRICS = [
+    "New Deals",
+    "Calls",
+    "First Contact",
+    "No Response",
+    "Videocall Done",
+    "Videocall Pending",
+    "Pending Information",
+]
+
+VIDEOCALL_DONE_COL = "first_videocall_done"
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def find_funnel_columns(df: pd.DataFrame) -> dict[str, str | None]:
+    """
+    Localiza las columnas del dealflow que alimentan el funnel semanal.
+
+    Returns:
+        Diccionario con las claves "date_sourced", "contact_stage",
+        "first_contact" y "videocall_done" (None si la columna no existe)
+    """
+    columns = list(df.columns)
+
+    date_sourced = [col for col in columns if 'date' in col.lower() and 'source' in col.lower()]
+    if not date_sourced:
+        date_sourced = [col for col in columns if col in ['Date Sourced', 'Date_Sourced', 'DateSourced']]
+
+    contact_stage = [col for col in columns if 'contact' in col.lower() and 'stage' in col.lower()]
+    if not contact_stage:
+        contact_stage = [col for col in columns if col in ['Contact_Stage', 'Contact Stage', 'ContactStage']]
+
+    first_contact = [col for col in columns if 'first' in col.lower() and 'contact' in col.lower() and 'date' in col.lower()]
+    if not first_contact:
+        first_contact = [col for col in columns if col in ['Date_First_Contact', 'Date First Contact', 'First_Contact_Date', 'First Contact Date']]
+
+    return {
+        "date_sourced": date_sourced[0] if date_sourced else None,
+        "contact_stage": contact_stage[0] if contact_stage else None,
+        "first_contact": first_contact[0] if first_contact else None,
+        "videocall_done": VIDEOCALL_DONE_COL if VIDEOCALL_DONE_COL in columns else None,
+    }
+
+
+def parse_days(series: pd.Series) -> pd.Series:
+    """Convierte una columna de fechas de Airtable a días (sin hora); lo no parseable queda NaT"""
+    parsed = pd.to_datetime(series, errors="coerce", utc=True, format="mixed")
+    return parsed.dt.tz_localize(None).dt.normalize()
+
+
+def week_start(days: pd.Series | pd.DatetimeIndex):
+    """Lunes de la semana de cada día"""
+    if isinstance(days, pd.Series):
+        return days - pd.to_timedelta(days.dt.weekday, unit="D")
+    return days - pd.to_timedelta(days.weekday, unit="D")
+
+
+# =============================================================================
+# MOTOR DEL FUNNEL
+# =============================================================================
+
+def funnel_events(df: pd.DataFrame, columns: dict[str, str | None]) -> pd.DataFrame:
+    """
+    Convierte el dealflow en una tabla de eventos (metric, day).
+
+    Cada fila del dealflow aporta como mucho un evento por métrica:
+    - New Deals: día de Date Sourced
+    - Calls: día de first_videocall_done
+    - First Contact: día de Date_First_Contact
+    - Videocall Done / Pending: día de First Contact según el Contact Stage
+    - No Response / Pending Information: día de First Contact, o de Date
+      Sourced si la fila no tiene First Contact
+
+    Las fechas se parsean una sola vez por columna. Sin columnas de Date
+    Sourced y Contact Stage no se genera ningún evento.
+    """
+    empty = pd.DataFrame({"metric": pd.Series(dtype=object), "day": pd.Series(dtype="datetime64[ns]")})
+    date_col, stage_col = columns.get("date_sourced"), columns.get("contact_stage")
+    if df.empty or not date_col or not stage_col:
+        return empty
+
+    no_dates = pd.Series(pd.NaT, index=df.index, dtype="datetime64[ns]")
+
+    sourced = parse_days(df[date_col])
+    calls = parse_days(df[columns["videocall_done"]]) if columns.get("videocall_done") else no_dates
+
+    if columns.get("first_contact"):
+        contact_raw = df[columns["first_contact"]]
+        first_contact = parse_days(contact_raw)
+        has_contact = contact_raw.notna()
+    else:
+        first_contact = no_dates
+        has_contact = pd.Series(False, index=df.index)
+
+    stage = df[stage_col]
+    stage_lower = stage.astype(str).str.lower().where(stage.notna(), "")
+    videocall_done = stage_lower.str.contains("videocall done|video call done")
+    videocall_pending = ~videocall_done & stage_lower.str.contains("videocall pending|video call pending")
+    other_stage = stage.notna() & ~videocall_done & ~videocall_pending
+    status_day = first_contact.where(has_contact, sourced)
+
+    events = {
+        "New Deals": sourced,
+        "Calls": calls,
+        "First Contact": first_contact,
+        "No Response": status_day[other_stage & stage_lower.str.contains("no response")],
+        "Videocall Done": first_contact[videocall_done],
+        "Videocall Pending": first_contact[videocall_pending],
+        "Pending Information": status_day[
+            other_stage & ~stage_lower.str.contains("no response") & stage_lower.str.contains("pending information")
+        ],
+    }
+
+    frames = [
+        pd.DataFrame({"metric": metric, "day": days.dropna().astype("datetime64[ns]")})
+        for metric, days in events.items()
+    ]
+    return pd.concat(frames, ignore_index=True) if frames else empty
+
+
+def cumulative_counts(events: pd.DataFrame) -> pd.DataFrame:
+    """
+    Precalcula los conteos acumulados por día de cada métrica del funnel.
+
+    Es la única pasada sobre los eventos: a partir de esta tabla cualquier
+    rango de fechas se resuelve restando dos filas.
+
+    Returns:
+        DataFrame indexado por día (ordenado, solo días con eventos) con una
+        columna por métrica de FUNNEL_METRICS
+    """
+    daily = (
+        events.groupby(["day", "metric"])
+        .size()
+        .unstack("metric")
+        .reindex(columns=FUNNEL_METRICS)
+        .fillna(0)
+        .astype(int)
+        .sort_index()
+    )
+    return daily.cumsum()
+
+
+def _counts_until(cumulative: pd.DataFrame, days: pd.DatetimeIndex) -> pd.DataFrame:
+    """Eventos acumulados hasta cada día (incluido); 0 antes del primer evento"""
+    if cumulative.empty:
+        return pd.DataFrame(0, index=days, columns=FUNNEL_METRICS)
+    return cumulative.reindex(days, method="ffill").fillna(0).astype(int)
+
+
+def range_counts(cumulative: pd.DataFrame, start, end) -> pd.Series:
+    """Total de cada métrica entre dos fechas (ambas incluidas)"""
+    start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    bounds = _counts_until(cumulative, pd.DatetimeIndex([start - pd.Timedelta(days=1), end]))
+    return bounds.iloc[1] - bounds.iloc[0]
+
+
+def period_starts(start, end, granularity: str = "W") -> pd.DatetimeIndex:
+    """
+    Inicio de cada periodo que toca el rango [start, end].
+
+    Args:
+        granularity: "D" (días), "W" (semanas de lunes a domingo) o "M" (meses)
+    """
+    start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    if granularity == "D":
+        return pd.date_range(start, end, freq="D")
+    if granularity == "W":
+        return pd.date_range(week_start(pd.DatetimeIndex([start]))[0], end, freq="7D")
+    if granularity == "M":
+        return pd.date_range(start.replace(day=1), end, freq="MS")
+    raise ValueError(f"Granularidad no soportada: {granularity}")
+
+
+def funnel_by_period(cumulative: pd.DataFrame, start, end, granularity: str = "W") -> pd.DataFrame:
+    """
+    Conteos del funnel por periodo para cualquier rango de fechas.
+
+    Cada periodo se resuelve con los acumulados de sus extremos, así que el
+    coste depende del número de periodos y no del número de leads. El primer
+    y el último periodo se recortan al rango pedido.
+
+    Args:
+        cumulative: Tabla de cumulative_counts()
+        start: Primer día del rango
+        end: Último día del rango (incluido)
+        granularity: "D", "W" o "M"
+
+    Returns:
+        DataFrame indexado por el inicio de cada periodo con una columna por
+        métrica de FUNNEL_METRICS
+    """
+    start, end = pd.Timestamp(start).normalize(), pd.Timestamp(end).normalize()
+    starts = period_starts(start, end, granularity)
+    if starts.empty:
+        return pd.DataFrame(columns=FUNNEL_METRICS, dtype=int)
+
+    ends = starts[1:] - pd.Timedelta(days=1)
+    ends = ends.append(pd.DatetimeIndex([end]))
+    lower = starts.where(starts > start, start) - pd.Timedelta(days=1)
+
+    until_end = _counts_until(cumulative, ends)
+    until_lower = _counts_until(cumulative, lower)
+    return pd.DataFrame(until_end.values - until_lower.values, index=starts, columns=FUNNEL_METRICS)
+
+
+# =============================================================================
+# REFERENCIAS
+# =============================================================================
+
+def first_text(values: pd.Series) -> pd.Series:
+    """Texto de cada celda (de las listas de Airtable, el primer elemento); "" si está vacía"""
+    first = values.map(lambda value: (value[0] if len(value) else None) if isinstance(value, (list, tuple)) else value)
+    return first.astype(object).where(first.notna(), "").astype(str).str.strip()
+
+
+def week_references(df: pd.DataFrame, date_col: str, reference_col: str, reference_other_col: str | None,
+                    week) -> pd.DataFrame:
+    """
+    Quién ha referenciado los deals sourced en una semana.
+
+    Usa las mismas fechas y semanas que el funnel (parse_days, week_start),
+    sin recorrer el DataFrame fila a fila.
+
+    Args:
+        df: Dealflow
+        date_col: Columna de Date Sourced
+        reference_col: Referencia principal
+        reference_other_col: Detalle de la referencia (opcional)
+        week: Lunes de la semana
+
+    Returns:
+        DataFrame indexado por referencia con count (deals) y details (lista
+        ordenada de los detalles distintos), de más a menos deals
+    """
+    in_week = week_start(parse_days(df[date_col])) == pd.Timestamp(week).normalize()
+    references = first_text(df.loc[in_week, reference_col])
+    details = (first_text(df.loc[in_week, reference_other_col]) if reference_other_col
+               else pd.Series("", index=references.index))
+
+    rows = pd.DataFrame({"reference": references, "detail": details})
+    rows = rows[rows["reference"] != ""]
+    grouped = rows.groupby("reference", sort=False)
+    return pd.DataFrame({
+        "count": grouped.size(),
+        "details": grouped["detail"].agg(lambda values: sorted(set(values) - {""})),
+    }).sort_values("count", ascending=False, kind="stable")
@@ -0,0 +1,65 @@
+from functools import lru_cache
+
+import pandas as pd
+
+from utils.regions import fold_text
+
+# =============================================================================
+# NORMALIZACIÓN DE NOMBRES
+# =============================================================================
+
+@lru_cache(maxsize=4096)
+def _normalize(name: str) -> str:
+    folded = fold_text(name).replace("\u200b", " ")
+    return " ".join(folded.split())
+
+
+def normalize_name(s: str) -> str:
+    """
+    Normaliza nombres eliminando acentos y estandarizando formato.
+
+    Se memoiza por nombre: los mismos founders se repiten en cada formulario.
+    """
+    if not isinstance(s, str):
+        return ""
+    return _normalize(s)
+
+
+def founder_key(name: str) -> str:
+    """
+    Clave de identidad de un founder: nombre normalizado y sin espacios.
+
+    Así "Juan Pablo  Merea Otermin", "JuanPablo Merea Otermin" y
+    "Juan Pablo Merea Otermín" son la misma persona.
+    """
+    return normalize_name(name).replace(" ", "")
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """normalize_name sobre una columna (memoizado: cada nombre distinto se normaliza una vez)"""
+    return names.map(normalize_name)
+
+
+# =============================================================================
+# ÍNDICE DE FOUNDERS
+# =============================================================================
+
+def founder_index(names: pd.Series) -> dict[str, pd.Index]:
+    """
+    Índice clave de founder -> filas, construido una vez por carga.
+
+    Args:
+        names: Columna con el nombre del founder (p.ej. df_team["Founder_str"])
+
+    Returns:
+        Diccionario founder_key -> etiquetas del índice de sus filas (las
+        celdas vacías no se indexan)
+    """
+    keys = names.map(founder_key)
+    keys = keys[keys != ""]
+    return keys.groupby(keys).groups
+
+
+def founder_rows(df: pd.DataFrame, index: dict[str, pd.Index], name: str) -> pd.DataFrame:
+    """Filas de `df` de un founder usando su índice (vacío si no tiene ninguna)"""
+    return df.loc[index.get(founder_key(name), df.index[:0])]
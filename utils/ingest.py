@@ -0,0 +1,105 @@
+import pandas as pd
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+SPECIAL_VALUE_KEY = "specialValue"     #Airtable devuelve {"specialValue": "NaN"} (o Infinity) en fórmulas sin resultado
+OPTION_SEPARATOR = ":"     #Columnas indicadoras de los multiselect: "<campo>:<opción>" (p.ej. "Guest_type:EM")
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def is_special_value(value) -> bool:
+    """Si el valor es un {"specialValue": ...} de Airtable"""
+    return isinstance(value, dict) and SPECIAL_VALUE_KEY in value
+
+
+def clean_fields(fields: dict) -> dict:
+    """
+    Campos de un registro sin los valores especiales de Airtable.
+
+    Un campo que falta acaba como NaN al construir el DataFrame, así que
+    basta con no copiarlo.
+    """
+    return {name: value for name, value in fields.items() if not is_special_value(value)}
+
+
+def _is_label_column(column: pd.Series) -> bool:
+    """Si todos los valores son texto (los multiselect y lookups, que llegan como listas, no se codifican)"""
+    return pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty")
+
+
+def option_column(field: str, option: str) -> str:
+    """Nombre de la columna indicadora de una opción de un multiselect"""
+    return f"{field}{OPTION_SEPARATOR}{option}"
+
+
+def option_indicators(values: pd.Series) -> pd.DataFrame:
+    """
+    Una columna booleana por opción de un multiselect (option_column).
+
+    Los valores pueden ser listas o texto suelto (registros antiguos); se
+    despliegan una sola vez y cada fila queda marcada en las opciones que
+    tiene.
+    """
+    options = values.explode().dropna()
+    options = options[options.map(type).eq(str)]
+    indicators = pd.get_dummies(options, prefix=values.name, prefix_sep=OPTION_SEPARATOR, dtype=bool)
+    return indicators.groupby(level=0, sort=False).any().reindex(values.index, fill_value=False)
+
+
+def apply_schema(df: pd.DataFrame, schema: dict[str, str] | None = None) -> pd.DataFrame:
+    """
+    Aplica el esquema declarado de una tabla (campo -> tipo) a sus columnas.
+
+    Tipos admitidos: "float32" (puntuaciones), "category" (etiquetas como
+    Startup o EM_Name), "datetime64[ns]" (fechas) y "multiselect" (se
+    añade una columna booleana por opción, ver option_indicators, y el campo
+    original se conserva). Los campos que no existen en la vista se ignoran
+    y los que ya tienen el tipo no se tocan, así que se puede aplicar de
+    nuevo a un snapshot (las columnas indicadoras se rehacen).
+    """
+    for field, dtype in (schema or {}).items():
+        if field not in df.columns:
+            continue
+        if dtype == "multiselect":
+            indicators = option_indicators(df[field])
+            df = df.drop(columns=[col for col in indicators.columns if col in df.columns]).join(indicators)
+        elif df[field].dtype == dtype:
+            continue
+        elif dtype == "category":
+            if _is_label_column(df[field]):
+                df[field] = df[field].astype("category")
+        elif dtype.startswith("datetime64"):
+            df[field] = pd.to_datetime(df[field], errors="coerce", utc=True).dt.tz_localize(None).astype(dtype)
+        else:
+            df[field] = pd.to_numeric(df[field], errors="coerce").astype(dtype)
+    return df
+
+
+# =============================================================================
+# INGESTA
+# =============================================================================
+
+def records_frame(records: list[dict], schema: dict[str, str] | None = None, index: pd.Index | None = None) -> pd.DataFrame:
+    """
+    Convierte los registros de Airtable en un DataFrame limpio.
+
+    Los valores especiales se quitan registro a registro al copiar
+    record["fields"] y después se aplica el esquema de la tabla, así que las
+    páginas reciben columnas ya tipadas y no hace falta recorrer el DataFrame
+    celda a celda ni volver a convertir las puntuaciones después.
+
+    Args:
+        records: Registros tal como los devuelve pyairtable
+        schema: Esquema de la tabla, campo -> tipo (ver apply_schema)
+        index: Índice del DataFrame (p.ej. los record id)
+
+    Returns:
+        DataFrame con una fila por registro y una columna por campo
+    """
+    df = pd.DataFrame([clean_fields(record["fields"]) for record in records], index=index)
+    return apply_schema(df, schema)
@@ -0,0 +1,300 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from utils.airtable import CACHE_TTL
+from utils.cohorts import COHORT_ROSTERS, COHORTS, FIELDS, clean_cohort_frames, load_cohort_views
+from utils.founders import founder_key, normalize_name
+from utils.outliers import METRIC_COLS, add_combined_scores, add_zscores, founder_metrics
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+# Campos con las bonus stars y red flags de cada founder
+UNCONVENTIONAL_FIELDS = [
+    "Talks | Unconventional thinking (Individual)",
+    "Workstations | Unconventional thinking (Individual)",
+    "Founder arena | Unconventional thinking (Individual)",
+]
+
+RISK_INVERT = 5     # risk se muestra invertido: 5 - puntuación
+REWARD_TARGET = 4   # la distancia se mide a (risk=0, reward=4)
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def risk_reward_scores(em_df: pd.DataFrame, fields: dict[str, list[str]] = FIELDS) -> pd.DataFrame:
+    """
+    Puntuaciones de risk y reward del feedback de los EM's (float32 desde la carga).
+
+    Un 0 es una puntuación sin rellenar y queda como NaN; risk se invierte
+    después (5 - puntuación) para que menos sea mejor.
+    """
+    risk, reward = fields["risk_scores"], fields["reward_scores"]
+    scores = em_df.reindex(columns=risk + reward).replace(0, np.nan)
+    scores[risk] = RISK_INVERT - scores[risk]
+    return scores
+
+
+def _field_means(df: pd.DataFrame, columns: list[str], by: str) -> pd.Series:
+    """Media de las medias de cada campo por grupo (como en las tarjetas de las páginas)"""
+    present = [c for c in columns if c in df.columns]
+    if not present or by not in df.columns:
+        return pd.Series(dtype=float)
+    return df[present].groupby(df[by], observed=True).mean().mean(axis=1)
+
+
+def _logo_url(logo_data) -> str:
+    """Url del primer adjunto del campo de logo ("" si no hay)"""
+    if isinstance(logo_data, list) and len(logo_data) > 0 and 'url' in logo_data[0]:
+        return logo_data[0]['url']
+    return ""
+
+
+def _overall_field_mean(df: pd.DataFrame, columns: list[str]) -> float:
+    """Media de las medias de cada campo sobre todas las filas"""
+    present = [c for c in columns if c in df.columns]
+    if not present:
+        return float("nan")
+    return df[present].mean().mean()
+
+
+# =============================================================================
+# MATERIALIZACIÓN
+# =============================================================================
+
+def startup_field_means(em_df: pd.DataFrame, dd_df: pd.DataFrame, fields: dict[str, list[str]] = FIELDS) -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Matriz startup × campo con la media de cada campo (Feedback Details).
+
+    Las puntuaciones de risk/reward sin rellenar (0) quedan como NaN y no se
+    invierten. Los campos que no existen en la vista quedan como columna vacía.
+
+    Args:
+        em_df: Feedback de los EM's ya limpio
+        dd_df: Feedback del equipo ya limpio y con Openness/Purpose
+        fields: Campos de la cohorte (registro de cohortes)
+
+    Returns:
+        Tupla (medias por startup indexadas por Startup, medias de toda la
+        cohorte por campo)
+    """
+    em_cols = list(dict.fromkeys(fields["risk_scores"] + fields["reward_scores"]))
+    dd_cols = list(dict.fromkeys(fields["workstations"] + fields["team"] + fields["individual"]))
+
+    em_values = em_df.reindex(columns=em_cols).replace(0, np.nan)
+    dd_values = dd_df.reindex(columns=dd_cols)
+
+    em_startup = em_df["Startup"] if "Startup" in em_df.columns else pd.Series(np.nan, index=em_df.index)
+    dd_startup = dd_df["Startup"] if "Startup" in dd_df.columns else pd.Series(np.nan, index=dd_df.index)
+
+    startups = pd.concat([
+        em_values.groupby(em_startup.rename("Startup"), observed=True).mean(),
+        dd_values.groupby(dd_startup.rename("Startup"), observed=True).mean(),
+    ], axis=1)
+    totals = pd.concat([em_values.mean(), dd_values.mean()])
+    return startups, totals
+
+
+def startup_metrics(em_df: pd.DataFrame, dd_df: pd.DataFrame, fields: dict[str, list[str]] = FIELDS) -> pd.DataFrame:
+    """
+    Métricas por startup de una cohorte.
+
+    Args:
+        em_df: Feedback de los EM's ya limpio
+        dd_df: Feedback del equipo ya limpio y con Openness/Purpose
+        fields: Campos de la cohorte (registro de cohortes)
+
+    Returns:
+        DataFrame indexado por Startup con risk_mean, reward_mean, Distance,
+        num_feedback (feedback de EM's recibido), individual_mean,
+        team_mean (media de las medias de cada campo) y logo_url
+    """
+    startups = pd.DataFrame(
+        columns=["risk_mean", "reward_mean", "Distance", "num_feedback"],
+        index=pd.Index([], name="Startup"),
+        dtype=float
+    )
+
+    if "Startup" in em_df.columns and not em_df.empty:
+        risk, reward = fields["risk_scores"], fields["reward_scores"]
+        scores = risk_reward_scores(em_df, fields)
+        # Suma y número de puntuaciones por startup en un solo groupby; la
+        # media de todas las puntuaciones equivale a stack().mean() por startup
+        by_startup = pd.DataFrame({
+            "risk_sum": scores[risk].sum(axis=1), "risk_count": scores[risk].count(axis=1),
+            "reward_sum": scores[reward].sum(axis=1), "reward_count": scores[reward].count(axis=1),
+        }).groupby(em_df["Startup"], observed=True).sum()
+        startups = pd.DataFrame({
+            "risk_mean": by_startup["risk_sum"] / by_startup["risk_count"],
+            "reward_mean": by_startup["reward_sum"] / by_startup["reward_count"],
+        })
+        startups["Distance"] = np.sqrt(startups["risk_mean"] ** 2 + (REWARD_TARGET - startups["reward_mean"]) ** 2)
+        startups["num_feedback"] = em_df.groupby("Startup", observed=True).size()
+
+    startups = startups.join(
+        pd.DataFrame({
+            "individual_mean": _field_means(dd_df, fields["individual"], "Startup"),
+            "team_mean": _field_means(dd_df, fields["team"], "Startup"),
+        }),
+        how="outer"
+    )
+
+    if "original logo" in dd_df.columns and "Startup" in dd_df.columns:
+        logos = dd_df.drop_duplicates(subset=["Startup"], keep="first").set_index("Startup")["original logo"]
+        startups["logo_url"] = logos.map(_logo_url).reindex(startups.index).fillna("")
+    else:
+        startups["logo_url"] = ""
+    startups.index.name = "Startup"
+    return startups
+
+
+def founder_field_means(dd_df: pd.DataFrame, fields: dict[str, list[str]] = FIELDS) -> pd.DataFrame:
+    """
+    Matriz founder × campo individual (Feedback Details).
+
+    Args:
+        dd_df: Feedback del equipo ya limpio y con Openness/Purpose
+        fields: Campos de la cohorte (registro de cohortes)
+
+    Returns:
+        DataFrame indexado por founder_key con la media de cada campo
+        individual, bonus_stars y red_flags (valores de Unconventional
+        thinking). Las filas sin founder no se incluyen.
+    """
+    names = dd_df["Founder_str"] if "Founder_str" in dd_df.columns else pd.Series("", index=dd_df.index)
+    keys = names.fillna("").astype(str).map(founder_key).rename("Founder")
+
+    founders = dd_df.reindex(columns=fields["individual"]).groupby(keys, observed=True).mean()
+
+    unconventional = dd_df.reindex(columns=UNCONVENTIONAL_FIELDS)
+    founders["bonus_stars"] = (unconventional == "Bonus star").sum(axis=1).groupby(keys, observed=True).sum()
+    founders["red_flags"] = (unconventional == "Red flag").sum(axis=1).groupby(keys, observed=True).sum()
+    return founders.drop(index="", errors="ignore")
+
+
+def risk_reward_ranking(startups: pd.DataFrame, totals: pd.Series, roster: dict[str, list[str]]) -> pd.DataFrame:
+    """
+    Ranking de la matriz Risk-Reward.
+
+    Args:
+        startups: startup_metrics() de la cohorte
+        totals: Medias de toda la cohorte (individual_mean, team_mean)
+        roster: Roster startup -> founders de la cohorte
+
+    Returns:
+        Startups del roster con feedback de los EM's ordenadas por Distance
+        (la más cercana a risk=0, reward=4 primero), con Startup como
+        columna e individual_delta / team_delta frente a la cohorte
+    """
+    ranking = startups[startups.index.isin(list(roster)) & startups["num_feedback"].notna()]
+    ranking = ranking.assign(
+        individual_delta=ranking["individual_mean"] - totals["individual_mean"],
+        team_delta=ranking["team_mean"] - totals["team_mean"],
+    )
+    return ranking.sort_values(by="Distance").reset_index()
+
+
+def build_cohort_metrics(cohort: str, em_df: pd.DataFrame, dd_df: pd.DataFrame) -> dict:
+    """
+    Calcula de una vez las tablas de métricas canónicas de una cohorte.
+
+    Args:
+        cohort: Nombre de la cohorte (vista de Airtable)
+        em_df: Feedback de los EM's tal y como llega de Airtable
+        dd_df: Feedback del equipo tal y como llega de Airtable
+
+    Returns:
+        Diccionario con:
+        - "founders": founder_metrics() con las z dentro de la cohorte e
+          in_roster (si el founder está en el roster de la cohorte)
+        - "startups": startup_metrics()
+        - "totals": medias de toda la cohorte (individual_mean, team_mean)
+        - "field_means" / "field_totals": startup_field_means(), la media de cada
+          campo por startup y de toda la cohorte
+        - "founder_means": founder_field_means()
+        - "ranking": risk_reward_ranking()
+    """
+    em_df, dd_df = clean_cohort_frames(cohort, em_df, dd_df)
+    roster = COHORT_ROSTERS.get(cohort, {})
+    fields = COHORTS[cohort]["fields"] if cohort in COHORTS else FIELDS
+
+    founders = founder_metrics(em_df, dd_df, roster, fields)
+    founders = add_zscores(founders, METRIC_COLS)
+    roster_names = {normalize_name(person) for people in roster.values() for person in people}
+    founders["in_roster"] = founders["Name_norm"].isin(roster_names)
+
+    dd_scores = add_combined_scores(dd_df.copy(), fields)
+    totals = pd.Series({
+        "individual_mean": _overall_field_mean(dd_scores, fields["individual"]),
+        "team_mean": _overall_field_mean(dd_scores, fields["team"]),
+    })
+
+    field_means, field_totals = startup_field_means(em_df, dd_scores, fields)
+    startups = startup_metrics(em_df, dd_scores, fields)
+
+    return {
+        "founders": founders,
+        "startups": startups,
+        "totals": totals,
+        "field_means": field_means,
+        "field_totals": field_totals,
+        "founder_means": founder_field_means(dd_scores, fields),
+        "ranking": risk_reward_ranking(startups, totals, roster),
+    }
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=32)
+def _cached_cohort_frames(_em_df: pd.DataFrame, _dd_df: pd.DataFrame, cohort: str, data_version: tuple[str, str]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """clean_cohort_frames cacheado por la versión de los datos"""
+    return clean_cohort_frames(cohort, _em_df, _dd_df)
+
+
+def cohort_frames(cohort: str, em_df: pd.DataFrame, dd_df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Feedback de EM's y del equipo de una cohorte ya limpio, una vez por refresco.
+
+    Cada llamada devuelve su propia copia, así que las páginas pueden
+    añadir columnas sin afectar a otras sesiones.
+    """
+    versions = (em_df.attrs.get("data_version"), dd_df.attrs.get("data_version"))
+    if None in versions:
+        return clean_cohort_frames(cohort, em_df, dd_df)
+    return _cached_cohort_frames(em_df, dd_df, cohort, versions)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False, max_entries=32)
+def _cached_cohort_metrics(_em_df: pd.DataFrame, _dd_df: pd.DataFrame, cohort: str, data_version: tuple[str, str]) -> dict:
+    """build_cohort_metrics cacheado por la versión de los datos (no se hashean los DataFrames)"""
+    return build_cohort_metrics(cohort, _em_df, _dd_df)
+
+
+def cohort_metrics(cohort: str, em_df: pd.DataFrame, dd_df: pd.DataFrame) -> dict:
+    """
+    Tablas de métricas de una cohorte, materializadas una vez por refresco.
+
+    Se guardan en el cache compartido de Streamlit con la clave
+    (cohorte, data_version de cada vista): mientras los datos no cambian
+    todas las páginas y sesiones leen las mismas tablas; cuando un snapshot
+    se refresca, la siguiente lectura las recalcula.
+    """
+    versions = (em_df.attrs.get("data_version"), dd_df.attrs.get("data_version"))
+    if None in versions:
+        return build_cohort_metrics(cohort, em_df, dd_df)
+    return _cached_cohort_metrics(em_df, dd_df, cohort, versions)
+
+
+def load_cohort_metrics(cohort: str) -> tuple[dict, dict[str, Exception]]:
+    """
+    Carga las vistas de una cohorte y devuelve sus tablas de métricas.
+
+    Returns:
+        Tupla (métricas, errores) con el formato de cohort_metrics() y
+        load_cohort_views()
+    """
+    frames, errors = load_cohort_views([cohort])
+    em_df, dd_df = frames[cohort]
+    return cohort_metrics(cohort, em_df, dd_df), errors
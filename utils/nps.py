@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+from utils.program import guests_of_type
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+PROMOTER_MIN = 9      #Promotores: 9-10
+DETRACTOR_MAX = 6     #Detractores: 0-6 (el resto son pasivos)
+SCORES = list(range(11))     #Escala de las preguntas de recomendación (0-10)
+
+BOOTSTRAP_SAMPLES = 2000
+CONFIDENCE = 0.95
+BOOTSTRAP_SEED = 0    #Semilla fija: el intervalo no cambia entre ejecuciones de la página
+
+KEYS = ["cohort", "audience", "question"]
+GROUPS = ["promoters", "passives", "detractors"]
+
+
+# =============================================================================
+# DATOS
+# =============================================================================
+
+def responses_long(frames: dict[str, pd.DataFrame], questions: dict[str, list[str]],
+                   guest_types: dict[str, str]) -> pd.DataFrame:
+    """
+    Respuestas de recomendación en formato largo, una fila por respuesta.
+
+    Args:
+        frames: Respuestas de cada cohorte (cohorte -> DataFrame)
+        questions: Preguntas de cada tipo de invitado (audiencia -> campos)
+        guest_types: Guest_type de cada audiencia (p.ej. {"EMs": "EM"})
+
+    Returns:
+        DataFrame con cohort, audience, question y score (sin respuestas
+        vacías). Las preguntas que no existen en una cohorte se ignoran.
+    """
+    parts = []
+    for cohort, df in frames.items():
+        for audience, fields in questions.items():
+            df_guest = guests_of_type(df, guest_types[audience])
+            present = [field for field in fields if field in df_guest.columns]
+            if df_guest.empty or not present:
+                continue
+            part = df_guest[present].melt(var_name="question", value_name="score")
+            parts.append(part.assign(cohort=cohort, audience=audience))
+
+    if not parts:
+        return pd.DataFrame({key: pd.Series(dtype=object) for key in KEYS} | {"score": pd.Series(dtype=float)})
+
+    responses = pd.concat(parts, ignore_index=True)[KEYS + ["score"]]
+    responses["score"] = pd.to_numeric(responses["score"], errors="coerce")
+    return responses.dropna(subset=["score"])
+
+
+# =============================================================================
+# MÉTRICAS
+# =============================================================================
+
+def score_groups(scores: pd.Series) -> np.ndarray:
+    """Grupo de cada respuesta: promoters, passives o detractors"""
+    return np.select(
+        [scores >= PROMOTER_MIN, scores.between(0, DETRACTOR_MAX)],
+        ["promoters", "detractors"],
+        default="passives"
+    )
+
+
+def bootstrap_nps(counts: pd.DataFrame, samples: int = BOOTSTRAP_SAMPLES, confidence: float = CONFIDENCE,
+                  seed: int = BOOTSTRAP_SEED) -> pd.DataFrame:
+    """
+    Intervalo de confianza bootstrap del NPS de cada grupo.
+
+    Remuestrear las n respuestas de un grupo con reemplazo equivale a sacar
+    los recuentos de promotores/pasivos/detractores de una multinomial con
+    las proporciones observadas, así que todas las muestras de todos los
+    grupos salen de una sola llamada.
+
+    Args:
+        counts: Recuentos por grupo (columnas n, promoters, passives, detractors)
+
+    Returns:
+        DataFrame con nps_low y nps_high, con el mismo índice que counts
+    """
+    if counts.empty:
+        return pd.DataFrame(columns=["nps_low", "nps_high"], index=counts.index, dtype=float)
+
+    n = counts["n"].to_numpy()
+    proportions = counts[GROUPS].to_numpy() / n[:, None]
+    draws = np.random.default_rng(seed).multinomial(n, proportions, size=(samples, len(n)))
+    nps = (draws[..., 0] - draws[..., 2]) / n * 100
+
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(nps, [alpha, 1 - alpha], axis=0)
+    return pd.DataFrame({"nps_low": low, "nps_high": high}, index=counts.index)
+
+
+def nps_table(responses: pd.DataFrame, samples: int = BOOTSTRAP_SAMPLES, confidence: float = CONFIDENCE) -> pd.DataFrame:
+    """
+    NPS de todas las combinaciones cohorte × audiencia × pregunta a la vez.
+
+    Args:
+        responses: Respuestas en formato largo (responses_long)
+
+    Returns:
+        DataFrame indexado por (cohort, audience, question) con n, promoters,
+        passives, detractors, nps y su intervalo de confianza bootstrap
+        (nps_low, nps_high)
+    """
+    columns = ["n"] + GROUPS + ["nps", "nps_low", "nps_high"]
+    if responses.empty:
+        return pd.DataFrame(columns=columns, index=pd.MultiIndex.from_arrays([[]] * len(KEYS), names=KEYS), dtype=float)
+
+    counts = (
+        responses.groupby(KEYS + [score_groups(responses["score"])], observed=True).size()
+        .unstack(fill_value=0)
+        .reindex(columns=GROUPS, fill_value=0)
+    )
+    counts.insert(0, "n", counts.sum(axis=1))
+    counts["nps"] = (counts["promoters"] - counts["detractors"]) / counts["n"] * 100
+    return counts.join(bootstrap_nps(counts, samples, confidence))[columns]
+
+
+def score_distribution(responses: pd.DataFrame) -> pd.DataFrame:
+    """
+    Histograma de las respuestas de cada cohorte × audiencia × pregunta.
+
+    Returns:
+        DataFrame indexado por (cohort, audience, question) con una columna
+        por puntuación de 0 a 10 (número de respuestas)
+    """
+    if responses.empty:
+        return pd.DataFrame(columns=SCORES, index=pd.MultiIndex.from_arrays([[]] * len(KEYS), names=KEYS), dtype=int)
+
+    scores = responses["score"].round().astype(int).rename("score")
+    return (
+        responses[KEYS].assign(score=scores).groupby(KEYS + ["score"], observed=True).size()
+        .unstack(fill_value=0)
+        .reindex(columns=SCORES, fill_value=0)
+    )
@@ -0,0 +1,260 @@
+import numpy as np
+import pandas as pd
+
+from utils.cohorts import FIELDS
+from utils.founders import normalize_name, normalize_names
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+METRIC_COLS = ["media_individual", "media_equipo", "media_business"]
+
+# Etiquetas de la cascada de clasificación, en orden de prioridad
+PROFILE_LABELS = [
+    "Strategic profile (high in individual, team and business)",
+    "Solid founder and team, weak business",
+    "Individual talent wasted by team or business",
+    "Strong team, weak business",
+    "Weak founder in a strong project",
+    "High risk (person/team/business below average)",
+    "Promising profile (high in at least one metric)",
+]
+DEFAULT_PROFILE = "Nothing to highlight"
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def metricas_agrupadas(df_to_check, columns_list, field_to_group_by, mean_field_name):
+    """
+    Calcula la media de las columnas especificadas y agrupa por un campo.
+    
+    Args:
+        df_to_check: DataFrame con los datos
+        columns_list: Lista de columnas a promediar
+        field_to_group_by: Campo por el cual agrupar
+        mean_field_name: Nombre de la columna de media resultante
+    
+    Returns:
+        DataFrame con el campo de agrupación y la media calculada
+    """
+    if not columns_list:
+        return pd.DataFrame(columns=[field_to_group_by, mean_field_name])
+    
+    # Calcular media por fila (las puntuaciones ya llegan como float32 de la carga)
+    df_to_check[mean_field_name] = df_to_check[columns_list].mean(axis=1)
+    
+    # Agrupar si el campo existe
+    if field_to_group_by in df_to_check.columns:
+        df_output = df_to_check.groupby(field_to_group_by, as_index=False, observed=True)[mean_field_name].mean()
+    else:
+        df_output = pd.DataFrame(columns=[field_to_group_by, mean_field_name])
+    
+    return df_output
+
+
+def add_combined_scores(dd_df: pd.DataFrame, fields: dict[str, list[str]] = FIELDS) -> pd.DataFrame:
+    """Añade Openness y Purpose como media de sus columnas de origen (vacías si no existen)"""
+    for name, source_cols in (("Openness", fields["openness_sources"]), ("Purpose", fields["purpose_sources"])):
+        present = [c for c in source_cols if c in dd_df.columns]
+        if present:
+            dd_df[name] = dd_df[present].mean(axis=1)
+        else:
+            dd_df[name] = pd.Series(dtype=float)
+    return dd_df
+
+
+# =============================================================================
+# MÉTRICAS POR FOUNDER
+# =============================================================================
+
+def founder_metrics(em_df: pd.DataFrame, dd_df: pd.DataFrame, startup_founders: dict[str, list[str]],
+                    fields: dict[str, list[str]] = FIELDS) -> pd.DataFrame:
+    """
+    Medias individual, de equipo y de business de cada founder de una cohorte.
+
+    Args:
+        em_df: Feedback de los EM's (risk/reward) de la cohorte
+        dd_df: Feedback del equipo (forms) de la cohorte
+        startup_founders: Roster startup -> founders
+        fields: Campos de la cohorte (registro de cohortes)
+
+    Returns:
+        DataFrame con Name, Name_norm, Startup y las columnas de METRIC_COLS.
+        Incluye todos los nombres del feedback (también los que no están en
+        el roster, que quedan sin Startup).
+    """
+    em_df = em_df.copy()
+    dd_df = add_combined_scores(dd_df.copy(), fields)
+
+    if "Founder_str" in dd_df.columns and "Name" not in dd_df.columns:
+        dd_df = dd_df.rename(columns={"Founder_str": "Name"})
+    elif "Name" not in dd_df.columns:
+        dd_df["Name"] = None
+
+    df_people = pd.DataFrame(
+        [(normalize_name(person), company) for company, people in startup_founders.items() for person in people],
+        columns=["Name_norm", "Startup"]
+    ).drop_duplicates(subset="Name_norm", keep="last")
+
+    # 1. Métricas individuales
+    individual_cols = [c for c in fields["individual"] if c in dd_df.columns]
+    df_final = metricas_agrupadas(dd_df, individual_cols, "Name", "media_individual")
+    df_final["Name_norm"] = normalize_names(df_final["Name"])
+    df_final = df_final.merge(df_people, on="Name_norm", how="left")
+
+    # 2. Métricas de equipo
+    team_cols = [c for c in fields["team"] if c in dd_df.columns]
+    df_team = metricas_agrupadas(dd_df, team_cols, "Startup", "media_equipo")
+    if not df_team.empty:
+        df_final = df_final.merge(df_team, on="Startup", how="left")
+
+    # 3. Métricas de business (risk/reward de los EM's + workstations)
+    risk_reward_cols = [c for c in fields["risk_scores"] + fields["reward_scores"] if c in em_df.columns]
+    df_business_rr = metricas_agrupadas(em_df, risk_reward_cols, "Startup", "media_risk_reward")
+    workstations_cols = [c for c in fields["workstations"] if c in dd_df.columns]
+    df_business_ws = metricas_agrupadas(dd_df, workstations_cols, "Startup", "media_workstations")
+
+    df_business = pd.merge(df_business_rr, df_business_ws, on="Startup", how="outer")
+    business_cols = [col for col in ["media_risk_reward", "media_workstations"] if col in df_business.columns]
+    if business_cols and not df_business.empty:
+        df_business["media_business"] = df_business[business_cols].mean(axis=1)
+        df_final = df_final.merge(df_business[["Startup", "media_business"]], on="Startup", how="left")
+
+    for metric in METRIC_COLS:
+        if metric not in df_final.columns:
+            df_final[metric] = np.nan
+    return df_final
+
+
+# =============================================================================
+# Z-SCORES
+# =============================================================================
+
+def add_zscores(df: pd.DataFrame, metric_cols: list[str], group_by: str | None = None, prefix: str = "z_") -> pd.DataFrame:
+    """
+    Añade la puntuación z de cada métrica (columna `prefix + métrica`).
+
+    Con `group_by` la media y la desviación se calculan dentro de cada grupo
+    (p.ej. cohorte) con un único transform por métrica. Si la desviación es
+    0 la z vale 0; si la métrica no existe, la columna z queda vacía.
+
+    Args:
+        df: DataFrame con una fila por founder (o startup)
+        metric_cols: Columnas de medias sobre las que calcular la z
+        group_by: Columna de agrupación opcional
+        prefix: Prefijo de las columnas z
+
+    Returns:
+        El mismo DataFrame con las columnas z añadidas
+    """
+    for metric in metric_cols:
+        z_col = f"{prefix}{metric}"
+        if metric not in df.columns:
+            df[z_col] = None
+            continue
+
+        values = pd.to_numeric(df[metric], errors="coerce")
+        if group_by is None:
+            mu, sigma = values.mean(), values.std()
+        else:
+            grouped = values.groupby(df[group_by], observed=True)
+            mu, sigma = grouped.transform("mean"), grouped.transform("std")
+
+        z = (values - mu) / sigma
+        if group_by is None:
+            df[z_col] = z if sigma > 0 else 0
+        else:
+            df[z_col] = z.where(sigma > 0, 0.0)
+    return df
+
+
+# =============================================================================
+# CLASIFICACIÓN DE PERFILES
+# =============================================================================
+
+def classify_profiles(z_individual, z_team, z_business, threshold: float, labels: list[str] = PROFILE_LABELS,
+                      default: str = DEFAULT_PROFILE) -> np.ndarray:
+    """
+    Clasifica todos los perfiles de una vez a partir de sus puntuaciones z.
+
+    Misma cascada que la clasificación fila a fila: se construyen las
+    máscaras alto/bajo de cada métrica y np.select se queda con la primera
+    regla que se cumple. Los NaN no cuentan ni como alto ni como bajo.
+
+    Args:
+        z_individual, z_team, z_business: Series o arrays con las z
+        threshold: Umbral para considerar valores altos/bajos
+        labels: Las 7 etiquetas de la cascada, en orden de prioridad
+
+    Returns:
+        Array con la etiqueta de cada fila
+    """
+    zi, zt, zb = (pd.to_numeric(pd.Series(z), errors="coerce").to_numpy(dtype=float)
+                  for z in (z_individual, z_team, z_business))
+
+    hi_i, lo_i = zi >= threshold, zi <= -threshold
+    hi_t, lo_t = zt >= threshold, zt <= -threshold
+    hi_b, lo_b = zb >= threshold, zb <= -threshold
+
+    conditions = [
+        hi_i & hi_t & hi_b,
+        hi_i & hi_t & ~hi_b & ~lo_b,
+        hi_i & (lo_t | lo_b),
+        hi_t & lo_i & ~lo_b,
+        hi_b & (lo_i | lo_t),
+        (lo_i & lo_t) | (lo_i & lo_b) | (lo_t & lo_b),
+        hi_i | hi_t | hi_b,
+    ]
+    return np.select(conditions, labels, default=default)
+
+
+# =============================================================================
+# ANÁLISIS ENTRE COHORTES
+# =============================================================================
+
+def cross_cohort_outliers(founder_tables: dict[str, pd.DataFrame], threshold: float) -> pd.DataFrame:
+    """
+    Tabla larga con todos los founders de todas las cohortes y sus z.
+
+    Parte de la tabla de founders de cada cohorte (utils.metrics) y en una
+    sola pasada de transforms agrupados sobre la tabla larga calcula:
+    - z_media_*: z dentro de su cohorte (igual que en la página de cada cohorte)
+    - z_pool_media_*: z frente a toda la población histórica
+    - pct_media_*: percentil de la media en toda la población
+
+    Como en la página de Outliers, las z y los percentiles se calculan sobre
+    todos los founders del feedback, antes de quedarse solo con los del
+    roster (columna in_roster), así que la z global y el percentil de un
+    founder se refieren a la misma población.
+
+    Args:
+        founder_tables: Cohorte -> tabla de founders de la cohorte
+        threshold: Umbral de las clasificaciones de perfil
+
+    Returns:
+        DataFrame con Cohort, Name, Name_norm, Startup, medias, z, percentiles
+        y los perfiles por cohorte (Perfil_exec) y globales (Perfil_pool)
+    """
+    frames = [founders.assign(Cohort=cohort) for cohort, founders in founder_tables.items()]
+    if not frames:
+        return pd.DataFrame(columns=["Cohort", "Name", "Name_norm", "Startup", *METRIC_COLS])
+
+    df_long = pd.concat(frames, ignore_index=True)
+    df_long = add_zscores(df_long, METRIC_COLS, group_by="Cohort")
+    df_long = add_zscores(df_long, METRIC_COLS, prefix="z_pool_")
+    for metric in METRIC_COLS:
+        df_long[f"pct_{metric}"] = df_long[metric].rank(pct=True)
+
+    # Solo founders del roster de su cohorte
+    df_long = df_long[df_long["in_roster"]].reset_index(drop=True)
+
+    df_long["Perfil_exec"] = classify_profiles(
+        df_long["z_media_individual"], df_long["z_media_equipo"], df_long["z_media_business"], threshold
+    )
+    df_long["Perfil_pool"] = classify_profiles(
+        df_long["z_pool_media_individual"], df_long["z_pool_media_equipo"], df_long["z_pool_media_business"], threshold
+    )
+    return df_long
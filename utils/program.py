@@ -0,0 +1,129 @@
+import tomllib
+from pathlib import Path
+
+import pandas as pd
+
+from utils.airtable import load_views
+from utils.ingest import option_column
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+AIRTABLE_SECTION = "airtable_program"     #Sección de secrets.toml con la tabla de feedback del programa
+TABLE_KEY = "table_id"
+
+PROGRAM_PATH = Path(__file__).resolve().parent.parent / "config" / "program.toml"
+
+PHASES = ["Breathe", "Focus", "Grow"]
+AGENDA_CATEGORIES = ["Talks", "Well-being", "Networking", "Investment"]
+
+
+# =============================================================================
+# REGISTRO DE ENCUESTAS
+# =============================================================================
+
+def load_program_config(path: Path = PROGRAM_PATH) -> dict[str, dict]:
+    """
+    Lee las encuestas del programa de cada cohorte (config/program.toml).
+
+    Returns:
+        Diccionario vista -> cohorte con compare_to (o None), guests y
+        agenda. rescale = "all" se resuelve a todos los campos de guests y
+        en agenda se añade la fase "General", que junta cada categoría de
+        todas las fases.
+    """
+    with open(path, "rb") as f:
+        config = tomllib.load(f)
+
+    programs = {}
+    for view, cohort in config.get("cohorts", {}).items():
+        guests = cohort.get("guests", {})
+        if guests.get("rescale") == "all":
+            guests["rescale"] = list(dict.fromkeys(
+                field for audience in guests.get("fields", {}).values() for field in audience
+            ))
+
+        agenda = cohort.get("agenda", {})
+        for key in ("fields", "labels"):
+            phases = agenda.setdefault(key, {})
+            phases["General"] = {
+                category: [item for phase in PHASES for item in phases.get(phase, {}).get(category, [])]
+                for category in AGENDA_CATEGORIES
+            }
+        programs[view] = {
+            "compare_to": cohort.get("compare_to"),
+            "guests": guests,
+            "agenda": agenda,
+        }
+    return programs
+
+
+PROGRAMS = load_program_config()
+
+# Campos de puntuación de todas las encuestas
+SCORE_FIELDS = list(dict.fromkeys(
+    [field for program in PROGRAMS.values() for audience in program["guests"].get("fields", {}).values() for field in audience]
+    + [field for program in PROGRAMS.values() for categories in program["agenda"]["fields"].values()
+       for category in categories.values() for field in category]
+    + [field for program in PROGRAMS.values() for phase in program["agenda"].get("general_fields", {}).values() for field in phase]
+))
+
+# Esquema de la tabla del programa (ver utils.ingest.apply_schema): se aplica una vez al cargar las vistas
+SCHEMAS = {
+    TABLE_KEY: {
+        **dict.fromkeys(SCORE_FIELDS, "float32"),
+        "Guest_type": "multiselect",
+    },
+}
+
+
+# =============================================================================
+# CARGA DE DATOS
+# =============================================================================
+
+def load_program_views(cohorts: list[str]) -> tuple[dict[str, pd.DataFrame], dict[str, Exception]]:
+    """
+    Carga (en paralelo) el feedback del programa de varias cohortes.
+
+    Guests feedback y Breathe-Focus-Grow leen la misma vista, así que una
+    cohorte se descarga una sola vez aunque aparezca en varias páginas o como
+    cohorte de comparación de otra. La limpieza (valores especiales a NaN y
+    tipos de SCHEMAS) se hace al ingerir los registros (utils.ingest).
+
+    Returns:
+        Tupla (frames, errores) con la cohorte como clave. Las vistas que
+        fallan quedan como DataFrame vacío.
+    """
+    views = {cohort: (TABLE_KEY, cohort) for cohort in dict.fromkeys(cohorts)}
+    return load_views(AIRTABLE_SECTION, views, schemas=SCHEMAS)
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def rescale_scores(df: pd.DataFrame, fields: list[str]) -> pd.DataFrame:
+    """
+    Pasa los campos de la escala 0-10 a la escala 1-4 (los que no existen se
+    ignoran). Los campos ya llegan como float32 de la ingesta: es una sola
+    operación sobre el bloque de columnas.
+    """
+    present = [field for field in fields if field in df.columns]
+    if present:
+        df[present] = df[present] / 10 * 3 + 1
+    return df
+
+
+def guests_of_type(df: pd.DataFrame, type_name: str) -> pd.DataFrame:
+    """
+    Respuestas de un tipo de invitado ("Startup", "EM", "VC"); vacío si no hay
+    Guest_type. Filtra con la columna indicadora que se crea al cargar la
+    vista (Guest_type es multiselect en SCHEMAS), sin recorrer las filas.
+    """
+    if df.empty or "Guest_type" not in df.columns:
+        return pd.DataFrame()
+    column = option_column("Guest_type", type_name)
+    if column not in df.columns:
+        return df.iloc[0:0]
+    return df[df[column]]
@@ -0,0 +1,117 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+import pandas as pd
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+# El orden marca la prioridad: si un texto menciona varias regiones gana la primera
+REGION_KEYWORDS = {
+    "Europe": [
+        'spain', 'espana', 'uk', 'united kingdom', 'england', 'london',
+        'germany', 'france', 'italy', 'portugal', 'greece', 'poland', 'lithuania',
+        'ukraine', 'estonia', 'hungary', 'netherlands', 'holand', 'holanda', 'holland', 'ireland',
+        'norway', 'sweden', 'finland', 'denmark', 'switzerland', 'europe',
+        'baltics', 'nordics', 'slovakia', 'eslovaquia', 'barcelona', 'czech',
+        'romania', 'belgium', 'austria', 'luxembourg', 'turkey', 'turkiye', 'czechia',
+        # Gentilicios que no se forman añadiendo una terminación (ver DERIVED_ENDINGS)
+        'spanish', 'german', 'french', 'italian', 'portuguese', 'greek', 'ukrainian', 'hungarian',
+        'dutch', 'irish', 'norwegian', 'swedish', 'finnish', 'danish', 'swiss', 'belgian', 'turkish'
+    ],
+    "Americas": [
+        'united states', 'usa', 'us', 'america', 'americas', 'mexico', 'brazil', 'brasil',
+        'argentina', 'colombia', 'chile', 'panama', 'cayman', 'uruguay',
+        'guatemala', 'peru', 'ecuador', 'canada', 'latam', 'latin america',
+        'washington', 'kentucky', 'porto alegre', 'sao paulo', 'costa rica',
+        'bolivia', 'venezuela', 'mclean', 'ny', 'sf',
+        'mexican', 'canadian', 'peruvian', 'argentinian', 'argentine', 'panamanian'
+    ],
+}
+
+DEFAULT_REGION = "Other"
+SHORT_KEYWORD_LEN = 3     #Palabras clave cortas y ambiguas (us, uk, ny, sf, usa): solo encajan como palabra completa
+DERIVED_ENDINGS = ["n", "an", "ian", "no", "na", "ano", "ana", "o", "a"]     #european, brazilian, colombians, chileno, europea...
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def fold_text(text: str) -> str:
+    """Minúsculas y sin acentos ("España" -> "espana", "Türkiye" -> "turkiye")"""
+    decomposed = unicodedata.normalize("NFKD", str(text).lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _compile_regions(regions: dict[str, list[str]]) -> re.Pattern:
+    """
+    Una sola expresión regular con un grupo por región.
+
+    Las palabras clave encajan como palabras completas, así "us" no encaja
+    dentro de "australia", "ny" dentro de "company" ni "peru" dentro de
+    "perugia". Las largas admiten además una de las DERIVED_ENDINGS (y su
+    plural), para que "europe" encaje en "European Union" y "brazil" en
+    "Brazilians"; las cortas (SHORT_KEYWORD_LEN) no. Las más largas van
+    primero para que "latin america" gane a "america".
+    """
+    derived = f"(?:(?:{'|'.join(DERIVED_ENDINGS)})s?)?"
+    groups = []
+    for i, keywords in enumerate(regions.values()):
+        alternatives = sorted({fold_text(k) for k in keywords}, key=len, reverse=True)
+        patterns = [re.escape(k) + ("" if len(k) <= SHORT_KEYWORD_LEN else derived) for k in alternatives]
+        groups.append(f"(?P<r{i}>{'|'.join(patterns)})")
+    return re.compile(rf"\b(?:{'|'.join(groups)})\b")
+
+
+_REGION_NAMES = list(REGION_KEYWORDS)
+_REGION_PATTERN = _compile_regions(REGION_KEYWORDS)
+
+
+def location_text(value) -> str | None:
+    """Texto de una celda de ubicación de Airtable (las listas se unen); None si está vacía"""
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return None
+        return " ".join(str(item) for item in value)
+    if hasattr(value, "__array__") and not isinstance(value, str):
+        return location_text(list(value))
+    if pd.isna(value):
+        return None
+    return str(value)
+
+
+# =============================================================================
+# CLASIFICACIÓN
+# =============================================================================
+
+@lru_cache(maxsize=4096)
+def classify_location(text: str) -> str:
+    """
+    Región de un texto de ubicación según REGION_KEYWORDS.
+
+    Se memoiza por texto: en el dealflow se repiten mucho los mismos países.
+    """
+    found = {int(match.lastgroup[1:]) for match in _REGION_PATTERN.finditer(fold_text(text))}
+    return _REGION_NAMES[min(found)] if found else DEFAULT_REGION
+
+
+def classify_locations(values: pd.Series) -> pd.Series:
+    """
+    Clasifica una columna de ubicaciones de una pasada.
+
+    Cada texto distinto se clasifica una sola vez. Las celdas vacías quedan
+    como None y no cuentan en ninguna región.
+    """
+    texts = values.map(location_text)
+    unique = texts.dropna().unique()
+    regions = {text: classify_location(text) for text in unique}
+    return texts.map(regions).astype(object).where(texts.notna(), None)
+
+
+def region_counts(values: pd.Series) -> dict[str, int]:
+    """Número de registros por región (incluida DEFAULT_REGION), ignorando celdas vacías"""
+    counts = classify_locations(values).value_counts()
+    return {region: int(counts.get(region, 0)) for region in [*_REGION_NAMES, DEFAULT_REGION]}
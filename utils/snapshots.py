@@ -0,0 +1,141 @@
+import json
+import logging
+import math
+import os
+import re
+import time
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from utils.ingest import is_special_value
+
+# =============================================================================
+# CONFIGURACIÓN
+# =============================================================================
+
+DEFAULT_SNAPSHOT_DIR = Path(__file__).resolve().parent.parent / ".snapshots"
+
+logger = logging.getLogger(__name__)
+
+
+def _snapshot_config() -> dict:
+    """Lee la sección [snapshots] de secrets.toml (vacía si no existe)"""
+    try:
+        return dict(st.secrets["snapshots"])
+    except Exception:
+        return {}
+
+
+_config = _snapshot_config()
+
+SNAPSHOT_DIR = Path(_config.get("dir", DEFAULT_SNAPSHOT_DIR))
+
+# En modo offline las páginas se sirven solo desde los snapshots, sin llamar a Airtable
+OFFLINE = bool(_config.get("offline", False)) or os.environ.get("DASHBOARD_OFFLINE", "") in ("1", "true", "True")
+
+
+# =============================================================================
+# FUNCIONES AUXILIARES
+# =============================================================================
+
+def _slug(value: str) -> str:
+    """Convierte un nombre de vista en un nombre de fichero seguro"""
+    return re.sub(r"[^A-Za-z0-9._-]+", "_", value).strip("_") or "_"
+
+
+def _is_missing(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _needs_json(column: pd.Series) -> bool:
+    """Parquet no admite columnas con listas, dicts o tipos mezclados: esas van como JSON"""
+    if column.dtype != object:
+        return False
+    return any(not isinstance(v, str) for v in column if not _is_missing(v))
+
+
+def _decode_json(value):
+    """Valor de una columna JSON del snapshot (los vacíos y valores especiales de Airtable a NaN)"""
+    if not isinstance(value, str):
+        return float("nan")
+    decoded = json.loads(value)
+    return float("nan") if is_special_value(decoded) else decoded
+
+
+def snapshot_paths(base_id: str, table_id: str, view: str) -> tuple[Path, Path]:
+    """Devuelve las rutas (datos .parquet, metadatos .json) del snapshot de una vista"""
+    folder = SNAPSHOT_DIR / _slug(base_id) / _slug(table_id)
+    name = _slug(view)
+    return folder / f"{name}.parquet", folder / f"{name}.json"
+
+
+# =============================================================================
+# LECTURA Y ESCRITURA
+# =============================================================================
+
+def write_snapshot(df: pd.DataFrame, base_id: str, table_id: str, view: str, **extra_meta) -> None:
+    """
+    Guarda una vista en disco en formato columnar (Parquet).
+
+    Las columnas con valores anidados de Airtable (adjuntos, multiselect)
+    se serializan a JSON y se listan en los metadatos
+    para recuperarlas tal cual al leer. La escritura es atómica.
+    """
+    data_path, meta_path = snapshot_paths(base_id, table_id, view)
+    data_path.parent.mkdir(parents=True, exist_ok=True)
+
+    json_columns = [col for col in df.columns if _needs_json(df[col])]
+    storable = df.copy()
+    for col in json_columns:
+        storable[col] = storable[col].map(lambda v: None if _is_missing(v) else json.dumps(v))
+    storable.columns = [str(col) for col in storable.columns]
+
+    meta = {
+        "base_id": base_id,
+        "table_id": table_id,
+        "view": view,
+        "fetched_at": time.time(),
+        "rows": len(df),
+        "json_columns": json_columns,
+        **extra_meta,
+    }
+
+    tmp_data = data_path.with_suffix(".parquet.tmp")
+    tmp_meta = meta_path.with_suffix(".json.tmp")
+    storable.to_parquet(tmp_data)
+    tmp_meta.write_text(json.dumps(meta), encoding="utf-8")
+    os.replace(tmp_data, data_path)
+    os.replace(tmp_meta, meta_path)
+
+
+def read_snapshot(base_id: str, table_id: str, view: str) -> tuple[pd.DataFrame, dict] | None:
+    """
+    Lee el snapshot de una vista.
+
+    Returns:
+        Tupla (DataFrame, metadatos) o None si no hay snapshot o está corrupto
+    """
+    data_path, meta_path = snapshot_paths(base_id, table_id, view)
+    if not data_path.exists() or not meta_path.exists():
+        return None
+
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        df = pd.read_parquet(data_path)
+    except Exception as e:
+        logger.warning("Snapshot ilegible en %s: %s", data_path, e)
+        return None
+
+    # Los snapshots anteriores a utils.ingest pueden traer {"specialValue": ...}: pasan a NaN al decodificar
+    for col in meta.get("json_columns", []):
+        if col in df.columns:
+            df[col] = df[col].map(_decode_json).astype(object)
+
+    return df, meta
+
+
+def snapshot_age(meta: dict) -> float:
+    """Segundos transcurridos desde que se descargó el snapshot"""
+    return time.time() - float(meta.get("fetched_at", 0))